@@ -0,0 +1,67 @@
+import random
+import sys
+import time
+import uuid
+from typing import Callable, List, Tuple
+
+from src.order.domain import Order
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def rows(count: int) -> Tuple[List[float], List[str]]:
+    rng = random.Random(42)
+    customer_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(count)]
+    totals = [rng.randrange(1, 10_000_000) / 100 for _ in range(count)]
+    # About 1% of the rows carry an invalid total or customer id.
+    for row in rng.sample(range(count), count // 100):
+        if row % 2:
+            totals[row] = rng.choice([0.0, -5.0, 12.345])
+        else:
+            customer_ids[row] = "not-a-uuid"
+    return totals, customer_ids
+
+
+def per_row(totals: List[float], customer_ids: List[str]) -> List[int]:
+    validate = Order.validate
+    return [
+        row
+        for row, (total, customer_id) in enumerate(zip(totals, customer_ids))
+        if validate(total, customer_id).failure
+    ]
+
+
+def measure(name: str, run: Callable[[], List[int]], count: int, expected: List[int]) -> None:
+    start = time.perf_counter()
+    failed = run()
+    elapsed = time.perf_counter() - start
+    assert failed == expected
+    print(f"{name:>14}: {count / elapsed:>12,.0f} rows/s   {len(failed):,} failed rows")
+
+
+def main(count: int = 1_000_000) -> None:
+    totals, customer_ids = rows(count)
+    expected = per_row(totals, customer_ids)
+
+    measure("per row", lambda: per_row(totals, customer_ids), count, expected)
+    measure(
+        "columns",
+        lambda: Order.SCHEMA.validate_columns(totals, customer_ids, use_numpy=False).failed_rows,
+        count,
+        expected,
+    )
+    if numpy is not None:
+        total_array = numpy.array(totals)
+        measure(
+            "numpy columns",
+            lambda: Order.validate_columns(total_array, customer_ids).failed_rows,
+            count,
+            expected,
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,81 @@
+import gc
+import importlib.util
+import sys
+import time
+import tracemalloc
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from src.order.application.ports import OrderRepository
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    ColumnarOrderRepository,
+    InMemoryOrderRepository,
+)
+
+
+def build(factory, count: int, customers: list[str]) -> tuple[OrderRepository, int]:
+    gc.collect()
+    tracemalloc.start()
+    repository = factory()
+    repository.save_many(
+        Order.create(customers[position % len(customers)], 10.0).value for position in range(count)
+    )
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return repository, memory
+
+
+def sum_total_by_customer(repository: OrderRepository) -> dict:
+    if isinstance(repository, ColumnarOrderRepository):
+        return repository.sum_total_by_customer()
+
+    sums = defaultdict(float)
+    for order in repository.get_all().value:
+        if not order.is_deleted:
+            sums[order.customer_id] += order.total
+    return sums
+
+
+def count_between(repository: OrderRepository, start: datetime, end: datetime) -> int:
+    if isinstance(repository, ColumnarOrderRepository):
+        return repository.count_between(start, end)
+
+    return sum(
+        1
+        for order in repository.get_all().value
+        if start <= order.created_at < end and not order.is_deleted
+    )
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(count: int = 200_000) -> None:
+    customers = [str(uuid.uuid4()) for _ in range(1_000)]
+    end = datetime.now()
+    start = end - timedelta(hours=1)
+
+    candidates = [
+        ("dict of Order objects", InMemoryOrderRepository),
+        ("columnar (pure Python)", lambda: ColumnarOrderRepository(use_numpy=False)),
+    ]
+    if importlib.util.find_spec("numpy") is not None:
+        candidates.append(("columnar (NumPy)", ColumnarOrderRepository))
+
+    for name, factory in candidates:
+        repository, memory = build(factory, count, customers)
+        print(
+            f"{name:<24} memory: {memory / count:>6.0f} B/order   "
+            f"sum_total_by_customer: {timed(sum_total_by_customer, repository) * 1000:>8.1f} ms   "
+            f"count_between: {timed(count_between, repository, start, end) * 1000:>8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,59 @@
+import sys
+import threading
+import time
+import uuid
+
+from src.order.domain import Order
+from src.order.infrastructure.repositories import StripedInMemoryOrderRepository
+
+THREAD_COUNTS = (1, 4, 16)
+
+
+def worker(repository: StripedInMemoryOrderRepository, orders: list[Order], barrier) -> None:
+    barrier.wait()
+    for position, order in enumerate(orders):
+        repository.save(order)
+        repository.get_by_id(orders[position // 2].id)
+        if position % 1000 == 0:
+            repository.get_all()
+
+
+def run(shards: int, threads: int, operations: int) -> float:
+    repository = StripedInMemoryOrderRepository(shards=shards)
+    per_thread = operations // threads
+    batches = [
+        [Order.create(str(uuid.uuid4()), 100.0).value for _ in range(per_thread)]
+        for _ in range(threads)
+    ]
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=worker, args=(repository, batch, barrier)) for batch in batches
+    ]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    assert repository.count() == per_thread * threads
+    return per_thread * threads / elapsed
+
+
+def main(operations: int = 200_000) -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    for threads in THREAD_COUNTS:
+        single_lock = run(1, threads, operations)
+        striped = run(16, threads, operations)
+        print(
+            f"{threads:>3} threads   1 shard: {single_lock:>12,.0f} saves/s   "
+            f"16 shards: {striped:>12,.0f} saves/s"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,47 @@
+import random
+import sys
+import time
+import uuid
+from typing import List
+
+from src.order.domain import Order
+from src.shared.domain.core import Money
+from src.shared.domain.validation.rules import CurrencyRule
+
+
+def values(count: int) -> dict[str, List[object]]:
+    rng = random.Random(42)
+    cents = [rng.randrange(1, 10_000_000) for _ in range(count)]
+    return {
+        "float": [amount / 100 for amount in cents],
+        "int": [amount // 100 + 1 for amount in cents],
+        "money": [Money(amount) for amount in cents],
+    }
+
+
+def validate(rule: CurrencyRule, batch: List[object]) -> float:
+    start = time.perf_counter()
+    for value in batch:
+        assert rule.validate(value, "total") is None
+    return len(batch) / (time.perf_counter() - start)
+
+
+def create_orders(batch: List[object]) -> float:
+    customer_id = str(uuid.uuid4())
+    start = time.perf_counter()
+    for value in batch:
+        Order.create(customer_id, value)
+    return len(batch) / (time.perf_counter() - start)
+
+
+def main(count: int = 500_000) -> None:
+    rule = CurrencyRule()
+    for name, batch in values(count).items():
+        print(
+            f"{name:>5}: CurrencyRule {validate(rule, batch):>12,.0f} values/s   "
+            f"Order.create {create_orders(batch[: count // 5]):>10,.0f} orders/s"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,62 @@
+import statistics
+import sys
+import time
+import uuid
+
+from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
+from src.shared.domain.events import DomainEvent, DomainEventHandler, DomainEventPublisher
+from src.shared.infrastructure.events import QueuedDomainEventPublisher
+
+
+class SlowHandler(DomainEventHandler):
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def handle(self, event: DomainEvent) -> None:
+        time.sleep(self.seconds)
+
+
+def run(publisher: DomainEventPublisher, events: list, handler_seconds: float) -> None:
+    publisher.subscribe("OrderCreatedEvent", SlowHandler(handler_seconds))
+    latencies = []
+    start = time.perf_counter()
+    for event in events:
+        published = time.perf_counter()
+        publisher.publish([event])
+        latencies.append(time.perf_counter() - published)
+    publish_seconds = time.perf_counter() - start
+    drain = getattr(publisher, "drain", None)
+    if drain is not None:
+        drain()
+    elapsed = time.perf_counter() - start
+
+    quantiles = [value * 1e6 for value in statistics.quantiles(latencies, n=100)]
+    name = type(publisher).__name__
+    print(
+        f"{name:>27}: publish p50 {quantiles[49]:>8,.1f} µs  p99 {quantiles[98]:>8,.1f} µs  "
+        f"{len(events) / publish_seconds:>9,.0f} publish/s  "
+        f"{len(events) / elapsed:>7,.0f} handled/s"
+    )
+
+    stats = getattr(publisher, "stats", None)
+    if stats is not None:
+        print(
+            f"{'':>27}  max queue depth {stats.max_queue_depth}, "
+            f"mean handler {stats.mean_handler_seconds * 1e3:.2f} ms, "
+            f"max handler {stats.max_handler_seconds * 1e3:.2f} ms"
+        )
+        publisher.close()
+
+
+def main(count: int = 2_000, workers: int = 16, handler_ms: float = 2.0) -> None:
+    customer_id = str(uuid.uuid4())
+    events = [OrderCreatedEvent(Order.create(customer_id, 10.0).value) for _ in range(count)]
+    handler_seconds = handler_ms / 1000
+    print(f"{count} events, handler {handler_ms} ms, {workers} workers")
+    run(DomainEventPublisher(), events, handler_seconds)
+    run(QueuedDomainEventPublisher(max_queue_size=count, workers=workers), events, handler_seconds)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import time
+import uuid
+from typing import Callable, List
+
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    InMemoryOrderRepository,
+    SqliteOrderRepository,
+)
+from src.shared.domain.core import (
+    Entity,
+    IdentityProvider,
+    UUIDv4IdentityProvider,
+    UUIDv7IdentityProvider,
+)
+
+BATCH_SIZE = 1_000
+
+
+def orders(provider: IdentityProvider, count: int) -> List[Order]:
+    Entity.configure(identity_provider=provider)
+    customer_id = uuid.uuid4()
+    return [Order(customer_id, 10.0) for _ in range(count)]
+
+
+def insert(repository, batch: List[Order]) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(batch), BATCH_SIZE):
+        repository.save_many(batch[offset : offset + BATCH_SIZE])
+    return len(batch) / (time.perf_counter() - start)
+
+
+def sqlite(directory: str, name: str) -> Callable[[List[Order]], float]:
+    def run(batch: List[Order]) -> float:
+        repository = SqliteOrderRepository(os.path.join(directory, f"{name}.sqlite3"))
+        try:
+            return insert(repository, batch)
+        finally:
+            repository.close()
+
+    return run
+
+
+def memory(batch: List[Order]) -> float:
+    return insert(InMemoryOrderRepository(), batch)
+
+
+def main(count: int = 500_000) -> None:
+    providers = {"uuid4": UUIDv4IdentityProvider(), "uuid7": UUIDv7IdentityProvider()}
+    default_provider = Entity.identity_provider
+    with tempfile.TemporaryDirectory() as directory:
+        for name, provider in providers.items():
+            batch = orders(provider, count)
+            print(
+                f"{name}: sqlite {sqlite(directory, name)(batch):>10,.0f} orders/s   "
+                f"memory {memory(batch):>10,.0f} orders/s"
+            )
+    Entity.configure(identity_provider=default_provider)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,43 @@
+import random
+import sys
+import time
+import uuid
+from typing import List
+
+from src.shared.domain.validation import MemoizedRule, ValidationRule
+from src.shared.domain.validation.rules import EmailRule, UUIDRule
+
+
+def skewed(values: List[str], count: int) -> List[str]:
+    # 90% of the requests come from the 10% most active customers.
+    rng = random.Random(42)
+    hot = values[: len(values) // 10]
+    return [rng.choice(hot) if rng.random() < 0.9 else rng.choice(values) for _ in range(count)]
+
+
+def latency(rule: ValidationRule, workload: List[str]) -> float:
+    validate = rule.validate
+    start = time.perf_counter()
+    for value in workload:
+        validate(value, "field")
+    return (time.perf_counter() - start) / len(workload) * 1e9
+
+
+def main(customers: int = 100_000, requests: int = 1_000_000, cache_size: int = 16384) -> None:
+    rng = random.Random(7)
+    ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(customers)]
+    emails = [f"customer.{index}@example.com" for index in range(customers)]
+
+    for name, rule, values in (("uuid", UUIDRule(), ids), ("email", EmailRule(), emails)):
+        workload = skewed(values, requests)
+        memoized = MemoizedRule(rule, cache_size)
+        plain = latency(rule, workload)
+        cached = latency(memoized, workload)
+        print(
+            f"{name:>5}: {plain:>6.0f} ns -> {cached:>6.0f} ns per call   "
+            f"hit rate {memoized.stats.hit_rate:.1%} with {cache_size:,} entries"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
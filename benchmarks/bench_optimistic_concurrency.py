@@ -0,0 +1,104 @@
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Callable, List
+
+from src.order.application.ports import OrderRepository
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    ColumnarOrderRepository,
+    FileOrderRepository,
+    InMemoryOrderRepository,
+    SharedMemoryOrderRepository,
+    SqliteOrderRepository,
+    StripedInMemoryOrderRepository,
+)
+from src.shared.domain.core import Money
+
+BACKENDS: dict[str, Callable[[str], OrderRepository]] = {
+    "memory": lambda directory: InMemoryOrderRepository(),
+    "striped": lambda directory: StripedInMemoryOrderRepository(shards=16),
+    "columnar": lambda directory: ColumnarOrderRepository(),
+    "file": lambda directory: FileOrderRepository(f"{directory}/orders"),
+    "shared": lambda directory: SharedMemoryOrderRepository(
+        f"orders-bench-{uuid.uuid4().hex[:12]}", capacity=2048, lock_path=f"{directory}/lock"
+    ),
+    "sqlite": lambda directory: SqliteOrderRepository(":memory:", batch_size=64),
+}
+HOT_ORDERS = (1, 16, 1024)
+
+
+def worker(
+    repository: OrderRepository, orders: List[Order], updates: int, conflicts: list, barrier
+) -> None:
+    rng = random.Random()
+    conflicted = 0
+    barrier.wait()
+    for _ in range(updates):
+        order_id = rng.choice(orders).id
+        while True:
+            order = repository.get_by_id(order_id).value
+            version = order.version
+            order.update_total(order.total + Money.of(1))
+            if repository.save(order, expected_version=version).success:
+                break
+            conflicted += 1
+    conflicts.append(conflicted)
+
+
+def run(backend: str, hot_orders: int, threads: int, updates: int) -> tuple[float, float]:
+    directory = tempfile.mkdtemp()
+    repository = BACKENDS[backend](directory)
+    orders = [Order.create(str(uuid.uuid4()), 100.0).value for _ in range(hot_orders)]
+    repository.save_many(orders)
+    per_thread = updates // threads
+    conflicts: list[int] = []
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=worker, args=(repository, orders, per_thread, conflicts, barrier))
+        for _ in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    committed = per_thread * threads
+    saved = repository.get_all().value
+    assert sum(order.version - 1 for order in saved) == committed
+    for name in ("close", "unlink"):
+        release = getattr(repository, name, None)
+        if release is not None:
+            release()
+    shutil.rmtree(directory)
+
+    attempts = committed + sum(conflicts)
+    return committed / elapsed, sum(conflicts) / attempts
+
+
+def main(threads: int = 8, updates: int = 40_000) -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}, "
+        f"{threads} threads"
+    )
+
+    for backend in BACKENDS:
+        for hot_orders in HOT_ORDERS:
+            throughput, conflict_rate = run(backend, hot_orders, threads, updates)
+            print(
+                f"{backend:>8} {hot_orders:>5} hot orders: {throughput:>10,.0f} updates/s   "
+                f"conflicts {conflict_rate:>6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
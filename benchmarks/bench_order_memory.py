@@ -0,0 +1,63 @@
+import gc
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Callable, List
+
+from src.order.application.dtos import CreateOrderInput
+from src.order.application.usecases import CreateOrderUseCase
+from src.order.domain import Customer, Order
+from src.order.infrastructure.repositories import InMemoryOrderRepository
+from src.shared.domain.events import DomainEventPublisher
+
+
+def measure(build: Callable[[int], List[object]], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = build(count)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(objects) == count
+    return memory / count
+
+
+def loaded_orders(count: int) -> List[Order]:
+    now = datetime.now()
+    return [
+        Order.load(str(uuid.uuid4()), str(uuid.uuid4()), 10.0, now, now).value for _ in range(count)
+    ]
+
+
+def created_orders(count: int) -> List[Order]:
+    customer_id = str(uuid.uuid4())
+    return [Order.create(customer_id, 10.0).value for _ in range(count)]
+
+
+def saved_orders(count: int) -> List[Order]:
+    use_case = CreateOrderUseCase(InMemoryOrderRepository(), DomainEventPublisher())
+    customer_id = str(uuid.uuid4())
+    return [use_case.execute(CreateOrderInput(customer_id, 10.0)).value.order for _ in range(count)]
+
+
+def customers(count: int) -> List[Customer]:
+    return [Customer.create("Customer", "customer@example.com").value for _ in range(count)]
+
+
+def main(count: int = 100_000) -> None:
+    order = loaded_orders(1)[0]
+    print(f"Order instance: {sys.getsizeof(order)} bytes", end="")
+    if hasattr(order, "__dict__"):
+        print(f" + __dict__ {sys.getsizeof(order.__dict__)} bytes")
+    else:
+        print(" (no __dict__)")
+
+    print(f"loaded orders:  {measure(loaded_orders, count):>8,.0f} bytes/order")
+    print(f"created orders: {measure(created_orders, count):>8,.0f} bytes/order (with event)")
+    print(f"saved orders:   {measure(saved_orders, count):>8,.0f} bytes/order (events published)")
+    print(f"customers:      {measure(customers, count):>8,.0f} bytes/customer")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,67 @@
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from src.order.application.dtos import CreateOrderInput
+from src.order.application.ports import OrderRepository
+from src.order.application.usecases import CreateOrderUseCase
+from src.order.infrastructure.repositories import (
+    FileOrderRepository,
+    InMemoryOrderRepository,
+    SharedMemoryOrderRepository,
+    SqliteOrderRepository,
+)
+from src.shared.domain.events import DomainEventPublisher
+
+
+def run(name: str, repository: OrderRepository, iterations: int) -> None:
+    use_case = CreateOrderUseCase(repository, DomainEventPublisher())
+    inputs = [CreateOrderInput(str(uuid.uuid4()), 100.0) for _ in range(iterations)]
+
+    start = time.perf_counter()
+    order_ids = [use_case.execute(input).value.order.id for input in inputs]
+    if hasattr(repository, "flush"):
+        repository.flush()
+    writes = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for order_id in order_ids:
+        repository.get_by_id(order_id)
+    reads = time.perf_counter() - start
+
+    print(
+        f"{name:<28} create: {iterations / writes:>10,.0f} orders/s   "
+        f"get_by_id: {iterations / reads:>10,.0f} orders/s"
+    )
+
+
+def main(iterations: int = 20_000) -> None:
+    run("in-memory", InMemoryOrderRepository(), iterations)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for batch_size in (1, 64, 512):
+            path = str(Path(directory) / f"orders-{batch_size}.sqlite3")
+            # A single writer only fills a batch when saves do not wait for the commit.
+            repository = SqliteOrderRepository(
+                path, batch_size=batch_size, wait_for_commit=batch_size == 1
+            )
+            run(f"sqlite (batch_size={batch_size})", repository, iterations)
+            repository.close()
+
+        repository = FileOrderRepository(str(Path(directory) / "segments"))
+        run("file (log-structured)", repository, iterations)
+        repository.close()
+
+        repository = SharedMemoryOrderRepository(
+            f"orders-bench-{uuid.uuid4().hex[:8]}",
+            capacity=iterations,
+            lock_path=str(Path(directory) / "orders.lock"),
+        )
+        run("shared memory", repository, iterations)
+        repository.unlink()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,80 @@
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from typing import Callable
+
+from src.order.application.dtos import CreateOrderInput
+from src.order.application.ports import OrderRepository
+from src.order.application.usecases import CreateOrderUseCase
+from src.order.infrastructure.outbox import OutboxRelay
+from src.order.infrastructure.repositories import (
+    FileOrderRepository,
+    InMemoryOrderRepository,
+    SqliteOrderRepository,
+)
+from src.shared.domain.events import DomainEvent, DomainEventHandler, DomainEventPublisher
+
+BACKENDS: dict[str, Callable[[str, bool], OrderRepository]] = {
+    "memory": lambda directory, outbox: InMemoryOrderRepository(outbox=outbox),
+    "sqlite": lambda directory, outbox: SqliteOrderRepository(
+        f"{directory}/orders.sqlite3", outbox=outbox
+    ),
+    "file": lambda directory, outbox: FileOrderRepository(f"{directory}/orders", outbox=outbox),
+}
+
+
+class SlowHandler(DomainEventHandler):
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.handled = 0
+
+    def handle(self, event: DomainEvent) -> None:
+        time.sleep(self.seconds)
+        self.handled += 1
+
+
+def run(backend: str, outbox: bool, count: int, handler_seconds: float) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = BACKENDS[backend](directory, outbox)
+        handler = SlowHandler(handler_seconds)
+        publisher = DomainEventPublisher()
+        publisher.subscribe("OrderCreatedEvent", handler)
+        relay = OutboxRelay(repository, publisher, interval=0.01)
+        if outbox:
+            relay.start()
+        use_case = CreateOrderUseCase(repository, publisher)
+        inputs = [CreateOrderInput(str(uuid.uuid4()), 10.0) for _ in range(count)]
+
+        latencies = []
+        for input in inputs:
+            start = time.perf_counter()
+            assert use_case.execute(input).success
+            latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        relay.close()
+        drained = time.perf_counter() - start
+        assert handler.handled == count
+        close = getattr(repository, "close", None)
+        if close is not None:
+            close()
+
+    quantiles = [value * 1e6 for value in statistics.quantiles(latencies, n=100)]
+    print(
+        f"{backend:>6} {'outbox' if outbox else 'inline':>6}: "
+        f"execute p50 {quantiles[49]:>8,.1f} µs  p99 {quantiles[98]:>8,.1f} µs  "
+        f"relay backlog at exit {drained * 1000:>6,.0f} ms"
+    )
+
+
+def main(count: int = 2_000, handler_us: int = 500) -> None:
+    print(f"{count} orders, handler {handler_us} µs")
+    for backend in BACKENDS:
+        for outbox in (False, True):
+            run(backend, outbox, count, handler_us / 1e6)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,39 @@
+import sys
+import tempfile
+import time
+import uuid
+
+from src.order.domain import Order
+from src.order.infrastructure.persistence import SnapshotJournal
+from src.order.infrastructure.repositories import InMemoryOrderRepository
+
+
+def run(size: int, journal_tail: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = InMemoryOrderRepository(
+            persistence=SnapshotJournal(directory, snapshot_interval=size + journal_tail + 1)
+        )
+        repository.save_many(Order.create(str(uuid.uuid4()), 100.0).value for _ in range(size))
+        repository.snapshot()
+        for _ in range(journal_tail):
+            repository.save(Order.create(str(uuid.uuid4()), 100.0).value)
+        repository.close()
+
+        start = time.perf_counter()
+        restored = InMemoryOrderRepository(persistence=SnapshotJournal(directory))
+        elapsed = time.perf_counter() - start
+        restored.close()
+
+        print(
+            f"{size:>12,} orders + {journal_tail:>8,} journal tail   "
+            f"restart: {elapsed:>8.2f}s   ({(size + journal_tail) / elapsed:>12,.0f} orders/s)"
+        )
+
+
+def main(*sizes: int) -> None:
+    for size in sizes or (10_000, 100_000, 1_000_000):
+        run(size, size // 10)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,44 @@
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from src.order.application.ports import OrderRepository
+from src.order.domain import Order
+from src.order.infrastructure.repositories import InMemoryOrderRepository, SqliteOrderRepository
+
+
+def run(name: str, repository: OrderRepository, orders: list[Order]) -> None:
+    start = time.perf_counter()
+    for order in orders:
+        repository.save(order)
+    if hasattr(repository, "flush"):
+        repository.flush()
+    one_by_one = time.perf_counter() - start
+
+    repository.clear()
+
+    start = time.perf_counter()
+    repository.save_many(orders)
+    bulk = time.perf_counter() - start
+
+    print(
+        f"{name:<12} save: {len(orders) / one_by_one:>12,.0f} orders/s   "
+        f"save_many: {len(orders) / bulk:>12,.0f} orders/s"
+    )
+
+
+def main(count: int = 100_000) -> None:
+    orders = [Order.create(str(uuid.uuid4()), 100.0).value for _ in range(count)]
+
+    run("in-memory", InMemoryOrderRepository(), orders)
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SqliteOrderRepository(str(Path(directory) / "orders.sqlite3"))
+        run("sqlite", repository, orders)
+        repository.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
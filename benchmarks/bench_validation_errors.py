@@ -0,0 +1,52 @@
+import gc
+import sys
+import time
+import tracemalloc
+import uuid
+from typing import Callable, List
+
+from src.order.domain import Customer, Order
+
+INVALID_ORDERS = [(-1, "not-a-uuid"), (None, None), ("abc", str(uuid.uuid4())), (12.345, "x")]
+
+
+def reject(count: int) -> List[List[object]]:
+    validate = Order.validate
+    return [validate(*INVALID_ORDERS[index % 4]).errors for index in range(count)]
+
+
+def reject_and_render(count: int) -> None:
+    for index in range(count):
+        [str(error) for error in Order.validate(*INVALID_ORDERS[index % 4]).errors]
+        [str(error) for error in Customer.validate("Jo", "invalid").errors]
+
+
+def best_rate(run: Callable[[int], object], count: int, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(count)
+        timings.append(time.perf_counter() - start)
+    return count / min(timings)
+
+
+def memory_per_error(count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    errors = reject(count)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / sum(len(row) for row in errors)
+
+
+def main(count: int = 200_000) -> None:
+    rejected = best_rate(reject, count)
+    rendered = best_rate(reject_and_render, count)
+    print(f"Order.validate rejections:        {rejected:>10,.0f} calls/s")
+    print(f"rejections rendered with str():   {rendered:>10,.0f} requests/s")
+    print(f"retained memory per error:        {memory_per_error(count // 4):>10,.0f} bytes")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
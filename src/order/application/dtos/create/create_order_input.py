@@ -1,11 +1,21 @@
+from src.shared.domain.core import Money
+
+
 class CreateOrderInput:
-    def __init__(self, customer_id: str | None = None, total: float | None = None):
+    def __init__(
+        self,
+        customer_id: str | None = None,
+        total: Money | float | None = None,
+        currency: str | None = None,
+    ):
         self.customer_id = customer_id
         self.total = total
+        self.currency = currency
 
     @classmethod
     def from_dict(cls, data: dict) -> "CreateOrderInput":
         return cls(
             customer_id=data.get("customer_id") if data.get("customer_id") else None,
             total=data.get("total") if data.get("total") else None,
+            currency=data.get("currency") if data.get("currency") else None,
         )
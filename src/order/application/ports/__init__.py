@@ -1,3 +1,16 @@
+from .async_order_repository import AsyncOrderRepository
+from .order_page import OrderCursor, OrderPage
 from .order_repository import OrderRepository
+from .order_save_error import OrderSaveError
+from .order_version_conflict_error import OrderVersionConflictError
+from .outbox_message import OutboxMessage
 
-__all__ = ["OrderRepository"]
+__all__ = [
+    "AsyncOrderRepository",
+    "OrderCursor",
+    "OrderPage",
+    "OrderRepository",
+    "OrderSaveError",
+    "OrderVersionConflictError",
+    "OutboxMessage",
+]
@@ -0,0 +1,30 @@
+import uuid
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from src.order.domain import Order
+from src.shared.domain.core import Result
+
+
+class AsyncOrderRepository(ABC):
+    has_outbox = False
+
+    @abstractmethod
+    async def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        pass
+
+    @abstractmethod
+    async def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        pass
+
+    @abstractmethod
+    async def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> Result[list[Order]]:
+        pass
@@ -0,0 +1,30 @@
+import base64
+import binascii
+import uuid
+from typing import List, Optional
+
+from src.order.domain import Order
+
+
+class OrderPage:
+    def __init__(self, orders: List[Order], next_cursor: Optional[str] = None):
+        self.orders = orders
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class OrderCursor:
+    @staticmethod
+    def encode(order_id: uuid.UUID) -> str:
+        return base64.urlsafe_b64encode(order_id.bytes).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> uuid.UUID:
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            return uuid.UUID(bytes=base64.urlsafe_b64decode(cursor + padding))
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid order cursor: {cursor}") from e
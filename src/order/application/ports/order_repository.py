@@ -1,16 +1,81 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
 
+from src.order.application.ports.order_page import OrderCursor, OrderPage
+from src.order.application.ports.order_version_conflict_error import OrderVersionConflictError
+from src.order.application.ports.outbox_message import OutboxMessage
 from src.order.domain import Order
 from src.shared.domain.core import Result
 
 
 class OrderRepository(ABC):
+    DEFAULT_PAGE_SIZE = 100
+    TIME_FIELDS = ("created_at", "updated_at", "deleted_at")
+    DEFAULT_OUTBOX_BATCH_SIZE = 100
+    # Repositories with an outbox store the events recorded on every saved order in
+    # the same write as the order and clear them from it; OutboxRelay publishes them.
+    has_outbox = False
+
+    # Every successful save stores the order at its previous version + 1 and sets
+    # order.version to it. With expected_version, the save only happens if the
+    # stored version still matches (0 for an order that was never saved) and
+    # fails with OrderVersionConflictError otherwise.
     @abstractmethod
-    def save(self, order: Order) -> Result[None]:
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        pass
+
+    @abstractmethod
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
         pass
 
     @abstractmethod
     def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
         pass
+
+    @abstractmethod
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        pass
+
+    @abstractmethod
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        pass
+
+    @abstractmethod
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        pass
+
+    def page(self, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE) -> Result[OrderPage]:
+        try:
+            after_id = OrderCursor.decode(cursor) if cursor else None
+            orders = list(self.iter_orders(after_id=after_id, limit=limit + 1))
+
+            if len(orders) <= limit:
+                return Result.ok(OrderPage(orders))
+
+            orders = orders[:limit]
+            return Result.ok(OrderPage(orders, OrderCursor.encode(orders[-1].id)))
+        except Exception as e:
+            return Result.fail([e])
+
+    def pending_events(self, limit: int = DEFAULT_OUTBOX_BATCH_SIZE) -> Result[list[OutboxMessage]]:
+        return Result.ok([])
+
+    def mark_events_published(self, sequences: Iterable[int]) -> Result[None]:
+        return Result.ok()
+
+    @classmethod
+    def _check_time_field(cls, field: str) -> str:
+        if field not in cls.TIME_FIELDS:
+            raise ValueError(f"Unknown time field: {field}")
+        return field
+
+    @staticmethod
+    def _check_version(order: Order, expected_version: Optional[int], current_version: int) -> None:
+        if expected_version is not None and expected_version != current_version:
+            raise OrderVersionConflictError(order.id, expected_version, current_version)
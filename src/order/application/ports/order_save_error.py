@@ -0,0 +1,9 @@
+from typing import Any
+
+
+class OrderSaveError(Exception):
+    def __init__(self, position: int, order: Any, cause: Exception):
+        self.position = position
+        self.order_id = getattr(order, "id", None)
+        self.cause = cause
+        super().__init__(f"Failed to save order at position {position} ({self.order_id}): {cause}")
@@ -0,0 +1,11 @@
+import uuid
+
+
+class OrderVersionConflictError(Exception):
+    def __init__(self, order_id: uuid.UUID, expected_version: int, actual_version: int):
+        self.order_id = order_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"Order {order_id} is at version {actual_version}, expected {expected_version}"
+        )
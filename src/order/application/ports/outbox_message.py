@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+from src.shared.domain.events import DomainEvent
+
+
+class OutboxMessage(NamedTuple):
+    sequence: int
+    event: DomainEvent
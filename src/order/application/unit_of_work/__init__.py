@@ -0,0 +1,3 @@
+from .unit_of_work import UnitOfWork
+
+__all__ = ["UnitOfWork"]
@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from src.order.application.ports import OrderRepository
+from src.order.domain import Order
+from src.shared.domain.core import Result
+
+
+class UnitOfWork:
+    def __init__(self, repository: OrderRepository):
+        self.repository = repository
+        self.result: Optional[Result[None]] = None
+        self._orders: List[Order] = []
+
+    def register(self, order: Order) -> "UnitOfWork":
+        self._orders.append(order)
+        return self
+
+    def commit(self) -> Result[None]:
+        orders, self._orders = self._orders, []
+        self.result = self.repository.save_many(orders)
+        return self.result
+
+    def rollback(self) -> None:
+        self._orders = []
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
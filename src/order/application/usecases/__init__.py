@@ -1,3 +1,4 @@
+from .async_create_order_use_case import AsyncCreateOrderUseCase
 from .create_order_use_case import CreateOrderUseCase
 
-__all__ = ["CreateOrderUseCase"]
+__all__ = ["AsyncCreateOrderUseCase", "CreateOrderUseCase"]
@@ -0,0 +1,35 @@
+import asyncio
+
+from src.order.application.dtos import CreateOrderInput, CreateOrderOutput
+from src.order.application.ports import AsyncOrderRepository
+from src.order.domain import Order
+from src.shared.application import AsyncUseCase
+from src.shared.domain.core import Result
+from src.shared.domain.events import DomainEventPublisher
+
+
+class AsyncCreateOrderUseCase(AsyncUseCase[CreateOrderInput, CreateOrderOutput]):
+    def __init__(
+        self, repository: AsyncOrderRepository, domain_event_publisher: DomainEventPublisher
+    ):
+        self.repository = repository
+        self.domain_event_publisher = domain_event_publisher
+
+    async def execute(self, input: CreateOrderInput) -> Result[CreateOrderOutput]:
+        order = Order.create(
+            customer_id=input.customer_id, total=input.total, currency=input.currency
+        )
+        if order.failure:
+            return Result.fail(order.errors)
+
+        result = await self.repository.save(order.value)
+        if result.failure:
+            return Result.fail(result.errors)
+
+        # Repositories with an outbox already took the events; OutboxRelay publishes them.
+        # Handlers are synchronous and may block, so they run off the event loop.
+        events = order.value.pull_events()
+        if events:
+            await asyncio.to_thread(self.domain_event_publisher.publish, events)
+
+        return Result.ok(CreateOrderOutput(order.value))
@@ -1,7 +1,6 @@
 from src.order.application.dtos import CreateOrderInput, CreateOrderOutput
 from src.order.application.ports import OrderRepository
 from src.order.domain import Order
-from src.order.domain.events import OrderCreatedEvent
 from src.shared.application import UseCase
 from src.shared.domain.core import Result
 from src.shared.domain.events import DomainEventPublisher
@@ -13,7 +12,9 @@ class CreateOrderUseCase(UseCase[CreateOrderInput, CreateOrderOutput]):
         self.domain_event_publisher = domain_event_publisher
 
     def execute(self, input: CreateOrderInput) -> Result[CreateOrderOutput]:
-        order = Order.create(customer_id=input.customer_id, total=input.total)
+        order = Order.create(
+            customer_id=input.customer_id, total=input.total, currency=input.currency
+        )
         if order.failure:
             return Result.fail(order.errors)
 
@@ -21,6 +22,9 @@ class CreateOrderUseCase(UseCase[CreateOrderInput, CreateOrderOutput]):
         if result.failure:
             return Result.fail(result.errors)
 
-        self.domain_event_publisher.publish([OrderCreatedEvent(order.value)])
+        # Repositories with an outbox already took the events; OutboxRelay publishes them.
+        events = order.value.pull_events()
+        if events:
+            self.domain_event_publisher.publish(events)
 
         return Result.ok(CreateOrderOutput(order.value))
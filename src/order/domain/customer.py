@@ -3,13 +3,25 @@ from datetime import datetime
 from typing import Any, Dict, List
 
 from src.shared.domain.core import Entity, Result
-from src.shared.domain.errors import ValidationError
-from src.shared.domain.validation import Validator
+from src.shared.domain.errors import ErrorRecord
+from src.shared.domain.validation import FieldSchema, ValidationSchema
 
 
 class Customer(Entity):
+    __slots__ = ("name", "email")
+
     MIN_NAME_LENGTH = 3
 
+    CREATE_SCHEMA = ValidationSchema(
+        FieldSchema("name").required().min_length(MIN_NAME_LENGTH),
+        FieldSchema("email").required().email(),
+        bail_per_field=True,
+    )
+    UPDATE_SCHEMA = ValidationSchema(
+        FieldSchema("name").min_length(MIN_NAME_LENGTH),
+        FieldSchema("email").email(),
+    )
+
     def __init__(
         self,
         name: str,
@@ -32,25 +44,9 @@ class Customer(Entity):
         return Result.ok(cls(name=name, email=email))
 
     @staticmethod
-    def validate(name, email, creating: bool = True) -> Result[List[ValidationError] | None]:
-        validator = Validator()
-
-        name_validator = validator.field(name, "name")
-        email_validator = validator.field(email, "email")
-
-        if creating:
-            name_validator.required()
-            email_validator.required()
-
-        name_validator.min_length(3)
-        email_validator.email()
-
-        result = validator.validate()
-
-        if result.failure:
-            return Result.fail(result.errors)
-
-        return Result.ok()
+    def validate(name, email, creating: bool = True) -> Result[List[ErrorRecord] | None]:
+        schema = Customer.CREATE_SCHEMA if creating else Customer.UPDATE_SCHEMA
+        return schema.validate(name, email)
 
     @classmethod
     def load(
@@ -1,34 +1,50 @@
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.order.domain.events import OrderCreatedEvent
-from src.shared.domain.core import Aggregate, Result
-from src.shared.domain.errors import ValidationError
-from src.shared.domain.validation import Validator
+from src.shared.domain.core import Aggregate, Money, Result
+from src.shared.domain.errors import CurrencyError, ErrorRecord
+from src.shared.domain.validation import BatchValidationResult, FieldSchema, ValidationSchema
 
 
 class Order(Aggregate):
+    __slots__ = ("customer_id", "total")
+
+    SCHEMA = ValidationSchema(
+        FieldSchema("total").required().currency(),
+        FieldSchema("customer_id").required().uuid().memoize(),
+        bail_per_field=True,
+    )
+
     def __init__(
         self,
         customer_id: uuid.UUID,
-        total: float,
+        total: Money | float,
         id: uuid.UUID | None = None,
         created_at: datetime | None = None,
         updated_at: datetime | None = None,
         deleted_at: datetime | None = None,
+        version: int = 0,
     ):
         self.customer_id = customer_id
-        self.total = total
-        super().__init__(id, created_at, updated_at, deleted_at)
+        self.total = Money.of(total)
+        super().__init__(id, created_at, updated_at, deleted_at, version)
 
     @classmethod
-    def create(cls, customer_id: str, total: float) -> Result["Order"]:
+    def create(
+        cls, customer_id: str, total: Money | float, currency: Optional[str] = None
+    ) -> Result["Order"]:
         result = cls.validate(total, customer_id)
 
         if result.failure:
             return Result.fail(result.errors)
 
+        try:
+            total = Money.of(total, currency)
+        except ValueError:
+            return Result.fail([CurrencyError.record("currency", currency)])
+
         order = cls(customer_id, total)
 
         order_created_event = OrderCreatedEvent(order)
@@ -37,29 +53,25 @@ class Order(Aggregate):
         return Result.ok(order)
 
     @staticmethod
-    def validate(total, customer_id) -> Result[List[ValidationError] | None]:
-        validator = Validator()
+    def validate(total, customer_id) -> Result[List[ErrorRecord] | None]:
+        return Order.SCHEMA.validate(total, customer_id)
 
-        validator.field(total, "total").required().currency()
-
-        validator.field(customer_id, "customer_id").required().uuid()
-
-        result = validator.validate()
-
-        if result.failure:
-            return Result.fail(result.errors)
-
-        return Result.ok()
+    @staticmethod
+    def validate_columns(
+        totals: Sequence[Any], customer_ids: Sequence[Any]
+    ) -> BatchValidationResult:
+        return Order.SCHEMA.validate_columns(totals, customer_ids)
 
     @classmethod
     def load(
         cls,
         id: str,
         customer_id: str,
-        total: float,
+        total: Money | float,
         created_at: datetime,
         updated_at: datetime,
         deleted_at: Optional[datetime] = None,
+        version: int = 0,
     ) -> Result["Order"]:
         return Result.ok(
             cls(
@@ -69,22 +81,44 @@ class Order(Aggregate):
                 created_at=created_at,
                 updated_at=updated_at,
                 deleted_at=deleted_at,
+                version=version,
             )
         )
 
-    def update_total(self, total: float) -> Result[None]:
+    def update_total(self, total: Money | float) -> Result[None]:
         result = self.validate(total, self.customer_id)
         if result.failure:
             return Result.fail(result.errors)
+        if isinstance(total, Money) and total.currency != self.total.currency:
+            return Result.fail([CurrencyError.record("total", total)])
 
-        self.total = total
+        self.total = Money.of(total, self.total.currency)
         super().update()
 
         return Result.ok()
 
+    def copy(self) -> "Order":
+        # Recorded events stay with this order; the copy starts without any.
+        return Order(
+            customer_id=self.customer_id,
+            total=self.total,
+            id=self.id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            deleted_at=self.deleted_at,
+            version=self.version,
+        )
+
     def to_dict(self) -> dict:
         result = super().to_dict()
-        result.update({"customer_id": str(self.customer_id), "total": self.total})
+        result.update(
+            {
+                "customer_id": str(self.customer_id),
+                "total": float(self.total),
+                "currency": self.total.currency,
+                "version": self.version,
+            }
+        )
         return result
 
     @classmethod
@@ -92,8 +126,9 @@ class Order(Aggregate):
         return cls.load(
             id=data.get("id"),
             customer_id=data.get("customer_id"),
-            total=data.get("total"),
+            total=Money.of(data.get("total"), data.get("currency", Money.DEFAULT_CURRENCY)),
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
             deleted_at=data.get("deleted_at"),
+            version=data.get("version", 0),
         )
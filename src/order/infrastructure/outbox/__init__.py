@@ -0,0 +1,3 @@
+from .outbox_relay import OutboxRelay
+
+__all__ = ["OutboxRelay"]
@@ -0,0 +1,93 @@
+import threading
+from typing import Optional
+
+from src.order.application.ports import OrderRepository
+from src.shared.domain.core import Result
+from src.shared.domain.events import DomainEventPublisher
+from src.shared.infrastructure.events import QueuedDomainEventPublisher
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        repository: OrderRepository,
+        publisher: DomainEventPublisher,
+        batch_size: int = OrderRepository.DEFAULT_OUTBOX_BATCH_SIZE,
+        interval: float = 0.5,
+    ):
+        # A queue that drops or refuses events would lose them between the outbox and
+        # the handlers, so only a blocking one can back the relay.
+        if (
+            isinstance(publisher, QueuedDomainEventPublisher)
+            and publisher.policy != QueuedDomainEventPublisher.BLOCK
+        ):
+            raise ValueError(f"Outbox relay needs a blocking event queue, not {publisher.policy}")
+        self._repository = repository
+        self._publisher = publisher
+        self._batch_size = max(1, batch_size)
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def relay_once(self) -> Result[int]:
+        # Only events every handler took are marked as published; the others, and all
+        # of them after a crash in between, are published again: delivery is at least
+        # once.
+        with self._lock:
+            pending = self._repository.pending_events(self._batch_size)
+            if pending.failure:
+                return Result.fail(pending.errors)
+            if not pending.value:
+                return Result.ok(0)
+
+            try:
+                delivered = self._publisher.deliver([message.event for message in pending.value])
+            except Exception as e:
+                return Result.fail([e])
+
+            sequences = [message.sequence for message, ok in zip(pending.value, delivered) if ok]
+            marked = self._repository.mark_events_published(sequences)
+            if marked.failure:
+                return Result.fail(marked.errors)
+            return Result.ok(len(sequences))
+
+    def relay_pending(self) -> Result[int]:
+        relayed = 0
+        while True:
+            result = self.relay_once()
+            if result.failure:
+                return result
+            # A short batch means the outbox is empty or some events failed; either way
+            # the next pass is left to the interval.
+            if result.value < self._batch_size:
+                return Result.ok(relayed + result.value)
+            relayed += result.value
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="order-outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def close(self) -> None:
+        self.stop()
+        result = self.relay_pending()
+        if result.failure:
+            print(f"Error relaying order events: {result.errors[0]}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            result = self.relay_pending()
+            if result.failure:
+                print(f"Error relaying order events: {result.errors[0]}")
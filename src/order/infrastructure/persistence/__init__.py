@@ -0,0 +1,5 @@
+from .binary_order_codec import BinaryOrderCodec
+from .json_order_codec import JsonOrderCodec
+from .snapshot_journal import SnapshotJournal
+
+__all__ = ["BinaryOrderCodec", "JsonOrderCodec", "SnapshotJournal"]
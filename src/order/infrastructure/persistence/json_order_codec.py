@@ -0,0 +1,50 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, List
+
+from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
+from src.shared.domain.core import Money
+from src.shared.domain.events import DomainEvent
+
+
+class JsonOrderCodec:
+    EVENT_TYPES = {"OrderCreatedEvent": OrderCreatedEvent}
+
+    @staticmethod
+    def dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data, separators=(",", ":"))
+
+    @staticmethod
+    def encode_order(order: Order) -> Dict[str, Any]:
+        # The total is kept in cents: a float cannot hold every amount Money allows.
+        data = order.to_dict()
+        del data["total"]
+        data["total_cents"] = order.total.amount
+        return data
+
+    @staticmethod
+    def decode_order(data: Dict[str, Any]) -> Order:
+        deleted_at = data.get("deleted_at")
+        return Order.load(
+            id=data["id"],
+            customer_id=data["customer_id"],
+            total=Money(data["total_cents"], data["currency"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            deleted_at=datetime.fromisoformat(deleted_at) if deleted_at else None,
+            version=data.get("version", 0),
+        ).value
+
+    @classmethod
+    def encode_events(cls, order: Order) -> List[Dict[str, Any]]:
+        return [
+            dict(event.to_dict(), event_data=cls.encode_order(event.event_data))
+            for event in order.get_events()
+        ]
+
+    @classmethod
+    def decode_event(cls, data: Dict[str, Any]) -> DomainEvent:
+        return cls.EVENT_TYPES[data["event_type"]].restore(
+            data, cls.decode_order(data["event_data"])
+        )
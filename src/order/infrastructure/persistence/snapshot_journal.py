@@ -0,0 +1,275 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.order.domain import Order
+from src.order.infrastructure.persistence.binary_order_codec import BinaryOrderCodec
+
+
+class SnapshotJournal:
+    MAGIC = b"ORDSNAP4"
+    # magic, journal generation the snapshot was taken at, order count, event count
+    SNAPSHOT_HEADER = struct.Struct("<8sQQQ")
+    # Pending events follow the order records in a snapshot: sequence, payload length.
+    SNAPSHOT_EVENT = struct.Struct("<QI")
+    CHECKSUM = struct.Struct("<I")
+    SNAPSHOT_FILE = "orders.snapshot"
+    # Orders encoded per write, so a snapshot never holds all its bytes at once.
+    SNAPSHOT_CHUNK = 65_536
+    JOURNAL_PREFIX = "orders.journal."
+    # kind, entries still to come in the same batch, payload length, payload crc.
+    # A batch only counts once its last entry (remaining == 0) was read back intact,
+    # so an order and the events saved with it are replayed together or not at all.
+    JOURNAL_HEADER = struct.Struct("<BIII")
+    ORDER = 1
+    # The payload is the event sequence followed by the encoded event.
+    EVENT = 2
+    EVENT_SEQUENCE = struct.Struct("<Q")
+    # The payload is the JSON list of sequences that were published.
+    PUBLISHED = 3
+
+    def __init__(self, directory: str, snapshot_interval: int = 100_000, sync: bool = False):
+        self._directory = directory
+        self._snapshot_interval = snapshot_interval
+        self._sync = sync
+        self._lock = threading.Lock()
+        self._journal: Optional[BinaryIO] = None
+        self._generation = 0
+        self._appended = 0
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._events: Dict[int, str] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def snapshot_due(self) -> bool:
+        return self._appended >= self._snapshot_interval
+
+    def load(self) -> Iterator[Order]:
+        self._events = {}
+        snapshot_generation = 0
+        snapshot_path = os.path.join(self._directory, self.SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            snapshot_generation = yield from self._read_snapshot(snapshot_path)
+
+        generations = [
+            generation
+            for generation in self._journal_generations()
+            if generation >= snapshot_generation
+        ]
+        for generation in generations:
+            yield from self._read_journal(generation)
+
+        self._remove_journals_before(snapshot_generation)
+        with self._lock:
+            self._generation = max(generations, default=snapshot_generation)
+            self._open_journal()
+
+    def load_events(self) -> Dict[int, str]:
+        # The pending events are rebuilt while load() replays the snapshot and the
+        # journal, so they are only complete once it was run through.
+        events, self._events = self._events, {}
+        return events
+
+    def append(self, orders: Sequence[Order], events: Sequence[Tuple[int, str]] = ()) -> None:
+        entries = [(self.ORDER, BinaryOrderCodec.encode(order)) for order in orders]
+        entries.extend(
+            (self.EVENT, self.EVENT_SEQUENCE.pack(sequence) + payload.encode("utf-8"))
+            for sequence, payload in events
+        )
+        buffer = self._batch(entries)
+
+        with self._lock:
+            self._write_journal(buffer)
+            self._appended += len(orders)
+
+    def mark_published(self, sequences: Iterable[int]) -> None:
+        buffer = self._batch([(self.PUBLISHED, json.dumps(list(sequences)).encode("utf-8"))])
+        with self._lock:
+            self._write_journal(buffer)
+
+    def snapshot(
+        self, orders: List[Order], events: Sequence[Tuple[int, str]] = (), wait: bool = True
+    ) -> bool:
+        # The journal is rotated first: every save from now on lands in the new
+        # generation, so the snapshot only has to cover the orders and the pending
+        # events passed in here. Callers must not change those orders afterwards, as
+        # they are encoded while being written out, off the lock.
+        with self._lock:
+            if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+                return False
+            self._generation += 1
+            self._open_journal()
+            self._appended = 0
+            generation = self._generation
+
+            if not wait:
+                self._snapshot_thread = threading.Thread(
+                    target=self._write_snapshot,
+                    args=(orders, events, generation),
+                    name="order-snapshot",
+                    daemon=True,
+                )
+                self._snapshot_thread.start()
+                return True
+
+        self._write_snapshot(orders, events, generation)
+        return True
+
+    def wait(self) -> None:
+        thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+
+    def clear(self) -> None:
+        self.wait()
+        with self._lock:
+            self._close_journal()
+            path = os.path.join(self._directory, self.SNAPSHOT_FILE)
+            if os.path.exists(path):
+                os.remove(path)
+            self._remove_journals_before(self._generation + 1)
+            self._appended = 0
+            self._open_journal()
+
+    def close(self) -> None:
+        self.wait()
+        with self._lock:
+            self._close_journal()
+
+    def _write_snapshot(
+        self, orders: List[Order], events: Sequence[Tuple[int, str]], generation: int
+    ) -> None:
+        path = os.path.join(self._directory, self.SNAPSHOT_FILE)
+        temporary_path = f"{path}.tmp"
+        checksum = 0
+        with open(temporary_path, "wb") as file:
+            file.write(self.SNAPSHOT_HEADER.pack(self.MAGIC, generation, len(orders), len(events)))
+            for start in range(0, len(orders), self.SNAPSHOT_CHUNK):
+                chunk = b"".join(
+                    [
+                        BinaryOrderCodec.encode(order)
+                        for order in orders[start : start + self.SNAPSHOT_CHUNK]
+                    ]
+                )
+                checksum = zlib.crc32(chunk, checksum)
+                file.write(chunk)
+            for sequence, payload in events:
+                data = payload.encode("utf-8")
+                record = self.SNAPSHOT_EVENT.pack(sequence, len(data)) + data
+                checksum = zlib.crc32(record, checksum)
+                file.write(record)
+            file.write(self.CHECKSUM.pack(checksum))
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, path)
+        self._remove_journals_before(generation)
+
+    def _read_snapshot(self, path: str) -> Iterator[Order]:
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, generation, count, event_count = self.SNAPSHOT_HEADER.unpack_from(mapped, 0)
+                start = self.SNAPSHOT_HEADER.size
+                end = len(mapped) - self.CHECKSUM.size
+                if magic != self.MAGIC or start + count * BinaryOrderCodec.SIZE > end:
+                    raise ValueError(f"Corrupted order snapshot: {path}")
+
+                (checksum,) = self.CHECKSUM.unpack_from(mapped, end)
+                with memoryview(mapped)[start:end] as records:
+                    if zlib.crc32(records) != checksum:
+                        raise ValueError(f"Corrupted order snapshot: {path}")
+
+                offset = start + count * BinaryOrderCodec.SIZE
+                for _ in range(event_count):
+                    sequence, length = self.SNAPSHOT_EVENT.unpack_from(mapped, offset)
+                    offset += self.SNAPSHOT_EVENT.size
+                    self._events[sequence] = str(mapped[offset : offset + length], "utf-8")
+                    offset += length
+
+                with memoryview(mapped)[start : start + count * BinaryOrderCodec.SIZE] as records:
+                    yield from BinaryOrderCodec.decode_all(records)
+
+        return generation
+
+    def _read_journal(self, generation: int) -> Iterator[Order]:
+        path = self._journal_path(generation)
+        size = os.path.getsize(path)
+        valid_end = 0
+        if size:
+            with open(path, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    batch = []
+                    offset = 0
+                    while offset + self.JOURNAL_HEADER.size <= size:
+                        kind, remaining, length, crc = self.JOURNAL_HEADER.unpack_from(
+                            mapped, offset
+                        )
+                        start = offset + self.JOURNAL_HEADER.size
+                        end = start + length
+                        if length == 0 or end > size or zlib.crc32(mapped[start:end]) != crc:
+                            break
+                        batch.append((kind, start, end))
+                        offset = end
+
+                        if remaining == 0:
+                            for kind, start, end in batch:
+                                if kind == self.ORDER:
+                                    yield BinaryOrderCodec.decode(mapped, start)
+                                elif kind == self.EVENT:
+                                    (sequence,) = self.EVENT_SEQUENCE.unpack_from(mapped, start)
+                                    payload = mapped[start + self.EVENT_SEQUENCE.size : end]
+                                    self._events[sequence] = str(payload, "utf-8")
+                                elif kind == self.PUBLISHED:
+                                    for sequence in json.loads(mapped[start:end]):
+                                        self._events.pop(sequence, None)
+                            batch = []
+                            valid_end = offset
+
+        if valid_end < size:
+            with open(path, "r+b") as file:
+                file.truncate(valid_end)
+
+    def _batch(self, entries: List[Tuple[int, bytes]]) -> bytes:
+        buffer = bytearray()
+        remaining = len(entries)
+        for kind, payload in entries:
+            remaining -= 1
+            buffer += self.JOURNAL_HEADER.pack(kind, remaining, len(payload), zlib.crc32(payload))
+            buffer += payload
+        return bytes(buffer)
+
+    def _write_journal(self, buffer: bytes) -> None:
+        if self._journal is None:
+            self._open_journal()
+        self._journal.write(buffer)
+        self._journal.flush()
+        if self._sync:
+            os.fsync(self._journal.fileno())
+
+    def _open_journal(self) -> None:
+        self._close_journal()
+        self._journal = open(self._journal_path(self._generation), "ab")
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _remove_journals_before(self, generation: int) -> None:
+        for journal_generation in self._journal_generations():
+            if journal_generation < generation:
+                os.remove(self._journal_path(journal_generation))
+
+    def _journal_generations(self) -> List[int]:
+        return sorted(
+            int(name[len(self.JOURNAL_PREFIX) :])
+            for name in os.listdir(self._directory)
+            if name.startswith(self.JOURNAL_PREFIX)
+        )
+
+    def _journal_path(self, generation: int) -> str:
+        return os.path.join(self._directory, f"{self.JOURNAL_PREFIX}{generation:08d}")
@@ -1,3 +1,22 @@
+from .async_in_memory_order_repository import AsyncInMemoryOrderRepository
+from .caching_order_repository import CacheStats, CachingOrderRepository
+from .columnar_order_repository import ColumnarOrderRepository
+from .file_order_repository import FileOrderRepository
 from .in_memory_order_repository import InMemoryOrderRepository
+from .shared_memory_order_repository import SharedMemoryOrderRepository
+from .sqlite_order_repository import SqliteOrderRepository
+from .striped_in_memory_order_repository import StripedInMemoryOrderRepository
+from .threaded_async_order_repository import ThreadedAsyncOrderRepository
 
-__all__ = ["InMemoryOrderRepository"]
+__all__ = [
+    "AsyncInMemoryOrderRepository",
+    "CacheStats",
+    "CachingOrderRepository",
+    "ColumnarOrderRepository",
+    "FileOrderRepository",
+    "InMemoryOrderRepository",
+    "SharedMemoryOrderRepository",
+    "SqliteOrderRepository",
+    "StripedInMemoryOrderRepository",
+    "ThreadedAsyncOrderRepository",
+]
@@ -0,0 +1,47 @@
+import uuid
+from typing import Iterable, Optional
+
+from src.order.application.ports import AsyncOrderRepository, OrderRepository
+from src.order.domain import Order
+from src.order.infrastructure.repositories.in_memory_order_repository import (
+    InMemoryOrderRepository,
+)
+from src.shared.domain.core import Result
+
+
+class AsyncInMemoryOrderRepository(AsyncOrderRepository):
+    # In-process stores never wait on I/O, so they are called inline on the event
+    # loop; handing each call to a thread would cost more than the call itself.
+    def __init__(self, repository: Optional[OrderRepository] = None):
+        self._repository = repository if repository is not None else InMemoryOrderRepository()
+
+    @property
+    def repository(self) -> OrderRepository:
+        return self._repository
+
+    @property
+    def has_outbox(self) -> bool:
+        return self._repository.has_outbox
+
+    async def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        return self._repository.save(order, expected_version)
+
+    async def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        return self._repository.save_many(orders)
+
+    async def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        return self._repository.get_by_id(order_id)
+
+    async def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        return self._repository.get_by_customer(customer_id)
+
+    async def get_all(self) -> Result[list[Order]]:
+        try:
+            return Result.ok(list(self._repository.iter_orders()))
+        except Exception as e:
+            return Result.fail([e])
+
+    def close(self) -> None:
+        close = getattr(self._repository, "close", None)
+        if close is not None:
+            close()
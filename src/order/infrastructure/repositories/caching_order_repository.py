@@ -0,0 +1,150 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from src.order.application.ports import OrderRepository, OutboxMessage
+from src.order.domain import Order
+from src.shared.domain.core import Result
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingOrderRepository(OrderRepository):
+    def __init__(
+        self,
+        repository: OrderRepository,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._repository = repository
+        self._max_size = max(1, max_size)
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # order id -> (cached order or None for a known miss, expiry time). The cached
+        # order is a private copy that is never handed out, so callers changing what
+        # they got back cannot change what the next caller reads.
+        self._entries: OrderedDict[uuid.UUID, Tuple[Optional[Order], float]] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def repository(self) -> OrderRepository:
+        return self._repository
+
+    @property
+    def has_outbox(self) -> bool:
+        return self._repository.has_outbox
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        try:
+            return self._repository.save(order, expected_version)
+        finally:
+            self._invalidate([order])
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        orders = list(orders)
+        try:
+            return self._repository.save_many(orders)
+        finally:
+            self._invalidate(orders)
+
+    def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        with self._lock:
+            entry = self._entries.get(order_id)
+            if entry is not None:
+                order, expires_at = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(order_id)
+                    self._hits += 1
+                    return Result.ok(None if order is None else order.copy())
+                del self._entries[order_id]
+            self._misses += 1
+            generation = self._generation
+
+        result = self._repository.get_by_id(order_id)
+        if result.success:
+            order = result.value
+            self._store(order_id, None if order is None else order.copy(), generation)
+        return result
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        return self._repository.get_by_customer(customer_id)
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        return self._repository.iter_orders(after_id=after_id, limit=limit)
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        return self._repository.find_between(start, end, field)
+
+    def pending_events(
+        self, limit: int = OrderRepository.DEFAULT_OUTBOX_BATCH_SIZE
+    ) -> Result[list[OutboxMessage]]:
+        return self._repository.pending_events(limit)
+
+    def mark_events_published(self, sequences: Iterable[int]) -> Result[None]:
+        return self._repository.mark_events_published(sequences)
+
+    def count(self) -> int:
+        return self._repository.count()
+
+    def clear(self) -> None:
+        try:
+            self._repository.clear()
+        finally:
+            self.invalidate_all()
+
+    def close(self) -> None:
+        self.invalidate_all()
+        close = getattr(self._repository, "close", None)
+        if close is not None:
+            close()
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _store(self, order_id: uuid.UUID, order: Optional[Order], generation: int) -> None:
+        expires_at = self._clock() + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            # A save that ran while the backend was being read may have made this
+            # value stale; skip caching it rather than serve it until it expires.
+            if generation != self._generation:
+                return
+            self._entries[order_id] = (order, expires_at)
+            self._entries.move_to_end(order_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _invalidate(self, orders: Iterable[Order]) -> None:
+        with self._lock:
+            for order in orders:
+                self._entries.pop(getattr(order, "id", None), None)
+            self._generation += 1
@@ -0,0 +1,255 @@
+import struct
+import threading
+import uuid
+from array import array
+from collections import defaultdict
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from src.order.application.ports import OrderRepository, OrderSaveError
+from src.order.domain import Order
+from src.order.infrastructure.persistence import BinaryOrderCodec
+from src.shared.domain.core import Money, Result
+from src.shared.infrastructure.indexes import HashIndex, SortedIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+OrderRow = Tuple[bytes, bytes, int, int, int, int, int]
+
+UUID_SIZE = 16
+
+
+class ColumnarOrderRepository(OrderRepository):
+    DELETED = 0x01
+
+    def __init__(self, use_numpy: bool = True):
+        self._use_numpy = use_numpy and numpy is not None
+        self._ids = bytearray()
+        self._customer_ids = bytearray()
+        self._totals = array("q")
+        self._created_at = array("q")
+        self._updated_at = array("q")
+        self._deleted_at = array("q")
+        self._versions = array("q")
+        self._flags = array("B")
+        self._rows: Dict[bytes, int] = {}
+        self._customer_index: HashIndex[bytes, int] = HashIndex()
+        self._time_indexes: Dict[str, SortedIndex[bytes]] = {
+            field: SortedIndex() for field in self.TIME_FIELDS
+        }
+        self._created_at_index = self._time_indexes["created_at"]
+        # Held across the version check and the row write, and while a row is read
+        # back, so neither a compare-and-set nor a reader sees a half-written row.
+        self._lock = threading.Lock()
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        try:
+            row = self._to_row(order)
+            with self._lock:
+                position = self._rows.get(row[0])
+                self._check_version(
+                    order, expected_version, 0 if position is None else self._versions[position]
+                )
+                order.version = self._put(row)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        rows = []
+        errors = []
+        for position, order in enumerate(orders):
+            try:
+                rows.append((order, self._to_row(order)))
+            except Exception as e:
+                errors.append(OrderSaveError(position, order, e))
+
+        if errors:
+            return Result.fail(errors)
+
+        try:
+            with self._lock:
+                for order, row in rows:
+                    order.version = self._put(row)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        try:
+            with self._lock:
+                row = self._rows.get(order_id.bytes)
+                return Result.ok(None if row is None else self._materialize(row))
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        try:
+            customer_key = self._customer_key(customer_id).bytes
+            with self._lock:
+                rows = self._customer_index.get(customer_key)
+                return Result.ok([self._materialize(row) for row in sorted(rows)])
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_all(self) -> Result[list[Order]]:
+        try:
+            with self._lock:
+                return Result.ok([self._materialize(row) for row in range(len(self._flags))])
+        except Exception as e:
+            return Result.fail([e])
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        after = None
+        if after_id is not None:
+            after = self._created_at_index.entry_of(after_id.bytes)
+            if after is None:
+                raise ValueError(f"Order {after_id} not found")
+
+        for _, id in islice(self._created_at_index.iter_after(after), limit):
+            with self._lock:
+                order = self._materialize(self._rows[id])
+            yield order
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        try:
+            index = self._time_indexes[self._check_time_field(field)]
+            with self._lock:
+                entries = index.between(
+                    BinaryOrderCodec.to_micros(start), BinaryOrderCodec.to_micros(end)
+                )
+                return Result.ok([self._materialize(self._rows[id]) for _, id in entries])
+        except Exception as e:
+            return Result.fail([e])
+
+    def sum_total_by_customer(self) -> Dict[uuid.UUID, Money]:
+        if self._use_numpy:
+            sums = self._sum_total_by_customer_numpy()
+        else:
+            sums = defaultdict(int)
+            customers = struct.iter_unpack("16s", self._customer_ids)
+            for (customer_id,), total, flags in zip(customers, self._totals, self._flags):
+                if not flags & self.DELETED:
+                    sums[customer_id] += total
+
+        return {uuid.UUID(bytes=customer_id): Money(cents) for customer_id, cents in sums.items()}
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        start_micros = BinaryOrderCodec.to_micros(start)
+        end_micros = BinaryOrderCodec.to_micros(end)
+        if self._use_numpy:
+            created_at = numpy.frombuffer(self._created_at, dtype=numpy.int64)
+            flags = numpy.frombuffer(self._flags, dtype=numpy.uint8)
+            matches = (created_at >= start_micros) & (created_at < end_micros)
+            return int(numpy.count_nonzero(matches & (flags & self.DELETED == 0)))
+
+        return sum(
+            1
+            for created_at, flags in zip(self._created_at, self._flags)
+            if start_micros <= created_at < end_micros and not flags & self.DELETED
+        )
+
+    def count(self) -> int:
+        return len(self._flags)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._customer_ids.clear()
+            for column in (self._totals, self._created_at, self._updated_at, self._deleted_at):
+                del column[:]
+            del self._versions[:]
+            del self._flags[:]
+            self._rows.clear()
+            self._customer_index.clear()
+            for index in self._time_indexes.values():
+                index.clear()
+
+    def _sum_total_by_customer_numpy(self) -> Dict[bytes, int]:
+        live = numpy.frombuffer(self._flags, dtype=numpy.uint8) & self.DELETED == 0
+        # Each 16-byte customer id is viewed as two uint64 words so it can be sorted.
+        customers = numpy.frombuffer(self._customer_ids, dtype=numpy.uint64).reshape(-1, 2)[live]
+        totals = numpy.frombuffer(self._totals, dtype=numpy.int64)[live]
+        if not len(totals):
+            return {}
+
+        # Sorting groups each customer's rows together so reduceat can add the
+        # cents of every group exactly, without going through float weights.
+        order = numpy.lexsort((customers[:, 1], customers[:, 0]))
+        customers = customers[order]
+        changed = numpy.any(customers[1:] != customers[:-1], axis=1)
+        starts = numpy.flatnonzero(numpy.concatenate(([True], changed)))
+        sums = numpy.add.reduceat(totals[order], starts)
+        return {customers[start].tobytes(): int(total) for start, total in zip(starts, sums)}
+
+    def _put(self, row: OrderRow) -> int:
+        id, customer_id, total, created_at, updated_at, deleted_at, flags = row
+        position = self._rows.get(id)
+        if position is None:
+            position = len(self._flags)
+            self._ids += id
+            self._customer_ids += customer_id
+            self._totals.append(total)
+            self._created_at.append(created_at)
+            self._updated_at.append(updated_at)
+            self._deleted_at.append(deleted_at)
+            self._versions.append(1)
+            self._flags.append(flags)
+            self._rows[id] = position
+        else:
+            offset = position * UUID_SIZE
+            self._customer_ids[offset : offset + UUID_SIZE] = customer_id
+            self._totals[position] = total
+            self._created_at[position] = created_at
+            self._updated_at[position] = updated_at
+            self._deleted_at[position] = deleted_at
+            self._versions[position] += 1
+            self._flags[position] = flags
+
+        self._customer_index.put(position, None if flags & self.DELETED else customer_id)
+        self._time_indexes["created_at"].put(id, created_at)
+        self._time_indexes["updated_at"].put(id, updated_at)
+        self._time_indexes["deleted_at"].put(id, deleted_at if flags & self.DELETED else None)
+        return self._versions[position]
+
+    def _materialize(self, position: int) -> Order:
+        offset = position * UUID_SIZE
+        epoch = BinaryOrderCodec.EPOCH
+        return Order(
+            id=uuid.UUID(bytes=bytes(self._ids[offset : offset + UUID_SIZE])),
+            customer_id=uuid.UUID(bytes=bytes(self._customer_ids[offset : offset + UUID_SIZE])),
+            total=Money(self._totals[position]),
+            created_at=epoch + timedelta(microseconds=self._created_at[position]),
+            updated_at=epoch + timedelta(microseconds=self._updated_at[position]),
+            deleted_at=(
+                epoch + timedelta(microseconds=self._deleted_at[position])
+                if self._flags[position] & self.DELETED
+                else None
+            ),
+            version=self._versions[position],
+        )
+
+    @classmethod
+    def _to_row(cls, order: Order) -> OrderRow:
+        deleted_at = order.deleted_at
+        return (
+            order.id.bytes,
+            cls._customer_key(order.customer_id).bytes,
+            BinaryOrderCodec.total_cents(order),
+            BinaryOrderCodec.to_micros(order.created_at),
+            BinaryOrderCodec.to_micros(order.updated_at),
+            BinaryOrderCodec.to_micros(deleted_at) if deleted_at is not None else 0,
+            cls.DELETED if deleted_at is not None else 0,
+        )
+
+    @staticmethod
+    def _customer_key(customer_id: uuid.UUID | str) -> uuid.UUID:
+        return customer_id if isinstance(customer_id, uuid.UUID) else uuid.UUID(customer_id)
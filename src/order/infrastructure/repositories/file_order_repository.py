@@ -0,0 +1,535 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.order.application.ports import OrderRepository, OrderSaveError, OutboxMessage
+from src.order.domain import Order
+from src.order.infrastructure.persistence import JsonOrderCodec
+from src.shared.domain.core import Result
+from src.shared.infrastructure.indexes import HashIndex, SortedIndex
+
+logger = logging.getLogger(__name__)
+
+
+class RecordLocation(NamedTuple):
+    segment_id: int
+    offset: int
+    length: int
+    sequence: int
+    deleted: bool
+    version: int = 0
+
+
+class FileOrderRepository(OrderRepository):
+    # Record header: payload length, payload crc32, global sequence number and how
+    # many records of the same batch still follow (0 closes the batch).
+    # With an outbox, every order record is followed in its batch by one record per
+    # recorded event, and publishing appends a record listing the published ones.
+    HEADER = struct.Struct("<IIQI")
+    SEGMENT_SUFFIX = ".log"
+    COMPACTION_FILE = "compaction.tmp"
+    DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        sync: bool = False,
+        outbox: bool = False,
+    ):
+        self.has_outbox = outbox
+        self._directory = directory
+        self._segment_size = segment_size
+        self._sync = sync
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._compactor_stop = threading.Event()
+        self._locations: Dict[uuid.UUID, RecordLocation] = {}
+        self._customer_index: HashIndex[uuid.UUID, uuid.UUID] = HashIndex()
+        self._time_indexes: Dict[str, SortedIndex[uuid.UUID]] = {
+            field: SortedIndex() for field in self.TIME_FIELDS
+        }
+        self._created_at_index = self._time_indexes["created_at"]
+        self._maps: Dict[int, mmap.mmap] = {}
+        # event record sequence -> location, in sequence order
+        self._outbox: Dict[int, RecordLocation] = {}
+        self._sequence = 0
+        self._closed = False
+
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self._compaction_path()):
+            os.remove(self._compaction_path())
+        segment_ids = self._segment_ids()
+        write_position = 0
+        published: set = set()
+        for segment_id in segment_ids:
+            write_position = self._replay(segment_id, published)
+        # Published markers only take effect once the whole log has been replayed.
+        self._outbox = {
+            sequence: location
+            for sequence, location in sorted(self._outbox.items())
+            if sequence not in published
+        }
+
+        self._active_id = segment_ids[-1] if segment_ids else 1
+        self._next_segment_id = self._active_id + 1
+        self._open_active(write_position)
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        try:
+            data = JsonOrderCodec.encode_order(order)
+            with self._lock:
+                version = self._version_of(order.id)
+                self._check_version(order, expected_version, version)
+                data["version"] = version + 1
+                events = self._event_payloads(order)
+                location, *event_locations = self._append([self._encode(data), *events])
+                order.version = location.version
+                self._index(order, location)
+                self._stage_events(order, event_locations)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        orders = list(orders)
+        records = []
+        events = []
+        errors = []
+        for position, order in enumerate(orders):
+            try:
+                records.append(JsonOrderCodec.encode_order(order))
+                events.append(self._event_payloads(order))
+            except Exception as e:
+                errors.append(OrderSaveError(position, order, e))
+
+        if errors:
+            return Result.fail(errors)
+
+        try:
+            with self._lock:
+                versions: Dict[uuid.UUID, int] = {}
+                for order, data in zip(orders, records):
+                    versions[order.id] = versions.get(order.id, self._version_of(order.id)) + 1
+                    data["version"] = versions[order.id]
+                locations = self._append(
+                    [
+                        payload
+                        for data, order_events in zip(records, events)
+                        for payload in (self._encode(data), *order_events)
+                    ]
+                )
+                position = 0
+                for order, order_events in zip(orders, events):
+                    location = locations[position]
+                    event_locations = locations[position + 1 : position + 1 + len(order_events)]
+                    position += 1 + len(order_events)
+                    order.version = location.version
+                    self._index(order, location)
+                    self._stage_events(order, event_locations)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        try:
+            with self._lock:
+                location = self._locations.get(order_id)
+                return Result.ok(self._read(location) if location else None)
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        try:
+            with self._lock:
+                order_ids = list(self._customer_index.get(self._customer_key(customer_id)))
+                return Result.ok([self._read(self._locations[order_id]) for order_id in order_ids])
+        except Exception as e:
+            return Result.fail([e])
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        after = None
+        if after_id is not None:
+            after = self._created_at_index.entry_of(after_id)
+            if after is None:
+                raise ValueError(f"Order {after_id} not found")
+
+        for _, order_id in islice(self._created_at_index.iter_after(after), limit):
+            with self._lock:
+                location = self._locations.get(order_id)
+                order = self._read(location) if location else None
+            if order is not None:
+                yield order
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        try:
+            with self._lock:
+                entries = self._time_indexes[self._check_time_field(field)].between(start, end)
+                return Result.ok([self._read(self._locations[order_id]) for _, order_id in entries])
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_all(self) -> Result[list[Order]]:
+        try:
+            return Result.ok(list(self.iter_orders()))
+        except Exception as e:
+            return Result.fail([e])
+
+    def pending_events(
+        self, limit: int = OrderRepository.DEFAULT_OUTBOX_BATCH_SIZE
+    ) -> Result[list[OutboxMessage]]:
+        try:
+            with self._lock:
+                return Result.ok(
+                    [
+                        OutboxMessage(
+                            sequence, JsonOrderCodec.decode_event(self._payload(location)["event"])
+                        )
+                        for sequence, location in islice(self._outbox.items(), limit)
+                    ]
+                )
+        except Exception as e:
+            return Result.fail([e])
+
+    def mark_events_published(self, sequences: Iterable[int]) -> Result[None]:
+        try:
+            with self._lock:
+                published = [sequence for sequence in sequences if sequence in self._outbox]
+                if published:
+                    self._append([self._outbox_record({"published": published})])
+                    for sequence in published:
+                        del self._outbox[sequence]
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def count(self) -> int:
+        return len(self._locations)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._close_files()
+            for segment_id in self._segment_ids():
+                os.remove(self._path(segment_id))
+            self._locations.clear()
+            self._outbox.clear()
+            self._customer_index.clear()
+            for index in self._time_indexes.values():
+                index.clear()
+            self._active_id = self._next_segment_id
+            self._next_segment_id += 1
+            self._open_active(0)
+
+    def compact(self) -> int:
+        with self._compaction_lock:
+            with self._lock:
+                sealed = sorted(set(self._segment_ids()) - {self._active_id})
+                if not sealed:
+                    return 0
+                # The output takes the place of the oldest sealed segment, so segment
+                # ids keep following sequence numbers: it stays below the active segment
+                # across restarts and is compacted again together with newer segments.
+                target_id = sealed[0]
+                candidates = [
+                    (order_id, location)
+                    for order_id, location in self._locations.items()
+                    if location.segment_id in sealed
+                ]
+                candidates.extend(
+                    (sequence, location)
+                    for sequence, location in self._outbox.items()
+                    if location.segment_id in sealed
+                )
+
+            # Sealed segments are immutable, so live records are copied without holding
+            # the repository lock. A record superseded meanwhile is simply left behind
+            # in the new segment with an older sequence number.
+            moved, dropped = self._copy_live_records(target_id, candidates)
+
+            with self._lock:
+                for key, old_location, new_location in moved:
+                    # Event records are keyed by sequence number, orders by id.
+                    records = self._outbox if isinstance(key, int) else self._locations
+                    if records.get(key) == old_location:
+                        records[key] = new_location
+                for order_id, old_location in dropped:
+                    if self._locations.get(order_id) == old_location:
+                        self._unindex(order_id)
+                for segment_id in sealed:
+                    mapped = self._maps.pop(segment_id, None)
+                    if mapped is not None:
+                        mapped.close()
+                if moved:
+                    os.replace(self._compaction_path(), self._path(target_id))
+                else:
+                    os.remove(self._compaction_path())
+                # Deleted orders are dropped without a tombstone, so the remaining
+                # segments go oldest first: a crash can leave an order's deletion
+                # behind without its earlier records, never the other way around.
+                for segment_id in sealed[1:] if moved else sealed:
+                    os.remove(self._path(segment_id))
+
+            return len(sealed)
+
+    def start_compactor(self, interval: float = 60.0) -> None:
+        if self._compactor is not None:
+            return
+
+        self._compactor_stop.clear()
+        self._compactor = threading.Thread(
+            target=self._run_compactor, args=(interval,), name="order-compactor", daemon=True
+        )
+        self._compactor.start()
+
+    def stop_compactor(self) -> None:
+        if self._compactor is None:
+            return
+
+        self._compactor_stop.set()
+        self._compactor.join()
+        self._compactor = None
+
+    def close(self) -> None:
+        self.stop_compactor()
+        with self._lock:
+            if self._closed:
+                return
+            self._close_files()
+            self._closed = True
+
+    def _run_compactor(self, interval: float) -> None:
+        while not self._compactor_stop.wait(interval):
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("Error compacting order segments")
+
+    def _copy_live_records(self, target_id: int, candidates: List[tuple]) -> tuple:
+        moved = []
+        dropped = []
+        sources: Dict[int, mmap.mmap] = {}
+        try:
+            with open(self._compaction_path(), "wb") as target:
+                offset = 0
+                for order_id, location in sorted(candidates, key=lambda item: item[1][:2]):
+                    if location.deleted:
+                        dropped.append((order_id, location))
+                        continue
+
+                    source = sources.get(location.segment_id)
+                    if source is None:
+                        with open(self._path(location.segment_id), "rb") as file:
+                            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                        sources[location.segment_id] = source
+
+                    start = location.offset - self.HEADER.size
+                    end = location.offset + location.length
+                    # Every copied record is committed already, so it is written as a
+                    # batch of its own whatever batch it originally belonged to.
+                    length, crc, sequence, _ = self.HEADER.unpack_from(source, start)
+                    target.write(self.HEADER.pack(length, crc, sequence, 0))
+                    target.write(source[location.offset : end])
+                    moved.append(
+                        (
+                            order_id,
+                            location,
+                            location._replace(
+                                segment_id=target_id, offset=offset + self.HEADER.size
+                            ),
+                        )
+                    )
+                    offset += end - start
+                target.flush()
+                os.fsync(target.fileno())
+        finally:
+            for source in sources.values():
+                source.close()
+
+        return moved, dropped
+
+    def _append(self, payloads: List[Tuple[bytes, int]]) -> List[RecordLocation]:
+        buffer = bytearray()
+        locations = []
+        remaining = len(payloads)
+        for payload, version in payloads:
+            remaining -= 1
+            self._sequence += 1
+            buffer += self.HEADER.pack(len(payload), zlib.crc32(payload), self._sequence, remaining)
+            locations.append((len(buffer), len(payload), self._sequence, version))
+            buffer += payload
+
+        if self._write_position + len(buffer) > self._active_size:
+            self._rotate(len(buffer))
+
+        base = self._write_position
+        os.pwrite(self._active.fileno(), buffer, base)
+        if self._sync:
+            os.fsync(self._active.fileno())
+        self._write_position += len(buffer)
+
+        return [
+            RecordLocation(self._active_id, base + offset, length, sequence, False, version)
+            for offset, length, sequence, version in locations
+        ]
+
+    def _rotate(self, required: int) -> None:
+        self._seal_active()
+        self._active_id = self._next_segment_id
+        self._next_segment_id += 1
+        self._open_active(0, required)
+
+    def _open_active(self, write_position: int, required: int = 0) -> None:
+        # The active segment is preallocated (sparse) so a single read-only map covers
+        # every record appended to it; replay stops at the first zero-length header.
+        path = self._path(self._active_id)
+        self._active = open(path, "r+b" if os.path.exists(path) else "w+b")
+        self._active_size = max(self._segment_size, required, write_position)
+        self._active.truncate(write_position)
+        self._active.truncate(self._active_size)
+        self._write_position = write_position
+
+    def _seal_active(self) -> None:
+        mapped = self._maps.pop(self._active_id, None)
+        if mapped is not None:
+            mapped.close()
+        self._active.truncate(self._write_position)
+        self._active.close()
+
+    def _close_files(self) -> None:
+        self._seal_active()
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+
+    def _read(self, location: RecordLocation) -> Order:
+        return JsonOrderCodec.decode_order(self._payload(location))
+
+    def _payload(self, location: RecordLocation) -> Dict[str, Any]:
+        mapped = self._maps.get(location.segment_id)
+        if mapped is None:
+            with open(self._path(location.segment_id), "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[location.segment_id] = mapped
+
+        with memoryview(mapped)[location.offset : location.offset + location.length] as record:
+            return json.loads(str(record, "utf-8"))
+
+    def _replay(self, segment_id: int, published: set) -> int:
+        path = self._path(segment_id)
+        size = os.path.getsize(path)
+        valid_end = 0
+        if size == 0:
+            return valid_end
+
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                batch = []
+                offset = 0
+                while offset + self.HEADER.size <= size:
+                    length, crc, sequence, remaining = self.HEADER.unpack_from(mapped, offset)
+                    start = offset + self.HEADER.size
+                    end = start + length
+                    if length == 0 or end > size or zlib.crc32(mapped[start:end]) != crc:
+                        break
+
+                    self._sequence = max(self._sequence, sequence)
+                    batch.append((mapped[start:end], start, length, sequence))
+                    offset = end
+
+                    if remaining == 0:
+                        for payload, payload_start, payload_length, payload_sequence in batch:
+                            data = json.loads(payload)
+                            location = RecordLocation(
+                                segment_id, payload_start, payload_length, payload_sequence, False
+                            )
+                            if "event" in data:
+                                self._outbox[payload_sequence] = location
+                            elif "published" in data:
+                                published.update(data["published"])
+                            else:
+                                order = JsonOrderCodec.decode_order(data)
+                                self._index(
+                                    order,
+                                    location._replace(
+                                        deleted=order.is_deleted, version=order.version
+                                    ),
+                                )
+                        batch = []
+                        valid_end = offset
+
+        return valid_end
+
+    def _event_payloads(self, order: Order) -> List[Tuple[bytes, int]]:
+        if not self.has_outbox:
+            return []
+        return [
+            self._outbox_record({"event": data}) for data in JsonOrderCodec.encode_events(order)
+        ]
+
+    @classmethod
+    def _outbox_record(cls, data: Dict[str, Any]) -> Tuple[bytes, int]:
+        return JsonOrderCodec.dumps(data).encode("utf-8"), 0
+
+    def _stage_events(self, order: Order, locations: List[RecordLocation]) -> None:
+        if not self.has_outbox:
+            return
+        for location in locations:
+            self._outbox[location.sequence] = location
+        order.clear_events()
+
+    def _index(self, order: Order, location: RecordLocation) -> None:
+        current = self._locations.get(order.id)
+        if current is not None and current.sequence > location.sequence:
+            return
+
+        location = location._replace(deleted=order.is_deleted)
+        self._locations[order.id] = location
+        self._customer_index.put(
+            order.id, None if order.is_deleted else self._customer_key(order.customer_id)
+        )
+        for field, index in self._time_indexes.items():
+            index.put(order.id, getattr(order, field))
+
+    def _unindex(self, order_id: uuid.UUID) -> None:
+        del self._locations[order_id]
+        self._customer_index.remove(order_id)
+        for index in self._time_indexes.values():
+            index.remove(order_id)
+
+    def _version_of(self, order_id: uuid.UUID) -> int:
+        location = self._locations.get(order_id)
+        return location.version if location is not None else 0
+
+    def _segment_ids(self) -> List[int]:
+        return sorted(
+            int(name[: -len(self.SEGMENT_SUFFIX)])
+            for name in os.listdir(self._directory)
+            if name.endswith(self.SEGMENT_SUFFIX)
+        )
+
+    def _compaction_path(self) -> str:
+        return os.path.join(self._directory, self.COMPACTION_FILE)
+
+    def _path(self, segment_id: int) -> str:
+        return os.path.join(self._directory, f"{segment_id:010d}{self.SEGMENT_SUFFIX}")
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Tuple[bytes, int]:
+        return JsonOrderCodec.dumps(data).encode("utf-8"), data["version"]
+
+    @staticmethod
+    def _customer_key(customer_id: uuid.UUID | str) -> uuid.UUID:
+        return customer_id if isinstance(customer_id, uuid.UUID) else uuid.UUID(customer_id)
@@ -1,18 +1,93 @@
+import gc
+import json
+import threading
 import uuid
-from typing import Dict, Optional
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from src.order.application.ports import OrderRepository
+from src.order.application.ports import OrderRepository, OrderSaveError, OutboxMessage
 from src.order.domain import Order
+from src.order.infrastructure.persistence import JsonOrderCodec, SnapshotJournal
 from src.shared.domain.core import Result
+from src.shared.infrastructure.indexes import HashIndex, SortedIndex
 
 
 class InMemoryOrderRepository(OrderRepository):
-    def __init__(self):
+    def __init__(self, persistence: Optional[SnapshotJournal] = None, outbox: bool = False):
+        # Holds copies taken at save time and hands out copies again, so a caller
+        # changing its order cannot alter what is stored without saving it.
         self._orders: Dict[uuid.UUID, Order] = {}
+        self._customer_index: HashIndex[uuid.UUID, uuid.UUID] = HashIndex()
+        self._time_indexes: Dict[str, SortedIndex[uuid.UUID]] = {
+            field: SortedIndex() for field in self.TIME_FIELDS
+        }
+        self._created_at_index = self._time_indexes["created_at"]
+        self._persistence = persistence
+        self.has_outbox = outbox
+        # Events are kept encoded as of the save, so later changes to the order they
+        # came from do not alter what gets published.
+        self._outbox: Dict[int, str] = {}
+        self._outbox_sequence = 0
+        self._outbox_lock = threading.Lock()
+        # Held across the version check and the write, so a compare-and-set save
+        # cannot pass a version another thread is about to replace.
+        self._lock = threading.RLock()
 
-    def save(self, order: Order) -> Result[None]:
+        if persistence is not None:
+            # Restoring allocates millions of long-lived objects, which the collector
+            # would otherwise rescan over and over while they pile up.
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                self._restore(persistence.load())
+            finally:
+                if collecting:
+                    gc.enable()
+            if outbox:
+                self._outbox = persistence.load_events()
+                self._outbox_sequence = max(self._outbox, default=0)
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
         try:
-            self._orders[order.id] = order
+            customer_id = self._indexed_customer_of(order)
+            with self._lock:
+                version = self._version_of(order.id)
+                self._check_version(order, expected_version, version)
+                with self._versioned([(order, version + 1)]):
+                    self._orders[order.id] = order.copy()
+                self._customer_index.put(order.id, customer_id)
+                for field, index in self._time_indexes.items():
+                    index.put(order.id, getattr(order, field))
+                self._snapshot_if_due()
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        staged = []
+        errors = []
+        for position, order in enumerate(orders):
+            try:
+                staged.append((order, self._indexed_customer_of(order)))
+            except Exception as e:
+                errors.append(OrderSaveError(position, order, e))
+
+        if errors:
+            return Result.fail(errors)
+
+        try:
+            with self._lock:
+                versions: Dict[uuid.UUID, int] = {}
+                for order, _ in staged:
+                    versions[order.id] = versions.get(order.id, self._version_of(order.id)) + 1
+                with self._versioned([(order, versions[order.id]) for order, _ in staged]):
+                    self._orders.update((order.id, order.copy()) for order, _ in staged)
+                for order, customer_id in staged:
+                    self._customer_index.put(order.id, customer_id)
+                self._index_times(order for order, _ in staged)
+                self._snapshot_if_due()
             return Result.ok()
         except Exception as e:
             return Result.fail([e])
@@ -20,19 +95,165 @@ class InMemoryOrderRepository(OrderRepository):
     def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
         try:
             order = self._orders.get(order_id)
-            return Result.ok(order)
+            return Result.ok(None if order is None else order.copy())
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        try:
+            order_ids = self._customer_index.get(self._customer_key(customer_id))
+            orders = [self._orders[order_id] for order_id in order_ids]
+            return Result.ok([order.copy() for order in orders if not order.is_deleted])
+        except Exception as e:
+            return Result.fail([e])
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        after = None
+        if after_id is not None:
+            after = self._created_at_index.entry_of(after_id)
+            if after is None:
+                raise ValueError(f"Order {after_id} not found")
+
+        for _, order_id in islice(self._created_at_index.iter_after(after), limit):
+            order = self._orders.get(order_id)
+            if order is not None:
+                yield order.copy()
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        try:
+            entries = self._time_indexes[self._check_time_field(field)].between(start, end)
+            return Result.ok([self._orders[order_id].copy() for _, order_id in entries])
+        except Exception as e:
+            return Result.fail([e])
+
+    def pending_events(
+        self, limit: int = OrderRepository.DEFAULT_OUTBOX_BATCH_SIZE
+    ) -> Result[list[OutboxMessage]]:
+        try:
+            with self._outbox_lock:
+                messages = list(islice(self._outbox.items(), limit))
+            return Result.ok(
+                [
+                    OutboxMessage(sequence, JsonOrderCodec.decode_event(json.loads(payload)))
+                    for sequence, payload in messages
+                ]
+            )
+        except Exception as e:
+            return Result.fail([e])
+
+    def mark_events_published(self, sequences: Iterable[int]) -> Result[None]:
+        try:
+            with self._outbox_lock:
+                published = [sequence for sequence in sequences if self._outbox.pop(sequence, None)]
+                if published and self._persistence is not None:
+                    self._persistence.mark_published(published)
+            return Result.ok()
         except Exception as e:
             return Result.fail([e])
 
     def clear(self) -> None:
-        self._orders.clear()
+        with self._lock:
+            self._orders.clear()
+            with self._outbox_lock:
+                self._outbox.clear()
+            self._customer_index.clear()
+            for index in self._time_indexes.values():
+                index.clear()
+            if self._persistence is not None:
+                self._persistence.clear()
+
+    def snapshot(self, wait: bool = True) -> bool:
+        if self._persistence is None:
+            return False
+        # Stored orders are replaced on save, never changed in place, so a copy of
+        # the map's values taken under the lock is a consistent view; encoding and
+        # writing it is left to the journal's writer thread. Pending events go into
+        # the same snapshot, as the journals they were appended to are dropped.
+        with self._lock, self._outbox_lock:
+            started = self._persistence.snapshot(
+                list(self._orders.values()), list(self._outbox.items()), wait=False
+            )
+        if started and wait:
+            self._persistence.wait()
+        return started
+
+    def close(self) -> None:
+        if self._persistence is not None:
+            self._persistence.close()
 
     def count(self) -> int:
         return len(self._orders)
 
     def get_all(self) -> Result[list[Order]]:
         try:
-            orders = list(self._orders.values())
-            return Result.ok(orders)
+            return Result.ok([order.copy() for order in self._orders.values()])
         except Exception as e:
             return Result.fail([e])
+
+    @contextmanager
+    def _versioned(self, versioned: List[Tuple[Order, int]]) -> Iterator[None]:
+        # Orders carry their new version while being journaled and stored, and get
+        # their previous one back if any of that fails.
+        # Their events are encoded, journaled and added to the outbox in the same step.
+        previous_versions = [order.version for order, _ in versioned]
+        try:
+            for order, version in versioned:
+                order.version = version
+            with self._outbox_lock:
+                events = self._encode_events(order for order, _ in versioned)
+                if self._persistence is not None:
+                    self._persistence.append([order for order, _ in versioned], events)
+                self._outbox.update(events)
+            yield
+        except Exception:
+            for (order, _), version in zip(versioned, previous_versions):
+                order.version = version
+            raise
+        if self.has_outbox:
+            for order, _ in versioned:
+                order.clear_events()
+
+    def _encode_events(self, orders: Iterable[Order]) -> List[Tuple[int, str]]:
+        if not self.has_outbox:
+            return []
+
+        events = []
+        for order in orders:
+            for data in JsonOrderCodec.encode_events(order):
+                self._outbox_sequence += 1
+                events.append((self._outbox_sequence, JsonOrderCodec.dumps(data)))
+        return events
+
+    def _restore(self, orders: Iterable[Order]) -> None:
+        for order in orders:
+            self._orders[order.id] = order
+
+        # The indexes start out empty here, so each of them is built in one pass.
+        self._customer_index.put_many(
+            (order.id, self._indexed_customer_of(order)) for order in self._orders.values()
+        )
+        self._index_times(self._orders.values())
+
+    def _index_times(self, orders: Iterable[Order]) -> None:
+        orders = list(orders)
+        for field, index in self._time_indexes.items():
+            index.put_many((order.id, getattr(order, field)) for order in orders)
+
+    def _version_of(self, order_id: uuid.UUID) -> int:
+        stored = self._orders.get(order_id)
+        return 0 if stored is None else stored.version
+
+    def _snapshot_if_due(self) -> None:
+        if self._persistence is not None and self._persistence.snapshot_due:
+            self.snapshot(wait=False)
+
+    def _indexed_customer_of(self, order: Order) -> uuid.UUID | None:
+        return None if order.is_deleted else self._customer_key(order.customer_id)
+
+    @staticmethod
+    def _customer_key(customer_id: uuid.UUID | str) -> uuid.UUID:
+        return customer_id if isinstance(customer_id, uuid.UUID) else uuid.UUID(customer_id)
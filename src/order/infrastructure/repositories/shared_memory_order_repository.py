@@ -0,0 +1,429 @@
+import fcntl
+import os
+import struct
+import sys
+import tempfile
+import threading
+import uuid
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import islice
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.order.application.ports import OrderRepository, OrderSaveError
+from src.order.domain import Order
+from src.order.infrastructure.persistence import BinaryOrderCodec
+from src.shared.domain.core import Money, Result
+from src.shared.infrastructure.indexes import SortedIndex
+
+EncodedOrder = Tuple[int, bytes, bytes, int, int, int, int]
+
+
+class SharedMemoryOrderRepository(OrderRepository):
+    # The segment holds an open-addressing table of fixed-size order records keyed
+    # by id, an insertion log of record slots, a customer index made of an
+    # open-addressing table of chain heads plus an append-only array of postings,
+    # and a ring of recently written slots that other processes replay.
+    MAGIC = b"ORDSHM03"
+    # magic, table slots, capacity, order count, posting count, clear epoch, writes
+    HEADER = struct.Struct("<8sIIQQQQ")
+    # flags, id, customer_id, total in cents, created_at, updated_at, deleted_at, version
+    RECORD = struct.Struct("<B16s16sqqqqq")
+    LOG_ENTRY = struct.Struct("<I")
+    # customer_id, first posting + 1 (0 marks an empty slot)
+    CUSTOMER_HEAD = struct.Struct("<16sI")
+    # record slot, next posting + 1 (0 ends the chain)
+    POSTING = struct.Struct("<II")
+    USED = 0x01
+    DELETED = 0x02
+    CHUNK_SIZE = 256
+
+    def __init__(
+        self,
+        name: str = "orders-repository",
+        capacity: int = 100_000,
+        lock_path: Optional[str] = None,
+    ):
+        self._name = name
+        self._capacity = capacity
+        self._slots = 1 << max(1, (2 * capacity - 1).bit_length())
+        self._mask = self._slots - 1
+        self._records_offset = self.HEADER.size
+        self._log_offset = self._records_offset + self._slots * self.RECORD.size
+        self._heads_offset = self._log_offset + capacity * self.LOG_ENTRY.size
+        self._postings_offset = self._heads_offset + self._slots * self.CUSTOMER_HEAD.size
+        self._changes_offset = self._postings_offset + capacity * self.POSTING.size
+        size = self._changes_offset + capacity * self.LOG_ENTRY.size
+
+        self._lock_path = lock_path or os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self._thread_lock = threading.Lock()
+        self._lock_file = open(self._lock_path, "a+b")
+
+        # Local time indexes over the shared records, caught up from the ring of
+        # written slots before every ordered or ranged read.
+        self._time_indexes: Dict[str, SortedIndex[uuid.UUID]] = {
+            field: SortedIndex() for field in self.TIME_FIELDS
+        }
+        self._created_at_index = self._time_indexes["created_at"]
+        self._record_slots: Dict[uuid.UUID, int] = {}
+        self._synced_writes = 0
+        self._synced_epoch = 0
+
+        with self._locked(exclusive=True):
+            self._memory, created = self._open_segment(name, size)
+            self._buffer = self._memory.buf
+            if created:
+                self.HEADER.pack_into(
+                    self._buffer, 0, self.MAGIC, self._slots, capacity, 0, 0, 0, 0
+                )
+            else:
+                magic, slots, existing_capacity, *_ = self.HEADER.unpack_from(self._buffer, 0)
+                if magic != self.MAGIC or slots != self._slots or existing_capacity != capacity:
+                    self._buffer = None
+                    self._memory.close()
+                    raise ValueError(
+                        f"Shared memory segment {name} was created with a different layout"
+                    )
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        try:
+            encoded = self._encode(order)
+            with self._locked(exclusive=True):
+                order.version = self._write(order, encoded, expected_version)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        staged = []
+        errors = []
+        for position, order in enumerate(orders):
+            try:
+                staged.append((order, self._encode(order)))
+            except Exception as e:
+                errors.append(OrderSaveError(position, order, e))
+
+        if errors:
+            return Result.fail(errors)
+
+        try:
+            with self._locked(exclusive=True):
+                # Space is checked up front so a full store never leaves half a batch.
+                count, postings = self.HEADER.unpack_from(self._buffer, 0)[3:5]
+                new_orders, new_postings = self._required_space([encoded for _, encoded in staged])
+                if count + new_orders > self._capacity or postings + new_postings > self._capacity:
+                    raise ValueError(f"Shared order store {self._name} is full")
+                for order, encoded in staged:
+                    order.version = self._write(order, encoded)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        try:
+            with self._locked(exclusive=False):
+                slot, found = self._find_record(order_id.bytes)
+                return Result.ok(self._read(slot) if found else None)
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        try:
+            customer_key = self._customer_key(customer_id).bytes
+            orders = []
+            with self._locked(exclusive=False):
+                index, found = self._find_customer(customer_key)
+                if found:
+                    _, posting = self.CUSTOMER_HEAD.unpack_from(
+                        self._buffer, self._heads_offset + index * self.CUSTOMER_HEAD.size
+                    )
+                    seen = set()
+                    while posting:
+                        slot, posting = self.POSTING.unpack_from(
+                            self._buffer, self._postings_offset + (posting - 1) * self.POSTING.size
+                        )
+                        if slot in seen:
+                            continue
+                        seen.add(slot)
+                        flags, _, record_customer, *_ = self._unpack_record(slot)
+                        # Chains keep postings of orders that moved to another customer,
+                        # so every record is checked against the customer it has now.
+                        if record_customer == customer_key and not flags & self.DELETED:
+                            orders.append(self._read(slot))
+            return Result.ok(orders)
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_all(self) -> Result[list[Order]]:
+        try:
+            with self._locked(exclusive=False):
+                count = self.HEADER.unpack_from(self._buffer, 0)[3]
+                orders = [self._read(self._log_slot(position)) for position in range(count)]
+            return Result.ok(orders)
+        except Exception as e:
+            return Result.fail([e])
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        after = None
+        if after_id is not None:
+            with self._locked(exclusive=False):
+                self._sync_index()
+                after = self._created_at_index.entry_of(after_id)
+            if after is None:
+                raise ValueError(f"Order {after_id} not found")
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = self.CHUNK_SIZE if remaining is None else min(self.CHUNK_SIZE, remaining)
+            with self._locked(exclusive=False):
+                self._sync_index()
+                entries = list(islice(self._created_at_index.iter_after(after), size))
+                orders = [self._read(self._record_slots[order_id]) for _, order_id in entries]
+
+            yield from orders
+
+            if len(entries) < size:
+                return
+
+            after = entries[-1]
+            if remaining is not None:
+                remaining -= len(entries)
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        try:
+            index = self._time_indexes[self._check_time_field(field)]
+            with self._locked(exclusive=False):
+                self._sync_index()
+                entries = index.between(
+                    BinaryOrderCodec.to_micros(start), BinaryOrderCodec.to_micros(end)
+                )
+                return Result.ok(
+                    [self._read(self._record_slots[order_id]) for _, order_id in entries]
+                )
+        except Exception as e:
+            return Result.fail([e])
+
+    def count(self) -> int:
+        with self._locked(exclusive=False):
+            return self.HEADER.unpack_from(self._buffer, 0)[3]
+
+    def clear(self) -> None:
+        with self._locked(exclusive=True):
+            epoch = self.HEADER.unpack_from(self._buffer, 0)[5]
+            self._buffer[self._records_offset :] = bytes(len(self._buffer) - self._records_offset)
+            self.HEADER.pack_into(
+                self._buffer, 0, self.MAGIC, self._slots, self._capacity, 0, 0, epoch + 1, 0
+            )
+
+    def close(self) -> None:
+        with self._thread_lock:
+            if self._buffer is None:
+                return
+            self._buffer = None
+            self._memory.close()
+            self._lock_file.close()
+
+    def unlink(self) -> None:
+        self.close()
+        try:
+            shared_memory.SharedMemory(self._name).unlink()
+        except FileNotFoundError:
+            pass
+        if os.path.exists(self._lock_path):
+            os.remove(self._lock_path)
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        # flock serializes processes; the thread lock is still needed because
+        # threads of one process share the same open file and so the same flock.
+        with self._thread_lock:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _write(
+        self, order: Order, encoded: EncodedOrder, expected_version: Optional[int] = None
+    ) -> int:
+        _, id, customer_id, *_ = encoded
+        header = self.HEADER.unpack_from(self._buffer, 0)
+        magic, slots, capacity, count, postings, epoch, writes = header
+        slot, found = self._find_record(id)
+        previous = self._unpack_record(slot) if found else None
+        previous_customer = previous[2] if found else None
+        version = previous[7] if found else 0
+        self._check_version(order, expected_version, version)
+
+        if not found:
+            if count >= capacity:
+                raise ValueError(f"Shared order store {self._name} is full")
+            self.LOG_ENTRY.pack_into(
+                self._buffer, self._log_offset + count * self.LOG_ENTRY.size, slot
+            )
+            count += 1
+
+        if previous_customer != customer_id:
+            if postings >= capacity:
+                raise ValueError(f"Shared order store {self._name} is full")
+            self._add_posting(customer_id, slot, postings)
+            postings += 1
+
+        self.RECORD.pack_into(
+            self._buffer, self._records_offset + slot * self.RECORD.size, *encoded, version + 1
+        )
+        self.LOG_ENTRY.pack_into(
+            self._buffer, self._changes_offset + writes % capacity * self.LOG_ENTRY.size, slot
+        )
+        self.HEADER.pack_into(
+            self._buffer, 0, magic, slots, capacity, count, postings, epoch, writes + 1
+        )
+        return version + 1
+
+    def _required_space(self, staged: List[EncodedOrder]) -> Tuple[int, int]:
+        new_orders = 0
+        new_postings = 0
+        customers: Dict[bytes, bytes] = {}
+        for _, id, customer_id, *_ in staged:
+            if id in customers:
+                previous_customer = customers[id]
+            else:
+                slot, found = self._find_record(id)
+                previous_customer = self._unpack_record(slot)[2] if found else None
+                new_orders += not found
+            new_postings += previous_customer != customer_id
+            customers[id] = customer_id
+        return new_orders, new_postings
+
+    def _add_posting(self, customer_id: bytes, slot: int, posting: int) -> None:
+        index, found = self._find_customer(customer_id)
+        head_offset = self._heads_offset + index * self.CUSTOMER_HEAD.size
+        next_posting = self.CUSTOMER_HEAD.unpack_from(self._buffer, head_offset)[1] if found else 0
+        self.POSTING.pack_into(
+            self._buffer,
+            self._postings_offset + posting * self.POSTING.size,
+            slot,
+            next_posting,
+        )
+        self.CUSTOMER_HEAD.pack_into(self._buffer, head_offset, customer_id, posting + 1)
+
+    def _find_record(self, id: bytes) -> Tuple[int, bool]:
+        slot = zlib.crc32(id) & self._mask
+        while True:
+            flags, record_id = self.RECORD.unpack_from(
+                self._buffer, self._records_offset + slot * self.RECORD.size
+            )[:2]
+            if not flags & self.USED:
+                return slot, False
+            if record_id == id:
+                return slot, True
+            slot = (slot + 1) & self._mask
+
+    def _find_customer(self, customer_id: bytes) -> Tuple[int, bool]:
+        index = zlib.crc32(customer_id) & self._mask
+        while True:
+            head_customer, head = self.CUSTOMER_HEAD.unpack_from(
+                self._buffer, self._heads_offset + index * self.CUSTOMER_HEAD.size
+            )
+            if not head:
+                return index, False
+            if head_customer == customer_id:
+                return index, True
+            index = (index + 1) & self._mask
+
+    def _sync_index(self) -> None:
+        count, _, epoch, writes = self.HEADER.unpack_from(self._buffer, 0)[3:]
+        if epoch != self._synced_epoch or writes - self._synced_writes > self._capacity:
+            # Cleared meanwhile, or too far behind for the ring to cover the gap.
+            for index in self._time_indexes.values():
+                index.clear()
+            self._record_slots.clear()
+            slots = [self._log_slot(position) for position in range(count)]
+        else:
+            slots = {
+                self.LOG_ENTRY.unpack_from(
+                    self._buffer,
+                    self._changes_offset + write % self._capacity * self.LOG_ENTRY.size,
+                )[0]
+                for write in range(self._synced_writes, writes)
+            }
+
+        entries: Dict[str, List[Tuple[uuid.UUID, Optional[int]]]] = {
+            field: [] for field in self.TIME_FIELDS
+        }
+        for slot in slots:
+            flags, id, _, _, created_at, updated_at, deleted_at, _ = self._unpack_record(slot)
+            order_id = uuid.UUID(bytes=id)
+            self._record_slots[order_id] = slot
+            entries["created_at"].append((order_id, created_at))
+            entries["updated_at"].append((order_id, updated_at))
+            entries["deleted_at"].append((order_id, deleted_at if flags & self.DELETED else None))
+        for field, index in self._time_indexes.items():
+            index.put_many(entries[field])
+
+        self._synced_writes = writes
+        self._synced_epoch = epoch
+
+    def _log_slot(self, position: int) -> int:
+        return self.LOG_ENTRY.unpack_from(
+            self._buffer, self._log_offset + position * self.LOG_ENTRY.size
+        )[0]
+
+    def _unpack_record(self, slot: int) -> tuple:
+        return self.RECORD.unpack_from(self._buffer, self._records_offset + slot * self.RECORD.size)
+
+    def _read(self, slot: int) -> Order:
+        flags, id, customer_id, total, created_at, updated_at, deleted_at, version = (
+            self._unpack_record(slot)
+        )
+        epoch = BinaryOrderCodec.EPOCH
+        return Order(
+            id=uuid.UUID(bytes=id),
+            customer_id=uuid.UUID(bytes=customer_id),
+            total=Money(total),
+            created_at=epoch + timedelta(microseconds=created_at),
+            updated_at=epoch + timedelta(microseconds=updated_at),
+            deleted_at=(
+                epoch + timedelta(microseconds=deleted_at) if flags & self.DELETED else None
+            ),
+            version=version,
+        )
+
+    @classmethod
+    def _encode(cls, order: Order) -> EncodedOrder:
+        deleted_at = order.deleted_at
+        return (
+            cls.USED | (cls.DELETED if deleted_at is not None else 0),
+            order.id.bytes,
+            cls._customer_key(order.customer_id).bytes,
+            BinaryOrderCodec.total_cents(order),
+            BinaryOrderCodec.to_micros(order.created_at),
+            BinaryOrderCodec.to_micros(order.updated_at),
+            BinaryOrderCodec.to_micros(deleted_at) if deleted_at is not None else 0,
+        )
+
+    @staticmethod
+    def _open_segment(name: str, size: int) -> Tuple[shared_memory.SharedMemory, bool]:
+        # The segment must outlive any single worker, so it is kept away from the
+        # resource tracker, which would otherwise unlink it when its creator exits.
+        options = {"track": False} if sys.version_info >= (3, 13) else {}
+        try:
+            memory = shared_memory.SharedMemory(name, create=True, size=size, **options)
+            created = True
+        except FileExistsError:
+            memory = shared_memory.SharedMemory(name, **options)
+            created = False
+
+        if not options:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return memory, created
+
+    @staticmethod
+    def _customer_key(customer_id: uuid.UUID | str) -> uuid.UUID:
+        return customer_id if isinstance(customer_id, uuid.UUID) else uuid.UUID(customer_id)
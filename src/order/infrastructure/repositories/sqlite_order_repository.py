@@ -0,0 +1,507 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.order.application.ports import (
+    OrderRepository,
+    OrderSaveError,
+    OrderVersionConflictError,
+    OutboxMessage,
+)
+from src.order.domain import Order
+from src.order.infrastructure.persistence import JsonOrderCodec
+from src.shared.domain.core import Money, Result
+
+OrderRow = Tuple[str, str, int, str, str, str, Optional[str]]
+StoredOrderRow = Tuple[str, str, int, str, str, str, Optional[str], int]
+
+logger = logging.getLogger(__name__)
+
+
+class CommitGroup:
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        # Saved orders with the version and events they had before, restored if the
+        # group commit fails.
+        self.orders: List[Tuple[Order, int, list]] = []
+        self.done = False
+        self.error: Optional[Exception] = None
+
+
+class SqliteOrderRepository(OrderRepository):
+    # Saves are grouped into one transaction per group commit. The group is committed
+    # once it holds batch_size saves, by the flusher thread after max_batch_delay, or,
+    # with wait_for_commit, as soon as no other save is waiting to join it; save then
+    # returns the result of that commit. Without wait_for_commit, save returns before
+    # the commit and a failed group commit loses saves that were already reported ok.
+    # Statements are constant strings so sqlite3's per-connection statement cache
+    # compiles each of them once and reuses the prepared handle on every call.
+    CREATE_TABLE_SQL = (
+        "CREATE TABLE IF NOT EXISTS orders ("
+        "id TEXT PRIMARY KEY, "
+        "customer_id TEXT NOT NULL, "
+        "total_cents INTEGER NOT NULL, "
+        "currency TEXT NOT NULL, "
+        "created_at TEXT NOT NULL, "
+        "updated_at TEXT NOT NULL, "
+        "deleted_at TEXT, "
+        "version INTEGER NOT NULL)"
+    )
+    CREATE_CUSTOMER_INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS orders_customer_id_idx ON orders (customer_id)"
+    )
+    CREATE_CREATED_AT_INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS orders_created_at_idx ON orders (created_at, id)"
+    )
+    CREATE_UPDATED_AT_INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS orders_updated_at_idx ON orders (updated_at, id)"
+    )
+    CREATE_DELETED_AT_INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS orders_deleted_at_idx ON orders (deleted_at, id)"
+    )
+    UPSERT_SQL = (
+        "INSERT INTO orders (id, customer_id, total_cents, currency, created_at, updated_at, "
+        "deleted_at, version) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, 1) "
+        "ON CONFLICT(id) DO UPDATE SET customer_id = excluded.customer_id, "
+        "total_cents = excluded.total_cents, currency = excluded.currency, "
+        "created_at = excluded.created_at, updated_at = excluded.updated_at, "
+        "deleted_at = excluded.deleted_at, "
+        "version = orders.version + 1"
+    )
+    UPSERT_RETURNING_SQL = UPSERT_SQL + " RETURNING version"
+    INSERT_NEW_SQL = (
+        "INSERT INTO orders (id, customer_id, total_cents, currency, created_at, updated_at, "
+        "deleted_at, version) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, 1) ON CONFLICT(id) DO NOTHING RETURNING version"
+    )
+    UPDATE_IF_VERSION_SQL = (
+        "UPDATE orders SET customer_id = ?, total_cents = ?, currency = ?, created_at = ?, "
+        "updated_at = ?, deleted_at = ?, version = version + 1 "
+        "WHERE id = ? AND version = ? RETURNING version"
+    )
+    SELECT_VERSION_SQL = "SELECT version FROM orders WHERE id = ?"
+    # Versions of a whole batch in one query; ids are passed as a JSON array.
+    SELECT_VERSIONS_SQL = (
+        "SELECT id, version FROM orders WHERE id IN (SELECT value FROM json_each(?))"
+    )
+    SELECT_BY_ID_SQL = (
+        "SELECT id, customer_id, total_cents, currency, created_at, updated_at, deleted_at, "
+        "version "
+        "FROM orders WHERE id = ?"
+    )
+    SELECT_BY_CUSTOMER_SQL = (
+        "SELECT id, customer_id, total_cents, currency, created_at, updated_at, deleted_at, "
+        "version "
+        "FROM orders WHERE customer_id = ? AND deleted_at IS NULL"
+    )
+    SELECT_ALL_SQL = (
+        "SELECT id, customer_id, total_cents, currency, created_at, updated_at, deleted_at, "
+        "version "
+        "FROM orders ORDER BY created_at, id"
+    )
+    SELECT_FIRST_PAGE_SQL = (
+        "SELECT id, customer_id, total_cents, currency, created_at, updated_at, deleted_at, "
+        "version "
+        "FROM orders ORDER BY created_at, id LIMIT ?"
+    )
+    SELECT_PAGE_SQL = (
+        "SELECT id, customer_id, total_cents, currency, created_at, updated_at, deleted_at, "
+        "version "
+        "FROM orders WHERE (created_at, id) > (?, ?) ORDER BY created_at, id LIMIT ?"
+    )
+    FIND_BETWEEN_SQL = {
+        field: (
+            "SELECT id, customer_id, total_cents, currency, created_at, updated_at, deleted_at, "
+            "version "
+            f"FROM orders WHERE {field} >= ? AND {field} < ? ORDER BY {field}, id"
+        )
+        for field in OrderRepository.TIME_FIELDS
+    }
+    SELECT_PAGE_KEY_SQL = "SELECT created_at, id FROM orders WHERE id = ?"
+    COUNT_SQL = "SELECT COUNT(*) FROM orders"
+    DELETE_ALL_SQL = "DELETE FROM orders"
+    CREATE_OUTBOX_TABLE_SQL = (
+        "CREATE TABLE IF NOT EXISTS order_outbox ("
+        "sequence INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "event TEXT NOT NULL)"
+    )
+    INSERT_OUTBOX_SQL = "INSERT INTO order_outbox (event) VALUES (?)"
+    SELECT_OUTBOX_SQL = "SELECT sequence, event FROM order_outbox ORDER BY sequence LIMIT ?"
+    DELETE_OUTBOX_SQL = (
+        "DELETE FROM order_outbox WHERE sequence IN (SELECT value FROM json_each(?))"
+    )
+    DELETE_ALL_OUTBOX_SQL = "DELETE FROM order_outbox"
+    CHUNK_SIZE = 256
+
+    def __init__(
+        self,
+        database: str = ":memory:",
+        batch_size: int = 64,
+        max_batch_delay: float = 0.05,
+        outbox: bool = False,
+        wait_for_commit: bool = True,
+    ):
+        self.has_outbox = outbox
+        self._batch_size = max(1, batch_size)
+        self._max_batch_delay = max_batch_delay
+        self._wait_for_commit = wait_for_commit
+        self._group: Optional[CommitGroup] = None
+        self._lock = threading.RLock()
+        self._group_opened = threading.Condition(self._lock)
+        self._group_done = threading.Condition(self._lock)
+        # Saves waiting for the lock, which will join the open group.
+        self._arriving = 0
+        self._arrivals_lock = threading.Lock()
+        self._closed = False
+        self._connection = sqlite3.connect(
+            database,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=64,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA temp_store=MEMORY")
+        self._connection.execute(self.CREATE_TABLE_SQL)
+        self._connection.execute(self.CREATE_CUSTOMER_INDEX_SQL)
+        self._connection.execute(self.CREATE_CREATED_AT_INDEX_SQL)
+        self._connection.execute(self.CREATE_UPDATED_AT_INDEX_SQL)
+        self._connection.execute(self.CREATE_DELETED_AT_INDEX_SQL)
+        if outbox:
+            self._connection.execute(self.CREATE_OUTBOX_TABLE_SQL)
+
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name="order-sqlite-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        with self._arrivals_lock:
+            self._arriving += 1
+        with self._lock:
+            with self._arrivals_lock:
+                self._arriving -= 1
+
+            group = None
+            error = None
+            try:
+                group = self._open_group()
+                previous = (order, order.version, list(order.get_events()))
+                order.version = self._write_with_events(order, expected_version)
+                group.orders.append(previous)
+            except Exception as e:
+                group = None
+                error = e
+
+            if self._commit_due():
+                self._commit_group()
+            if error is not None:
+                return Result.fail([error])
+
+            if self._wait_for_commit:
+                self._group_done.wait_for(lambda: group.done)
+                if group.error is not None:
+                    return Result.fail([group.error])
+            return Result.ok()
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        orders = list(orders)
+        rows = []
+        events = []
+        errors = []
+        for position, order in enumerate(orders):
+            try:
+                rows.append(self._to_row(order))
+                events.extend(self._event_rows(order))
+            except Exception as e:
+                errors.append(OrderSaveError(position, order, e))
+
+        if errors:
+            return Result.fail(errors)
+
+        with self._lock:
+            try:
+                self._commit_group()
+                self._connection.execute("BEGIN")
+                self._connection.executemany(self.UPSERT_SQL, rows)
+                if events:
+                    self._connection.executemany(self.INSERT_OUTBOX_SQL, events)
+                versions = dict(
+                    self._connection.execute(
+                        self.SELECT_VERSIONS_SQL, (json.dumps([row[0] for row in rows]),)
+                    )
+                )
+                self._connection.execute("COMMIT")
+                for order in orders:
+                    order.version = versions[str(order.id)]
+                    if self.has_outbox:
+                        order.clear_events()
+                return Result.ok()
+            except Exception as e:
+                self._rollback()
+                return Result.fail([e])
+
+    def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        with self._lock:
+            try:
+                row = self._connection.execute(self.SELECT_BY_ID_SQL, (str(order_id),)).fetchone()
+                return Result.ok(self._from_row(row) if row else None)
+            except Exception as e:
+                return Result.fail([e])
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        with self._lock:
+            try:
+                rows = self._connection.execute(
+                    self.SELECT_BY_CUSTOMER_SQL, (self._customer_key(customer_id),)
+                ).fetchall()
+                return Result.ok([self._from_row(row) for row in rows])
+            except Exception as e:
+                return Result.fail([e])
+
+    def get_all(self) -> Result[list[Order]]:
+        with self._lock:
+            try:
+                rows = self._connection.execute(self.SELECT_ALL_SQL).fetchall()
+                return Result.ok([self._from_row(row) for row in rows])
+            except Exception as e:
+                return Result.fail([e])
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        after = None
+        if after_id is not None:
+            with self._lock:
+                after = self._connection.execute(
+                    self.SELECT_PAGE_KEY_SQL, (str(after_id),)
+                ).fetchone()
+            if after is None:
+                raise ValueError(f"Order {after_id} not found")
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = self.CHUNK_SIZE if remaining is None else min(self.CHUNK_SIZE, remaining)
+            with self._lock:
+                if after is None:
+                    rows = self._connection.execute(self.SELECT_FIRST_PAGE_SQL, (size,)).fetchall()
+                else:
+                    rows = self._connection.execute(self.SELECT_PAGE_SQL, (*after, size)).fetchall()
+
+            for row in rows:
+                yield self._from_row(row)
+
+            if len(rows) < size:
+                return
+
+            after = (rows[-1][4], rows[-1][0])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        with self._lock:
+            try:
+                rows = self._connection.execute(
+                    self.FIND_BETWEEN_SQL[self._check_time_field(field)],
+                    (
+                        start.isoformat(timespec="microseconds"),
+                        end.isoformat(timespec="microseconds"),
+                    ),
+                ).fetchall()
+                return Result.ok([self._from_row(row) for row in rows])
+            except Exception as e:
+                return Result.fail([e])
+
+    def pending_events(
+        self, limit: int = OrderRepository.DEFAULT_OUTBOX_BATCH_SIZE
+    ) -> Result[list[OutboxMessage]]:
+        if not self.has_outbox:
+            return Result.ok([])
+
+        with self._lock:
+            try:
+                # Only committed events are handed out, so the relay never publishes
+                # an order that a failed group commit later rolls back.
+                self.flush()
+                rows = self._connection.execute(self.SELECT_OUTBOX_SQL, (limit,)).fetchall()
+                return Result.ok(
+                    [
+                        OutboxMessage(sequence, JsonOrderCodec.decode_event(json.loads(event)))
+                        for sequence, event in rows
+                    ]
+                )
+            except Exception as e:
+                return Result.fail([e])
+
+    def mark_events_published(self, sequences: Iterable[int]) -> Result[None]:
+        if not self.has_outbox:
+            return Result.ok()
+
+        with self._lock:
+            try:
+                self._connection.execute(self.DELETE_OUTBOX_SQL, (json.dumps(list(sequences)),))
+                return Result.ok()
+            except Exception as e:
+                return Result.fail([e])
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute(self.COUNT_SQL).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.flush()
+            self._connection.execute(self.DELETE_ALL_SQL)
+            if self.has_outbox:
+                self._connection.execute(self.DELETE_ALL_OUTBOX_SQL)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._commit_group()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._group_opened.notify_all()
+        self._flusher.join()
+        with self._lock:
+            self.flush()
+            self._connection.close()
+
+    def _open_group(self) -> CommitGroup:
+        if self._group is None:
+            self._connection.execute("BEGIN")
+            self._group = CommitGroup(time.monotonic())
+            self._group_opened.notify_all()
+        return self._group
+
+    def _commit_due(self) -> bool:
+        if self._group is None:
+            return False
+        if len(self._group.orders) >= self._batch_size:
+            return True
+        # The last of a burst of concurrent saves commits for all of them; a save
+        # nobody else is waiting behind commits straight away.
+        return self._wait_for_commit and self._arriving == 0
+
+    def _commit_group(self) -> None:
+        group, self._group = self._group, None
+        if group is None:
+            return
+
+        try:
+            self._connection.execute("COMMIT")
+        except Exception as e:
+            self._rollback()
+            for order, version, events in reversed(group.orders):
+                order.version = version
+                order.clear_events()
+                for event in events:
+                    order.add_domain_event(event)
+            group.error = e
+            if not self._wait_for_commit:
+                logger.error("Group commit of %d orders failed: %s", len(group.orders), e)
+        finally:
+            group.done = True
+            self._group_done.notify_all()
+
+    def _run_flusher(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if self._group is None:
+                    self._group_opened.wait()
+                    continue
+                remaining = self._group.started_at + self._max_batch_delay - time.monotonic()
+                if remaining > 0:
+                    self._group_opened.wait(remaining)
+                    continue
+                self._commit_group()
+
+    def _write_with_events(self, order: Order, expected_version: Optional[int]) -> int:
+        events = self._event_rows(order)
+        if not events:
+            return self._write(order, expected_version)
+
+        # The savepoint undoes a half-written save without touching the other saves
+        # of the pending group commit.
+        self._connection.execute("SAVEPOINT order_events")
+        try:
+            version = self._write(order, expected_version)
+            self._connection.executemany(self.INSERT_OUTBOX_SQL, events)
+        except Exception:
+            self._connection.execute("ROLLBACK TO order_events")
+            raise
+        finally:
+            self._connection.execute("RELEASE order_events")
+        order.clear_events()
+        return version
+
+    def _event_rows(self, order: Order) -> list[Tuple[str]]:
+        if not self.has_outbox:
+            return []
+        return [(JsonOrderCodec.dumps(data),) for data in JsonOrderCodec.encode_events(order)]
+
+    def _write(self, order: Order, expected_version: Optional[int]) -> int:
+        # A statement that matched nothing changed nothing, so a conflict leaves the
+        # pending group commit intact.
+        row = self._to_row(order)
+        if expected_version is None:
+            rows = self._connection.execute(self.UPSERT_RETURNING_SQL, row).fetchall()
+        elif expected_version == 0:
+            rows = self._connection.execute(self.INSERT_NEW_SQL, row).fetchall()
+        else:
+            rows = self._connection.execute(
+                self.UPDATE_IF_VERSION_SQL, (*row[1:], row[0], expected_version)
+            ).fetchall()
+
+        if not rows:
+            current = self._connection.execute(self.SELECT_VERSION_SQL, (row[0],)).fetchone()
+            raise OrderVersionConflictError(
+                order.id, expected_version, current[0] if current else 0
+            )
+        return rows[0][0]
+
+    def _rollback(self) -> None:
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
+
+    @classmethod
+    def _to_row(cls, order: Order) -> OrderRow:
+        return (
+            str(order.id),
+            cls._customer_key(order.customer_id),
+            order.total.amount,
+            order.total.currency,
+            order.created_at.isoformat(timespec="microseconds"),
+            order.updated_at.isoformat(timespec="microseconds"),
+            order.deleted_at.isoformat(timespec="microseconds") if order.deleted_at else None,
+        )
+
+    @staticmethod
+    def _customer_key(customer_id: uuid.UUID | str) -> str:
+        if isinstance(customer_id, uuid.UUID):
+            return str(customer_id)
+        return str(uuid.UUID(customer_id))
+
+    @staticmethod
+    def _from_row(row: StoredOrderRow) -> Order:
+        id, customer_id, cents, currency, created_at, updated_at, deleted_at, version = row
+        return Order.load(
+            id=id,
+            customer_id=customer_id,
+            total=Money(cents, currency),
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            deleted_at=datetime.fromisoformat(deleted_at) if deleted_at else None,
+            version=version,
+        ).value
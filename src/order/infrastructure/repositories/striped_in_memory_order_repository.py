@@ -0,0 +1,198 @@
+import heapq
+import threading
+import uuid
+from contextlib import ExitStack
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.order.application.ports import OrderRepository, OrderSaveError
+from src.order.domain import Order
+from src.shared.domain.core import Result
+from src.shared.infrastructure.indexes import HashIndex, IndexEntry, SortedIndex
+
+
+class OrderShard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Holds copies, so only a save changes what is stored.
+        self.orders: Dict[uuid.UUID, Order] = {}
+        self.customer_index: HashIndex[uuid.UUID, uuid.UUID] = HashIndex()
+        self.time_indexes: Dict[str, SortedIndex[uuid.UUID]] = {
+            field: SortedIndex() for field in OrderRepository.TIME_FIELDS
+        }
+        self.created_at_index = self.time_indexes["created_at"]
+
+    def put(self, order: Order, customer_id: uuid.UUID | None) -> None:
+        order.version = self.version_of(order.id) + 1
+        self.orders[order.id] = order.copy()
+        self.customer_index.put(order.id, customer_id)
+        for field, index in self.time_indexes.items():
+            index.put(order.id, getattr(order, field))
+
+    def version_of(self, order_id: uuid.UUID) -> int:
+        stored = self.orders.get(order_id)
+        return 0 if stored is None else stored.version
+
+    def clear(self) -> None:
+        self.orders.clear()
+        self.customer_index.clear()
+        for index in self.time_indexes.values():
+            index.clear()
+
+
+class StripedInMemoryOrderRepository(OrderRepository):
+    CHUNK_SIZE = 256
+
+    def __init__(self, shards: int = 16):
+        self._shards = [OrderShard() for _ in range(max(1, shards))]
+
+    def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        try:
+            customer_id = self._indexed_customer_of(order)
+            shard = self._shard_for(order.id)
+            with shard.lock:
+                self._check_version(order, expected_version, shard.version_of(order.id))
+                shard.put(order, customer_id)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        staged: Dict[int, List[Tuple[Order, uuid.UUID | None]]] = {}
+        errors = []
+        for position, order in enumerate(orders):
+            try:
+                shard_index = self._shard_index(order.id)
+                staged.setdefault(shard_index, []).append((order, self._indexed_customer_of(order)))
+            except Exception as e:
+                errors.append(OrderSaveError(position, order, e))
+
+        if errors:
+            return Result.fail(errors)
+
+        try:
+            shards = [self._shards[shard_index] for shard_index in sorted(staged)]
+            with self._locked(shards):
+                for shard_index, items in staged.items():
+                    shard = self._shards[shard_index]
+                    for order, customer_id in items:
+                        shard.put(order, customer_id)
+            return Result.ok()
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        try:
+            shard = self._shard_for(order_id)
+            with shard.lock:
+                order = shard.orders.get(order_id)
+            return Result.ok(None if order is None else order.copy())
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        try:
+            customer_key = self._customer_key(customer_id)
+            orders = []
+            for shard in self._shards:
+                with shard.lock:
+                    orders.extend(
+                        shard.orders[order_id]
+                        for order_id in shard.customer_index.get(customer_key)
+                    )
+            return Result.ok([order.copy() for order in orders if not order.is_deleted])
+        except Exception as e:
+            return Result.fail([e])
+
+    def get_all(self) -> Result[list[Order]]:
+        try:
+            with self._locked(self._shards):
+                orders = [order for shard in self._shards for order in shard.orders.values()]
+            return Result.ok([order.copy() for order in orders])
+        except Exception as e:
+            return Result.fail([e])
+
+    def iter_orders(
+        self, after_id: uuid.UUID | None = None, limit: int | None = None
+    ) -> Iterator[Order]:
+        after = None
+        if after_id is not None:
+            shard = self._shard_for(after_id)
+            with shard.lock:
+                after = shard.created_at_index.entry_of(after_id)
+            if after is None:
+                raise ValueError(f"Order {after_id} not found")
+
+        merged = heapq.merge(
+            *(self._iter_shard(shard, after) for shard in self._shards),
+            key=lambda item: item[0],
+        )
+        for _, order in islice(merged, limit):
+            yield order.copy()
+
+    def find_between(
+        self, start: datetime, end: datetime, field: str = "created_at"
+    ) -> Result[list[Order]]:
+        try:
+            self._check_time_field(field)
+            matches = []
+            for shard in self._shards:
+                with shard.lock:
+                    matches.append(
+                        [
+                            (entry, shard.orders[entry[1]])
+                            for entry in shard.time_indexes[field].between(start, end)
+                        ]
+                    )
+            merged = heapq.merge(*matches, key=lambda item: item[0])
+            return Result.ok([order.copy() for _, order in merged])
+        except Exception as e:
+            return Result.fail([e])
+
+    def count(self) -> int:
+        with self._locked(self._shards):
+            return sum(len(shard.orders) for shard in self._shards)
+
+    def clear(self) -> None:
+        with self._locked(self._shards):
+            for shard in self._shards:
+                shard.clear()
+
+    def _iter_shard(
+        self, shard: OrderShard, after: Optional[IndexEntry]
+    ) -> Iterator[Tuple[IndexEntry, Order]]:
+        # Each chunk is read under the shard lock and the lock is released before
+        # yielding, so a slow consumer never blocks writers to the shard.
+        while True:
+            with shard.lock:
+                chunk = [
+                    (entry, shard.orders[entry[1]])
+                    for entry in islice(shard.created_at_index.iter_after(after), self.CHUNK_SIZE)
+                ]
+            if not chunk:
+                return
+            yield from chunk
+            after = chunk[-1][0]
+
+    def _shard_for(self, order_id: uuid.UUID) -> OrderShard:
+        return self._shards[self._shard_index(order_id)]
+
+    def _shard_index(self, order_id: uuid.UUID) -> int:
+        return hash(order_id) % len(self._shards)
+
+    @staticmethod
+    def _locked(shards: Sequence[OrderShard]) -> ExitStack:
+        # Shards are always locked in index order so concurrent multi-shard
+        # operations cannot deadlock each other.
+        stack = ExitStack()
+        for shard in shards:
+            stack.enter_context(shard.lock)
+        return stack
+
+    def _indexed_customer_of(self, order: Order) -> uuid.UUID | None:
+        return None if order.is_deleted else self._customer_key(order.customer_id)
+
+    @staticmethod
+    def _customer_key(customer_id: uuid.UUID | str) -> uuid.UUID:
+        return customer_id if isinstance(customer_id, uuid.UUID) else uuid.UUID(customer_id)
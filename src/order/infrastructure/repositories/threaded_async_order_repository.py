@@ -0,0 +1,58 @@
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, TypeVar
+
+from src.order.application.ports import AsyncOrderRepository, OrderRepository
+from src.order.domain import Order
+from src.shared.domain.core import Result
+
+T = TypeVar("T")
+
+
+class ThreadedAsyncOrderRepository(AsyncOrderRepository):
+    # The SQLite and file backends serialize every call on one lock, so a single
+    # worker thread already keeps them busy; more workers would only queue on it.
+    def __init__(self, repository: OrderRepository, max_workers: int = 1):
+        self._repository = repository
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="order-repository"
+        )
+
+    @property
+    def repository(self) -> OrderRepository:
+        return self._repository
+
+    @property
+    def has_outbox(self) -> bool:
+        return self._repository.has_outbox
+
+    async def save(self, order: Order, expected_version: Optional[int] = None) -> Result[None]:
+        return await self._run(self._repository.save, order, expected_version)
+
+    async def save_many(self, orders: Iterable[Order]) -> Result[None]:
+        return await self._run(self._repository.save_many, list(orders))
+
+    async def get_by_id(self, order_id: uuid.UUID) -> Result[Optional[Order]]:
+        return await self._run(self._repository.get_by_id, order_id)
+
+    async def get_by_customer(self, customer_id: uuid.UUID | str) -> Result[list[Order]]:
+        return await self._run(self._repository.get_by_customer, customer_id)
+
+    async def get_all(self) -> Result[list[Order]]:
+        return await self._run(self._get_all)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        close = getattr(self._repository, "close", None)
+        if close is not None:
+            close()
+
+    async def _run(self, function: Callable[..., T], *args) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _get_all(self) -> Result[list[Order]]:
+        try:
+            return Result.ok(list(self._repository.iter_orders()))
+        except Exception as e:
+            return Result.fail([e])
@@ -1,3 +1,3 @@
-from .factory import UseCaseFactory
+from .factory import IdempotencyFactory, UseCaseFactory
 
-__all__ = ["UseCaseFactory"]
+__all__ = ["IdempotencyFactory", "UseCaseFactory"]
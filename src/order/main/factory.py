@@ -1,20 +1,162 @@
-from src.order.application.ports import OrderRepository
-from src.order.application.usecases import CreateOrderUseCase
-from src.order.infrastructure.repositories import InMemoryOrderRepository
+import atexit
+import os
+
+from src.order.application.ports import AsyncOrderRepository, OrderRepository
+from src.order.application.usecases import AsyncCreateOrderUseCase, CreateOrderUseCase
+from src.order.infrastructure.outbox import OutboxRelay
+from src.order.infrastructure.persistence import SnapshotJournal
+from src.order.infrastructure.repositories import (
+    AsyncInMemoryOrderRepository,
+    CachingOrderRepository,
+    ColumnarOrderRepository,
+    FileOrderRepository,
+    InMemoryOrderRepository,
+    SharedMemoryOrderRepository,
+    SqliteOrderRepository,
+    StripedInMemoryOrderRepository,
+    ThreadedAsyncOrderRepository,
+)
 from src.shared.domain.events import DomainEventPublisher
+from src.shared.infrastructure.events import QueuedDomainEventPublisher
 from src.shared.infrastructure.events.handlers import ConsoleLogHandler
+from src.shared.infrastructure.idempotency import (
+    IdempotencyGuard,
+    InMemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
 
 
 class RepositoryFactory:
+    IN_PROCESS_BACKENDS = ("memory", "columnar", "striped")
+    OUTBOX_BACKENDS = ("memory", "sqlite", "file")
+
     @staticmethod
     def order_repository() -> OrderRepository:
-        return InMemoryOrderRepository()
+        repository = RepositoryFactory._order_repository_backend()
+
+        cache_size = int(os.getenv("ORDER_REPOSITORY_CACHE_SIZE", "0"))
+        if cache_size > 0:
+            cache_ttl = os.getenv("ORDER_REPOSITORY_CACHE_TTL")
+            return CachingOrderRepository(
+                repository,
+                max_size=cache_size,
+                ttl=float(cache_ttl) if cache_ttl else None,
+            )
+
+        return repository
+
+    @staticmethod
+    def _order_repository_backend() -> OrderRepository:
+        backend = os.getenv("ORDER_REPOSITORY_BACKEND", "memory")
+        outbox = os.getenv("ORDER_OUTBOX", "0") == "1"
+        if outbox and backend not in RepositoryFactory.OUTBOX_BACKENDS:
+            raise ValueError(f"Order repository backend {backend} has no outbox")
+
+        if backend == "memory":
+            directory = os.getenv("ORDER_MEMORY_SNAPSHOT_DIRECTORY")
+            if not directory:
+                return InMemoryOrderRepository(outbox=outbox)
+            repository = InMemoryOrderRepository(
+                persistence=SnapshotJournal(directory), outbox=outbox
+            )
+            atexit.register(repository.close)
+            return repository
+
+        if backend == "columnar":
+            return ColumnarOrderRepository()
+
+        if backend == "striped":
+            return StripedInMemoryOrderRepository(int(os.getenv("ORDER_MEMORY_SHARDS", "16")))
+
+        if backend == "shared":
+            repository = SharedMemoryOrderRepository(
+                name=os.getenv("ORDER_SHARED_MEMORY_NAME", "orders-repository"),
+                capacity=int(os.getenv("ORDER_SHARED_MEMORY_CAPACITY", "100000")),
+            )
+            atexit.register(repository.close)
+            return repository
+
+        if backend == "sqlite":
+            repository = SqliteOrderRepository(
+                database=os.getenv("ORDER_SQLITE_PATH", "orders.sqlite3"),
+                batch_size=int(os.getenv("ORDER_SQLITE_BATCH_SIZE", "64")),
+                max_batch_delay=float(os.getenv("ORDER_SQLITE_MAX_BATCH_DELAY", "0.05")),
+                outbox=outbox,
+                wait_for_commit=os.getenv("ORDER_SQLITE_WAIT_FOR_COMMIT", "1") != "0",
+            )
+            atexit.register(repository.close)
+            return repository
+
+        if backend == "file":
+            repository = FileOrderRepository(
+                os.getenv("ORDER_FILE_DIRECTORY", "orders-data"), outbox=outbox
+            )
+            repository.start_compactor(float(os.getenv("ORDER_FILE_COMPACTION_INTERVAL", "300")))
+            atexit.register(repository.close)
+            return repository
+
+        raise ValueError(f"Unknown order repository backend: {backend}")
+
+    @staticmethod
+    def async_order_repository() -> AsyncOrderRepository:
+        repository = RepositoryFactory.order_repository()
+        backend = os.getenv("ORDER_REPOSITORY_BACKEND", "memory")
+        # With a snapshot directory the memory store journals every save to disk, so
+        # it is no longer cheap enough to be called inline on the event loop.
+        journaled = backend == "memory" and bool(os.getenv("ORDER_MEMORY_SNAPSHOT_DIRECTORY"))
+        if backend in RepositoryFactory.IN_PROCESS_BACKENDS and not journaled:
+            return AsyncInMemoryOrderRepository(repository)
+        return ThreadedAsyncOrderRepository(
+            repository, max_workers=int(os.getenv("ORDER_REPOSITORY_ASYNC_WORKERS", "1"))
+        )
+
+
+class IdempotencyFactory:
+    @staticmethod
+    def idempotency_guard() -> IdempotencyGuard:
+        ttl = float(os.getenv("ORDER_IDEMPOTENCY_TTL", "86400"))
+        backend = None
+        path = os.getenv("ORDER_IDEMPOTENCY_SQLITE_PATH")
+        if path:
+            backend = SqliteIdempotencyStore(path, ttl=ttl)
+            atexit.register(backend.close)
+        store = InMemoryIdempotencyStore(
+            max_size=int(os.getenv("ORDER_IDEMPOTENCY_CACHE_SIZE", "10000")),
+            ttl=ttl,
+            backend=backend,
+        )
+        return IdempotencyGuard(store)
 
 
 class EventFactory:
     @staticmethod
     def domain_event_publisher() -> DomainEventPublisher:
-        return DomainEventPublisher()
+        workers = int(os.getenv("ORDER_EVENT_WORKERS", "0"))
+        if workers <= 0:
+            return DomainEventPublisher()
+
+        block_timeout = os.getenv("ORDER_EVENT_BLOCK_TIMEOUT")
+        publisher = QueuedDomainEventPublisher(
+            max_queue_size=int(os.getenv("ORDER_EVENT_QUEUE_SIZE", "1000")),
+            workers=workers,
+            policy=os.getenv("ORDER_EVENT_OVERFLOW", QueuedDomainEventPublisher.BLOCK),
+            block_timeout=float(block_timeout) if block_timeout else None,
+        )
+        atexit.register(publisher.close, 30.0)
+        return publisher
+
+    @staticmethod
+    def outbox_relay(repository: OrderRepository, publisher: DomainEventPublisher) -> OutboxRelay:
+        relay = OutboxRelay(
+            repository,
+            publisher,
+            batch_size=int(os.getenv("ORDER_OUTBOX_BATCH_SIZE", "100")),
+            interval=float(os.getenv("ORDER_OUTBOX_INTERVAL", "0.5")),
+        )
+        relay.start()
+        # Registered after the publisher and the repository, so it runs first at exit.
+        atexit.register(relay.close)
+        return relay
 
 
 class UseCaseFactory:
@@ -22,7 +164,22 @@ class UseCaseFactory:
     def create_order_use_case() -> CreateOrderUseCase:
         event_publisher = EventFactory.domain_event_publisher()
         event_publisher.subscribe("OrderCreatedEvent", ConsoleLogHandler())
+        repository = RepositoryFactory.order_repository()
+        if repository.has_outbox:
+            EventFactory.outbox_relay(repository, event_publisher)
         return CreateOrderUseCase(
-            repository=RepositoryFactory.order_repository(),
+            repository=repository,
+            domain_event_publisher=event_publisher,
+        )
+
+    @staticmethod
+    def async_create_order_use_case() -> AsyncCreateOrderUseCase:
+        event_publisher = EventFactory.domain_event_publisher()
+        event_publisher.subscribe("OrderCreatedEvent", ConsoleLogHandler())
+        repository = RepositoryFactory.async_order_repository()
+        if repository.has_outbox:
+            EventFactory.outbox_relay(repository.repository, event_publisher)
+        return AsyncCreateOrderUseCase(
+            repository=repository,
             domain_event_publisher=event_publisher,
         )
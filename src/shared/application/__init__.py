@@ -1,3 +1,4 @@
+from src.shared.application.async_use_case import AsyncUseCase
 from src.shared.application.use_case import UseCase
 
-__all__ = ["UseCase"]
+__all__ = ["AsyncUseCase", "UseCase"]
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Generic
+
+from src.shared.application.use_case import TInput, TOutput
+from src.shared.domain.core import Result
+
+
+class AsyncUseCase(ABC, Generic[TInput, TOutput]):
+    @abstractmethod
+    async def execute(self, input: TInput) -> Result[TOutput]:
+        pass
@@ -1,5 +1,23 @@
 from src.shared.domain.core.aggregate import Aggregate
+from src.shared.domain.core.clock import Clock, FixedClock, SystemClock
 from src.shared.domain.core.entity import Entity
+from src.shared.domain.core.identity_provider import (
+    IdentityProvider,
+    UUIDv4IdentityProvider,
+    UUIDv7IdentityProvider,
+)
+from src.shared.domain.core.money import Money
 from src.shared.domain.core.result import Result
 
-__all__ = ["Aggregate", "Entity", "Result"]
+__all__ = [
+    "Aggregate",
+    "Clock",
+    "Entity",
+    "FixedClock",
+    "IdentityProvider",
+    "Money",
+    "Result",
+    "SystemClock",
+    "UUIDv4IdentityProvider",
+    "UUIDv7IdentityProvider",
+]
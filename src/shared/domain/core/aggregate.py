@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from src.shared.domain.core.entity import Entity
 
@@ -9,21 +9,35 @@ if TYPE_CHECKING:
 
 
 class Aggregate(Entity):
+    __slots__ = ("version", "_domain_events")
+
     def __init__(
         self,
         id: uuid.UUID | None = None,
         created_at: datetime | None = None,
         updated_at: datetime | None = None,
         deleted_at: datetime | None = None,
+        version: int = 0,
     ):
         super().__init__(id, created_at, updated_at, deleted_at)
-        self._domain_events: List["DomainEvent"] = []
+        self.version = version
+        # Most aggregates never record an event, so the list is only created on demand.
+        self._domain_events: Optional[List["DomainEvent"]] = None
 
     def add_domain_event(self, event: "DomainEvent") -> None:
+        if self._domain_events is None:
+            self._domain_events = []
         self._domain_events.append(event)
 
     def get_events(self) -> List["DomainEvent"]:
-        return self._domain_events
+        return self._domain_events if self._domain_events is not None else []
+
+    def pull_events(self) -> List["DomainEvent"]:
+        # Hands the recorded events over exactly once, so a saved aggregate does not
+        # keep them (and they do not keep it) alive after they were published.
+        events = self.get_events()
+        self._domain_events = None
+        return events
 
     def clear_events(self) -> None:
-        self._domain_events = []
+        self._domain_events = None
@@ -0,0 +1,27 @@
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+
+class Clock(ABC):
+    @abstractmethod
+    def now(self) -> datetime:
+        pass
+
+
+class SystemClock(Clock):
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class FixedClock(Clock):
+    def __init__(self, now: datetime, step: timedelta = timedelta(0)):
+        self._now = now
+        self._step = step
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            now = self._now
+            self._now += self._step
+            return now
@@ -3,10 +3,18 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, Type, TypeVar
 
+from src.shared.domain.core.clock import Clock, SystemClock
+from src.shared.domain.core.identity_provider import IdentityProvider, UUIDv7IdentityProvider
+
 T = TypeVar("T", bound="Entity")
 
 
 class Entity(ABC):
+    __slots__ = ("id", "created_at", "updated_at", "deleted_at")
+
+    identity_provider: IdentityProvider = UUIDv7IdentityProvider()
+    clock: Clock = SystemClock()
+
     def __init__(
         self,
         id: uuid.UUID | None = None,
@@ -14,18 +22,33 @@ class Entity(ABC):
         updated_at: datetime | None = None,
         deleted_at: datetime | None = None,
     ):
-        self.id = id if id is not None else uuid.uuid4()
-        self.created_at = created_at if created_at is not None else datetime.now()
-        self.updated_at = updated_at if updated_at is not None else datetime.now()
+        if created_at is None or updated_at is None:
+            now = self.clock.now()
+            created_at = created_at if created_at is not None else now
+            updated_at = updated_at if updated_at is not None else now
+        self.id = id if id is not None else self.identity_provider.new_id()
+        self.created_at = created_at
+        self.updated_at = updated_at
         self.deleted_at = deleted_at
-        self.is_deleted = True if deleted_at is not None else False
+
+    @staticmethod
+    def configure(
+        identity_provider: IdentityProvider | None = None, clock: Clock | None = None
+    ) -> None:
+        if identity_provider is not None:
+            Entity.identity_provider = identity_provider
+        if clock is not None:
+            Entity.clock = clock
+
+    @property
+    def is_deleted(self) -> bool:
+        return self.deleted_at is not None
 
     def update(self) -> None:
-        self.updated_at = datetime.now()
+        self.updated_at = self.clock.now()
 
     def delete(self) -> None:
-        self.deleted_at = datetime.now()
-        self.is_deleted = True
+        self.deleted_at = self.clock.now()
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Entity):
@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class IdentityProvider(ABC):
+    @abstractmethod
+    def new_id(self) -> uuid.UUID:
+        pass
+
+
+class UUIDv4IdentityProvider(IdentityProvider):
+    def new_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+
+class UUIDv7IdentityProvider(IdentityProvider):
+    # RFC 9562 UUIDv7: 48-bit Unix milliseconds, then a 42-bit counter split around
+    # the version and variant bits, then 32 random bits. The counter starts at a
+    # random value each millisecond and is incremented within it, so ids generated
+    # by one provider always sort in creation order.
+    COUNTER_BITS = 42
+    COUNTER_LOW_BITS = 30
+
+    def __init__(
+        self,
+        time_ns: Callable[[], int] = time.time_ns,
+        random_bytes: Callable[[int], bytes] = os.urandom,
+    ):
+        self._time_ns = time_ns
+        self._random_bytes = random_bytes
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def new_id(self) -> uuid.UUID:
+        random = int.from_bytes(self._random_bytes(10), "big")
+        with self._lock:
+            ms = self._time_ns() // 1_000_000
+            if ms > self._last_ms:
+                self._last_ms = ms
+                # The top counter bit starts clear, leaving room to increment.
+                self._counter = random >> 32 & ((1 << (self.COUNTER_BITS - 1)) - 1)
+            else:
+                self._counter += 1
+                if self._counter >> self.COUNTER_BITS:
+                    self._last_ms += 1
+                    self._counter = random >> 32 & ((1 << (self.COUNTER_BITS - 1)) - 1)
+            ms, counter = self._last_ms, self._counter
+
+        return uuid.UUID(
+            int=(ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | (counter >> self.COUNTER_LOW_BITS) << 64
+            | 0b10 << 62
+            | (counter & ((1 << self.COUNTER_LOW_BITS) - 1)) << 32
+            | random & 0xFFFF_FFFF
+        )
@@ -0,0 +1,121 @@
+import math
+from decimal import Decimal, InvalidOperation
+from functools import total_ordering
+from typing import Optional
+
+
+@total_ordering
+class Money:
+    __slots__ = ("amount", "currency")
+
+    DEFAULT_CURRENCY = "BRL"
+    # Every supported currency has two decimal places, so amounts are kept in cents.
+    SCALE = 100
+    DECIMAL_PLACES = 2
+    # Repositories and codecs store the cents as signed 64-bit integers.
+    MAX_AMOUNT = 2**63 - 1
+
+    def __init__(self, amount: int, currency: str = DEFAULT_CURRENCY):
+        object.__setattr__(self, "amount", amount)
+        object.__setattr__(self, "currency", currency)
+
+    @classmethod
+    def of(
+        cls, value: "Money | int | float | Decimal | str", currency: Optional[str] = None
+    ) -> "Money":
+        if isinstance(value, Money):
+            if currency is not None and currency != value.currency:
+                raise ValueError(f"{value} is not an amount of {currency}")
+            return value
+
+        if currency is None:
+            currency = cls.DEFAULT_CURRENCY
+        amount = cls.minor_units_of(value)
+        if amount is None:
+            raise ValueError(f"{value!r} is not a valid amount of money")
+        if len(currency) != 3 or not currency.isalpha() or not currency.isupper():
+            raise ValueError(f"{currency!r} is not a valid currency code")
+        return cls(amount, currency)
+
+    @classmethod
+    def minor_units_of(cls, value: int | float | Decimal | str) -> Optional[int]:
+        amount = cls._scale(value)
+        if amount is None or abs(amount) > cls.MAX_AMOUNT:
+            return None
+        return amount
+
+    @classmethod
+    def _scale(cls, value: int | float | Decimal | str) -> Optional[int]:
+        if isinstance(value, int):
+            return value * cls.SCALE
+
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return None
+            # A float written with at most two decimals is the closest double to
+            # cents / 100, so converting back must give the exact same value.
+            amount = round(value * cls.SCALE)
+            return amount if amount / cls.SCALE == value else None
+
+        if isinstance(value, str):
+            try:
+                value = Decimal(value.strip())
+            except InvalidOperation:
+                return None
+
+        if isinstance(value, Decimal):
+            if not value.is_finite():
+                return None
+            scaled = value.scaleb(cls.DECIMAL_PLACES)
+            return int(scaled) if scaled == scaled.to_integral_value() else None
+
+        return None
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.amount).scaleb(-self.DECIMAL_PLACES)
+
+    def __float__(self) -> float:
+        return self.amount / self.SCALE
+
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.amount + other._same_currency(self).amount, self.currency)
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.amount - other._same_currency(self).amount, self.currency)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.amount == other.amount and self.currency == other.currency
+
+    def __lt__(self, other: "Money") -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.amount < other._same_currency(self).amount
+
+    def __hash__(self) -> int:
+        return hash((self.amount, self.currency))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), (self.amount, self.currency)
+
+    def __repr__(self) -> str:
+        return f"Money({self.amount}, {self.currency!r})"
+
+    def __str__(self) -> str:
+        return f"{self.to_decimal()} {self.currency}"
+
+    def _same_currency(self, other: "Money") -> "Money":
+        if self.currency != other.currency:
+            raise ValueError(f"Cannot combine {other.currency} with {self.currency}")
+        return self
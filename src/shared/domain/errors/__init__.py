@@ -1,11 +1,13 @@
 from src.shared.domain.errors.currency_error import CurrencyError
 from src.shared.domain.errors.email_error import EmailError
+from src.shared.domain.errors.error_record import ErrorRecord
 from src.shared.domain.errors.min_length_error import MinLengthError
 from src.shared.domain.errors.required_error import RequiredError
 from src.shared.domain.errors.uuid_error import UUIDFormatError
 from src.shared.domain.errors.validation_error import ValidationError
 
 __all__ = [
+    "ErrorRecord",
     "ValidationError",
     "RequiredError",
     "MinLengthError",
@@ -2,9 +2,11 @@ from src.shared.domain.errors.validation_error import ValidationError
 
 
 class CurrencyError(ValidationError):
+    CODE = "CURRENCY_ERROR"
+
     def __init__(self, field_name: str, current_value: str):
-        super().__init__(
-            (f"The field {field_name} must be a valid currency. Current value: {current_value}"),
-            field_name,
-            "CURRENCY_ERROR",
-        )
+        super().__init__(self.format_message(field_name, current_value), field_name, self.CODE)
+
+    @staticmethod
+    def format_message(field_name: str, current_value: str) -> str:
+        return f"The field {field_name} must be a valid currency. Current value: {current_value}"
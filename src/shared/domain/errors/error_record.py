@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING, Any, Tuple, Type
+
+if TYPE_CHECKING:
+    from src.shared.domain.errors.validation_error import ValidationError
+
+
+class ErrorRecord:
+    __slots__ = ("error_type", "field", "params")
+
+    def __init__(self, error_type: Type["ValidationError"], field: str, params: Tuple[Any, ...]):
+        self.error_type = error_type
+        self.field = field
+        self.params = params
+
+    @property
+    def code(self) -> str:
+        return self.error_type.CODE
+
+    @property
+    def message(self) -> str:
+        return self.error_type.format_message(self.field, *self.params)
+
+    def to_exception(self) -> "ValidationError":
+        return self.error_type(self.field, *self.params)
+
+    def __str__(self) -> str:
+        error_type, field = self.error_type, self.field
+        return f"{error_type.CODE}: {field} - {error_type.format_message(field, *self.params)}"
+
+    def __repr__(self) -> str:
+        return f"{self.error_type.__name__}.record({self.field!r}, *{self.params!r})"
+
+    def __eq__(self, other) -> bool:
+        # Comparisons with ValidationError fall back to ValidationError.__eq__.
+        if not isinstance(other, ErrorRecord):
+            return NotImplemented
+        return (
+            self.code == other.code and self.field == other.field and self.message == other.message
+        )
@@ -2,12 +2,16 @@ from src.shared.domain.errors.validation_error import ValidationError
 
 
 class MinLengthError(ValidationError):
+    CODE = "MIN_LENGTH_ERROR"
+
     def __init__(self, field_name: str, min_length: int, current_value: str):
         super().__init__(
-            (
-                f"The field {field_name} must have at least {min_length} characters. "
-                f"Current value: {current_value}"
-            ),
-            field_name,
-            "MIN_LENGTH_ERROR",
+            self.format_message(field_name, min_length, current_value), field_name, self.CODE
+        )
+
+    @staticmethod
+    def format_message(field_name: str, min_length: int, current_value: str) -> str:
+        return (
+            f"The field {field_name} must have at least {min_length} characters. "
+            f"Current value: {current_value}"
         )
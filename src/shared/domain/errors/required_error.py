@@ -2,5 +2,11 @@ from src.shared.domain.errors.validation_error import ValidationError
 
 
 class RequiredError(ValidationError):
+    CODE = "REQUIRED_ERROR"
+
     def __init__(self, field_name: str):
-        super().__init__(f"The field {field_name} is required", field_name, "REQUIRED_ERROR")
+        super().__init__(self.format_message(field_name), field_name, self.CODE)
+
+    @staticmethod
+    def format_message(field_name: str) -> str:
+        return f"The field {field_name} is required"
@@ -1,17 +1,26 @@
+from src.shared.domain.errors.error_record import ErrorRecord
+
+
 class ValidationError(Exception):
+    CODE = "VALIDATION_ERROR"
+
     def __init__(self, message: str, field: str = None, code: str = None):
         self.message = message
         self.field = field
-        self.code = code or "VALIDATION_ERROR"
+        self.code = code or self.CODE
         super().__init__(message)
 
+    @classmethod
+    def record(cls, field_name: str, *params) -> ErrorRecord:
+        return ErrorRecord(cls, field_name, params)
+
     def __str__(self) -> str:
         if self.field:
             return f"{self.code}: {self.field} - {self.message}"
         return f"{self.code}: {self.message}"
 
     def __eq__(self, other):
-        if not isinstance(other, ValidationError):
+        if not isinstance(other, (ValidationError, ErrorRecord)):
             return False
         return (
             self.message == other.message and self.field == other.field and self.code == other.code
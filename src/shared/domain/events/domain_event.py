@@ -29,6 +29,16 @@ class DomainEvent(ABC):
             "version": self.version,
         }
 
+    @classmethod
+    def restore(cls, data: Dict[str, Any], aggregate: "Aggregate") -> "DomainEvent":
+        event = cls.__new__(cls)
+        event.event_id = data["event_id"]
+        event.occurred_on = datetime.fromisoformat(data["occurred_on"])
+        event.aggregate_id = aggregate.id
+        event.event_data = aggregate
+        event.version = data.get("version", 1)
+        return event
+
     @abstractmethod
     def __repr__(self) -> str:
         pass
@@ -19,10 +19,21 @@ class DomainEventPublisher:
 
     def publish(self, events: List[DomainEvent]) -> None:
         for event in events:
-            event_type = type(event).__name__
-            handlers = self._handlers.get(event_type, [])
-            for handler in handlers:
-                try:
-                    handler.handle(event)
-                except Exception as e:
-                    print(f"Error handling event {event.event_type}: {e}")
+            self._dispatch(event)
+
+    # Dispatches the events and reports, per event, whether every handler took it.
+    def deliver(self, events: List[DomainEvent]) -> List[bool]:
+        return [self._dispatch(event) for event in events]
+
+    def _dispatch(self, event: DomainEvent) -> bool:
+        event_type = type(event).__name__
+        handlers = self._handlers.get(event_type, [])
+        return all([self._handle(handler, event) for handler in handlers])
+
+    def _handle(self, handler: DomainEventHandler, event: DomainEvent) -> bool:
+        try:
+            handler.handle(event)
+            return True
+        except Exception as e:
+            print(f"Error handling event {event.event_type}: {e}")
+            return False
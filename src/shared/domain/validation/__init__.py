@@ -1,11 +1,20 @@
+from src.shared.domain.validation.batch_validation_result import BatchValidationResult
+from src.shared.domain.validation.field_schema import FieldSchema
 from src.shared.domain.validation.field_validator import FieldValidator
+from src.shared.domain.validation.memoized_rule import MemoizedRule, RuleCacheStats
 from src.shared.domain.validation.validation_context import ValidationContext
 from src.shared.domain.validation.validation_rule import ValidationRule
+from src.shared.domain.validation.validation_schema import ValidationSchema
 from src.shared.domain.validation.validator import Validator
 
 __all__ = [
+    "BatchValidationResult",
     "ValidationContext",
     "ValidationRule",
+    "ValidationSchema",
     "Validator",
+    "FieldSchema",
     "FieldValidator",
+    "MemoizedRule",
+    "RuleCacheStats",
 ]
@@ -0,0 +1,28 @@
+from typing import Dict, List
+
+from src.shared.domain.errors import ErrorRecord
+
+
+class BatchValidationResult:
+    def __init__(self, rows: int, bitmap: bytes, errors: Dict[int, List[ErrorRecord]]):
+        self.rows = rows
+        # Bit (row % 8) of byte (row // 8) is set when the row failed.
+        self.bitmap = bitmap
+        self.errors = errors
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+    @property
+    def failure(self) -> bool:
+        return not self.success
+
+    @property
+    def failed_rows(self) -> List[int]:
+        return sorted(self.errors)
+
+    def is_failed(self, row: int) -> bool:
+        if not 0 <= row < self.rows:
+            raise IndexError(row)
+        return bool(self.bitmap[row >> 3] >> (row & 7) & 1)
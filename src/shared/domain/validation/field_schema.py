@@ -0,0 +1,39 @@
+from typing import List
+
+from src.shared.domain.validation.rules import (
+    CurrencyRule,
+    EmailRule,
+    MinLengthRule,
+    RequiredRule,
+    UUIDRule,
+)
+from src.shared.domain.validation.validation_rule import ValidationRule
+
+
+class FieldSchema:
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+        self.rules: List[ValidationRule] = []
+
+    def add_rule(self, rule: ValidationRule) -> "FieldSchema":
+        self.rules.append(rule)
+        return self
+
+    def required(self) -> "FieldSchema":
+        return self.add_rule(RequiredRule())
+
+    def min_length(self, min_length: int) -> "FieldSchema":
+        return self.add_rule(MinLengthRule(min_length))
+
+    def email(self) -> "FieldSchema":
+        return self.add_rule(EmailRule())
+
+    def uuid(self) -> "FieldSchema":
+        return self.add_rule(UUIDRule())
+
+    def currency(self) -> "FieldSchema":
+        return self.add_rule(CurrencyRule())
+
+    def memoize(self, max_size: int = 16384) -> "FieldSchema":
+        self.rules[-1] = self.rules[-1].memoized(max_size)
+        return self
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Any, NamedTuple, Sequence
+
+from src.shared.domain.errors import ErrorRecord
+from src.shared.domain.validation.validation_rule import ValidationRule
+
+
+class RuleCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoizedRule(ValidationRule):
+    pure = True
+
+    def __init__(self, rule: ValidationRule, max_size: int = 16384):
+        if not rule.pure:
+            raise ValueError(f"{type(rule).__name__} is not pure and cannot be memoized")
+        self.rule = rule
+        # Only whether a value is valid is cached: errors carry the field name
+        # and are built fresh, so callers never share an error object.
+        # typed keeps equal values of different types, like 1, 1.0 and True, apart.
+        self._is_valid = lru_cache(maxsize=max(1, max_size), typed=True)(self._check)
+
+    @property
+    def stats(self) -> RuleCacheStats:
+        info = self._is_valid.cache_info()
+        # Every miss adds one entry, so entries that are gone were evicted.
+        return RuleCacheStats(info.hits, info.misses, info.misses - info.currsize, info.currsize)
+
+    def validate(self, value: Any, field_name: str) -> ErrorRecord | None:
+        try:
+            valid = self._is_valid(value)
+        except TypeError:
+            return self.rule.validate(value, field_name)
+
+        return None if valid else self.rule.validate(value, field_name)
+
+    def invalid_rows(self, values: Sequence[Any]) -> Sequence[bool]:
+        return self.rule.invalid_rows(values)
+
+    def clear(self) -> None:
+        self._is_valid.cache_clear()
+
+    def _check(self, value: Any) -> bool:
+        return self.rule.validate(value, "") is None
@@ -1,26 +1,56 @@
-from decimal import ROUND_DOWN, Decimal
-from typing import Any
+from decimal import Decimal
+from typing import Any, Sequence
 
-from src.shared.domain.errors import CurrencyError, ValidationError
+from src.shared.domain.core import Money
+from src.shared.domain.errors import CurrencyError, ErrorRecord
 from src.shared.domain.validation.validation_rule import ValidationRule
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class CurrencyRule(ValidationRule):
-    def validate(self, value: Any, field_name: str) -> ValidationError | None:
+    pure = True
+
+    def validate(self, value: Any, field_name: str) -> ErrorRecord | None:
         if value is None or (isinstance(value, str) and value.strip() == ""):
             return None
 
-        if not isinstance(value, (int, float)):
-            return CurrencyError(field_name, value)
+        if isinstance(value, Money):
+            if 0 < value.amount <= Money.MAX_AMOUNT:
+                return None
+            return CurrencyError.record(field_name, value)
 
-        if value <= 0:
-            return CurrencyError(field_name, value)
+        if not isinstance(value, (int, float, Decimal)):
+            return CurrencyError.record(field_name, value)
 
-        if isinstance(value, float):
-            decimal_value = Decimal(str(value))
-            truncated = decimal_value.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+        if isinstance(value, int):
+            if 0 < value <= Money.MAX_AMOUNT // Money.SCALE:
+                return None
+            return CurrencyError.record(field_name, value)
 
-            if decimal_value != truncated:
-                return CurrencyError(field_name, value)
+        amount = Money.minor_units_of(value)
+        if amount is None or amount <= 0:
+            return CurrencyError.record(field_name, value)
 
         return None
+
+    def invalid_rows(self, values: Sequence[Any]) -> Sequence[bool]:
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.dtype.kind in "iu":
+                return (values <= 0) | (values > Money.MAX_AMOUNT // Money.SCALE)
+            if values.dtype.kind == "f":
+                # numpy.round rounds half to even like round(), so this is the same
+                # exact two-decimal check Money.minor_units_of does per value.
+                with numpy.errstate(invalid="ignore", over="ignore"):
+                    cents = numpy.round(values * Money.SCALE)
+                    return ~(
+                        numpy.isfinite(values)
+                        & (cents > 0)
+                        & (cents < Money.MAX_AMOUNT)
+                        & (cents / Money.SCALE == values)
+                    )
+
+        return super().invalid_rows(values)
@@ -1,21 +1,31 @@
 import re
-from typing import Any
+from typing import Any, Sequence
 
-from src.shared.domain.errors import EmailError, ValidationError
+from src.shared.domain.errors import EmailError, ErrorRecord
 from src.shared.domain.validation.validation_rule import ValidationRule
 
 
 class EmailRule(ValidationRule):
+    pure = True
+
     EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
 
-    def validate(self, value: Any, field_name: str) -> ValidationError | None:
+    def validate(self, value: Any, field_name: str) -> ErrorRecord | None:
         if value is None or (isinstance(value, str) and value.strip() == ""):
             return None
 
         if not isinstance(value, str):
-            return EmailError(field_name, value)
+            return EmailError.record(field_name, value)
 
         if not self.EMAIL_PATTERN.match(value):
-            return EmailError(field_name, value)
+            return EmailError.record(field_name, value)
 
         return None
+
+    def invalid_rows(self, values: Sequence[Any]) -> Sequence[bool]:
+        match = self.EMAIL_PATTERN.match
+        return [
+            value is not None
+            and not (isinstance(value, str) and (match(value) or value.strip() == ""))
+            for value in values
+        ]
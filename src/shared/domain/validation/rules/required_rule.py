@@ -1,19 +1,34 @@
-from typing import Any
+from typing import Any, Sequence
 
-from src.shared.domain.errors import RequiredError, ValidationError
+from src.shared.domain.errors import ErrorRecord, RequiredError
 from src.shared.domain.validation.validation_rule import ValidationRule
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class RequiredRule(ValidationRule):
-    def validate(self, value: Any, field_name: str) -> ValidationError | None:
+    pure = True
+
+    def validate(self, value: Any, field_name: str) -> ErrorRecord | None:
         if value is None:
-            return RequiredError(field_name)
+            return RequiredError.record(field_name)
 
         if isinstance(value, str) and value.strip() == "":
-            return RequiredError(field_name)
+            return RequiredError.record(field_name)
 
         # Valida collections vazias (opcional, descomente se necessário)
         # if hasattr(value, "__len__") and len(value) == 0:
-        #     return RequiredError(field_name)
+        #     return RequiredError.record(field_name)
 
         return None
+
+    def invalid_rows(self, values: Sequence[Any]) -> Sequence[bool]:
+        if numpy is not None and isinstance(values, numpy.ndarray) and values.dtype.kind in "biuf":
+            return numpy.zeros(len(values), dtype=bool)
+
+        return [
+            value is None or (isinstance(value, str) and value.strip() == "") for value in values
+        ]
@@ -1,12 +1,19 @@
+import re
 import uuid
-from typing import Any
+from typing import Any, Sequence
 
-from src.shared.domain.errors import UUIDFormatError, ValidationError
+from src.shared.domain.errors import ErrorRecord, UUIDFormatError
 from src.shared.domain.validation.validation_rule import ValidationRule
 
 
 class UUIDRule(ValidationRule):
-    def validate(self, value: Any, field_name: str) -> ValidationError | None:
+    pure = True
+
+    CANONICAL_PATTERN = re.compile(
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    )
+
+    def validate(self, value: Any, field_name: str) -> ErrorRecord | None:
         if value is None or (isinstance(value, str) and value.strip() == ""):
             return None
 
@@ -14,8 +21,18 @@ class UUIDRule(ValidationRule):
             if isinstance(value, str):
                 uuid.UUID(value)
             elif not isinstance(value, uuid.UUID):
-                return UUIDFormatError(field_name, value)
+                return UUIDFormatError.record(field_name, value)
         except ValueError:
-            return UUIDFormatError(field_name, value)
+            return UUIDFormatError.record(field_name, value)
 
         return None
+
+    def invalid_rows(self, values: Sequence[Any]) -> Sequence[bool]:
+        # Canonical strings are valid without parsing; anything else, including
+        # the other spellings uuid.UUID accepts, goes through validate.
+        canonical = self.CANONICAL_PATTERN.fullmatch
+        validate = self.validate
+        return [
+            not (isinstance(value, str) and canonical(value)) and validate(value, "") is not None
+            for value in values
+        ]
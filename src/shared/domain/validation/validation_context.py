@@ -1,19 +1,19 @@
 from typing import List
 
-from src.shared.domain.errors import ValidationError
+from src.shared.domain.errors import ErrorRecord
 
 
 class ValidationContext:
     def __init__(self):
-        self._errors: List[ValidationError] = []
+        self._errors: List[ErrorRecord] = []
 
-    def add_error(self, error: ValidationError) -> None:
+    def add_error(self, error: ErrorRecord) -> None:
         self._errors.append(error)
 
     def has_errors(self) -> bool:
         return len(self._errors) > 0
 
-    def get_errors(self) -> List[ValidationError]:
+    def get_errors(self) -> List[ErrorRecord]:
         return self._errors.copy()
 
     def clear(self) -> None:
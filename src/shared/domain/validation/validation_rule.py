@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Sequence
 
-from src.shared.domain.errors import ValidationError
+from src.shared.domain.errors import ErrorRecord
 
 
 class ValidationRule(ABC):
+    # A pure rule's result depends only on the value, so it can be memoized.
+    pure = False
+
     @abstractmethod
-    def validate(self, value: Any, field_name: str) -> ValidationError | None:
+    def validate(self, value: Any, field_name: str) -> ErrorRecord | None:
         pass
+
+    def invalid_rows(self, values: Sequence[Any]) -> Sequence[bool]:
+        validate = self.validate
+        return [validate(value, "") is not None for value in values]
+
+    def memoized(self, max_size: int = 16384) -> "ValidationRule":
+        from src.shared.domain.validation.memoized_rule import MemoizedRule
+
+        return MemoizedRule(self, max_size)
@@ -0,0 +1,102 @@
+from itertools import compress, count
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.shared.domain.core import Result
+from src.shared.domain.errors import ErrorRecord
+from src.shared.domain.validation.batch_validation_result import BatchValidationResult
+from src.shared.domain.validation.field_schema import FieldSchema
+from src.shared.domain.validation.validation_rule import ValidationRule
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Check = Callable[[Any, str], Optional[ErrorRecord]]
+
+
+class ValidationSchema:
+    def __init__(self, *fields: FieldSchema, fail_fast: bool = False, bail_per_field: bool = False):
+        # fail_fast stops at the first error overall; bail_per_field stops a
+        # field's rules at its first error and moves on to the next field.
+        self.fail_fast = fail_fast
+        self.bail_per_field = bail_per_field
+        self.fields = fields
+        self.field_names = tuple(field.field_name for field in fields)
+        self._column_plan: Tuple[Tuple[int, ValidationRule], ...] = tuple(
+            (position, rule) for position, field in enumerate(fields) for rule in field.rules
+        )
+        # The rules of every field are flattened, in declaration order, into one
+        # plan of (value position, field name, check) so validating runs a single
+        # loop without building validators or rules.
+        self._plan: Tuple[Tuple[int, str, Check], ...] = tuple(
+            (position, field.field_name, rule.validate)
+            for position, field in enumerate(fields)
+            for rule in field.rules
+        )
+
+    def validate(self, *values: Any) -> Result[None]:
+        if len(values) != len(self.field_names):
+            raise TypeError(f"Expected {len(self.field_names)} values, got {len(values)}")
+
+        errors: List[ErrorRecord] | None = None
+        failed_position = -1
+        for position, field_name, check in self._plan:
+            if position == failed_position:
+                continue
+            error = check(values[position], field_name)
+            if error:
+                if self.fail_fast:
+                    return Result.fail([error])
+                if errors is None:
+                    errors = []
+                errors.append(error)
+                if self.bail_per_field:
+                    failed_position = position
+
+        if errors:
+            return Result.fail(errors)
+
+        return Result.ok()
+
+    def validate_columns(
+        self, *columns: Sequence[Any], use_numpy: bool = True
+    ) -> BatchValidationResult:
+        if len(columns) != len(self.field_names):
+            raise TypeError(f"Expected {len(self.field_names)} columns, got {len(columns)}")
+        rows = len(columns[0]) if columns else 0
+        if any(len(column) != rows for column in columns):
+            raise ValueError("All columns must have the same length")
+
+        # Each rule checks a whole column at once and only reports which rows
+        # failed; errors are then built by validating just those rows.
+        if use_numpy and numpy is not None:
+            failed = numpy.zeros(rows, dtype=bool)
+            for position, rule in self._column_plan:
+                failed |= numpy.asarray(rule.invalid_rows(columns[position]), dtype=bool)
+            bitmap = numpy.packbits(failed, bitorder="little").tobytes()
+            failed_rows = numpy.flatnonzero(failed).tolist()
+        else:
+            marks = bytearray(rows)
+            for position, rule in self._column_plan:
+                for row in compress(count(), rule.invalid_rows(columns[position])):
+                    marks[row] = 1
+            failed_rows = list(compress(range(rows), marks))
+            packed = bytearray((rows + 7) // 8)
+            for row in failed_rows:
+                packed[row >> 3] |= 1 << (row & 7)
+            bitmap = bytes(packed)
+
+        errors: Dict[int, List[ErrorRecord]] = {}
+        for row in failed_rows:
+            result = self.validate(*(self._cell(column, row) for column in columns))
+            errors[row] = result.errors
+        return BatchValidationResult(rows, bitmap, errors)
+
+    @staticmethod
+    def _cell(column: Sequence[Any], row: int) -> Any:
+        value = column[row]
+        # Rows are revalidated with plain Python values, as a single-row call would get.
+        if numpy is not None and isinstance(value, numpy.generic):
+            return value.item()
+        return value
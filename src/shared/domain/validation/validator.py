@@ -6,7 +6,9 @@ from src.shared.domain.validation.validation_context import ValidationContext
 
 
 class Validator:
-    def __init__(self):
+    def __init__(self, fail_fast: bool = False, bail_per_field: bool = False):
+        self.fail_fast = fail_fast
+        self.bail_per_field = bail_per_field
         self.context = ValidationContext()
         self.field_validators: List[FieldValidator] = []
 
@@ -16,8 +18,10 @@ class Validator:
         return field_validator
 
     def validate(self) -> Result[bool]:
+        bail = self.fail_fast or self.bail_per_field
         for validator in self.field_validators:
-            validator.validate(self.context)
+            if not validator.validate(self.context, bail) and self.fail_fast:
+                break
 
         if self.context.has_errors():
             errors = self.context.get_errors()
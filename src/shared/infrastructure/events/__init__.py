@@ -0,0 +1,7 @@
+from src.shared.infrastructure.events.event_queue_full_error import EventQueueFullError
+from src.shared.infrastructure.events.queued_domain_event_publisher import (
+    EventPublisherStats,
+    QueuedDomainEventPublisher,
+)
+
+__all__ = ["EventPublisherStats", "EventQueueFullError", "QueuedDomainEventPublisher"]
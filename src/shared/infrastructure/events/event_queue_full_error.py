@@ -0,0 +1,4 @@
+class EventQueueFullError(Exception):
+    def __init__(self, max_queue_size: int):
+        self.max_queue_size = max_queue_size
+        super().__init__(f"Domain event queue is full ({max_queue_size} events)")
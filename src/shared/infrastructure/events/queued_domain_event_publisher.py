@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+from src.shared.domain.events import DomainEvent, DomainEventHandler, DomainEventPublisher
+from src.shared.infrastructure.events.event_queue_full_error import EventQueueFullError
+
+
+class EventPublisherStats(NamedTuple):
+    queue_depth: int
+    max_queue_depth: int
+    published: int
+    processed: int
+    dropped: int
+    rejected: int
+    failed: int
+    handler_calls: int
+    handler_seconds: float
+    max_handler_seconds: float
+
+    @property
+    def mean_handler_seconds(self) -> float:
+        return self.handler_seconds / self.handler_calls if self.handler_calls else 0.0
+
+
+class QueuedDomainEventPublisher(DomainEventPublisher):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+    POLICIES = (BLOCK, DROP_OLDEST, REJECT)
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        workers: int = 4,
+        policy: str = BLOCK,
+        block_timeout: Optional[float] = None,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        super().__init__()
+        self._max_queue_size = max(1, max_queue_size)
+        self._policy = policy
+        self._block_timeout = block_timeout
+        # Events handed to deliver() carry a future for their outcome.
+        self._queue: Deque[Tuple[DomainEvent, Optional[Future]]] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._closed = False
+        self._max_queue_depth = 0
+        self._published = 0
+        self._processed = 0
+        self._dropped = 0
+        self._rejected = 0
+        self._failed = 0
+        self._handler_calls = 0
+        self._handler_seconds = 0.0
+        self._max_handler_seconds = 0.0
+        self._workers = [
+            threading.Thread(target=self._work, name=f"domain-events-{index}", daemon=True)
+            for index in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def stats(self) -> EventPublisherStats:
+        with self._lock:
+            return EventPublisherStats(
+                len(self._queue),
+                self._max_queue_depth,
+                self._published,
+                self._processed,
+                self._dropped,
+                self._rejected,
+                self._failed,
+                self._handler_calls,
+                self._handler_seconds,
+                self._max_handler_seconds,
+            )
+
+    def publish(self, events: List[DomainEvent]) -> None:
+        self._enqueue([(event, None) for event in events])
+
+    def deliver(self, events: List[DomainEvent]) -> List[bool]:
+        futures = [Future() for _ in events]
+        self._enqueue(list(zip(events, futures)))
+        return [future.result() for future in futures]
+
+    def _enqueue(self, items: List[Tuple[DomainEvent, Optional[Future]]]) -> None:
+        with self._lock:
+            for item in items:
+                if self._closed:
+                    raise RuntimeError("Domain event publisher is closed")
+                if len(self._queue) >= self._max_queue_size:
+                    self._make_room()
+                self._queue.append(item)
+                self._published += 1
+                self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+                self._not_empty.notify()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        # Queued events are still handled; only new ones are refused.
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(worker.is_alive() for worker in self._workers)
+
+    def _make_room(self) -> None:
+        if self._policy == self.DROP_OLDEST:
+            _, future = self._queue.popleft()
+            if future is not None:
+                future.set_result(False)
+            self._dropped += 1
+            return
+
+        if self._policy == self.BLOCK and self._not_full.wait_for(
+            lambda: len(self._queue) < self._max_queue_size or self._closed, self._block_timeout
+        ):
+            if self._closed:
+                raise RuntimeError("Domain event publisher is closed")
+            return
+
+        self._rejected += 1
+        raise EventQueueFullError(self._max_queue_size)
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                event, future = self._queue.popleft()
+                self._in_flight += 1
+                self._not_full.notify()
+
+            delivered = False
+            try:
+                delivered = self._dispatch(event)
+            finally:
+                if future is not None:
+                    future.set_result(delivered)
+                with self._lock:
+                    self._in_flight -= 1
+                    self._processed += 1
+                    if not self._queue and not self._in_flight:
+                        self._idle.notify_all()
+
+    def _handle(self, handler: DomainEventHandler, event: DomainEvent) -> bool:
+        start = time.perf_counter()
+        handled = super()._handle(handler, event)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._handler_calls += 1
+            self._handler_seconds += elapsed
+            self._max_handler_seconds = max(self._max_handler_seconds, elapsed)
+            if not handled:
+                self._failed += 1
+        return handled
@@ -0,0 +1,23 @@
+from src.shared.infrastructure.idempotency.idempotency_errors import (
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+)
+from src.shared.infrastructure.idempotency.idempotency_guard import IdempotencyGuard
+from src.shared.infrastructure.idempotency.idempotency_store import IdempotencyStore
+from src.shared.infrastructure.idempotency.idempotent_response import IdempotentResponse
+from src.shared.infrastructure.idempotency.in_memory_idempotency_store import (
+    InMemoryIdempotencyStore,
+)
+from src.shared.infrastructure.idempotency.sqlite_idempotency_store import (
+    SqliteIdempotencyStore,
+)
+
+__all__ = [
+    "IdempotencyGuard",
+    "IdempotencyKeyInProgressError",
+    "IdempotencyKeyMismatchError",
+    "IdempotencyStore",
+    "IdempotentResponse",
+    "InMemoryIdempotencyStore",
+    "SqliteIdempotencyStore",
+]
@@ -0,0 +1,10 @@
+class IdempotencyKeyMismatchError(Exception):
+    def __init__(self, key: str):
+        self.key = key
+        super().__init__(f"Idempotency key {key} was already used for a different request")
+
+
+class IdempotencyKeyInProgressError(Exception):
+    def __init__(self, key: str):
+        self.key = key
+        super().__init__(f"A request with idempotency key {key} is still being processed")
@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Optional, Tuple
+
+from src.shared.infrastructure.idempotency.idempotency_errors import (
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+)
+from src.shared.infrastructure.idempotency.idempotency_store import IdempotencyStore
+from src.shared.infrastructure.idempotency.idempotent_response import IdempotentResponse
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyGuard:
+    def __init__(
+        self, store: IdempotencyStore, wait_timeout: float = 30.0, poll_interval: float = 0.05
+    ):
+        self._store = store
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    @property
+    def store(self) -> IdempotencyStore:
+        return self._store
+
+    def execute(
+        self, key: str, fingerprint: str, handler: Callable[[], Tuple[int, bytes]]
+    ) -> Tuple[IdempotentResponse, bool]:
+        # Returns the response and whether it was replayed. Duplicates within this
+        # process wait for the first one's result; the lock only guards that
+        # registration, and the store is consulted outside it, where claiming the
+        # key keeps other processes from handling it too.
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            try:
+                response = future.result(self._wait_timeout)
+            except FutureTimeoutError:
+                raise IdempotencyKeyInProgressError(key) from None
+            return self._replay(key, fingerprint, response), True
+
+        try:
+            stored = self._claim_or_wait(key, fingerprint)
+            response = stored if stored is not None else self._handle(key, fingerprint, handler)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+        if stored is not None:
+            return self._replay(key, fingerprint, stored), True
+        return response, False
+
+    def _claim_or_wait(self, key: str, fingerprint: str) -> Optional[IdempotentResponse]:
+        # Returns the stored response, or None once this call holds the claim. A key
+        # claimed elsewhere is polled until it is answered, released or times out.
+        deadline = time.monotonic() + self._wait_timeout
+        while True:
+            stored = self._store.get(key)
+            if stored is not None:
+                return stored
+            if self._store.claim(key, fingerprint):
+                return None
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgressError(key)
+            time.sleep(self._poll_interval)
+
+    def _handle(
+        self, key: str, fingerprint: str, handler: Callable[[], Tuple[int, bytes]]
+    ) -> IdempotentResponse:
+        try:
+            status_code, body = handler()
+        except BaseException:
+            self._release(key)
+            raise
+
+        response = IdempotentResponse(fingerprint, status_code, body)
+        # Server errors are not remembered so that a retry can still succeed.
+        if status_code < 500:
+            self._remember(key, response)
+        else:
+            self._release(key)
+        return response
+
+    def _remember(self, key: str, response: IdempotentResponse) -> None:
+        # The request already took effect, so failing it now would only make the
+        # client retry and repeat it; the response still goes to every waiter.
+        try:
+            self._store.put(key, response)
+        except Exception:
+            logger.exception("Error storing idempotent response for key %s", key)
+
+    def _release(self, key: str) -> None:
+        # A claim left behind only delays retries until it expires.
+        try:
+            self._store.release(key)
+        except Exception:
+            logger.exception("Error releasing idempotency key %s", key)
+
+    @staticmethod
+    def _replay(key: str, fingerprint: str, response: IdempotentResponse) -> IdempotentResponse:
+        if response.fingerprint != fingerprint:
+            raise IdempotencyKeyMismatchError(key)
+        return response
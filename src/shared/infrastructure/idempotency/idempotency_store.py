@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.shared.infrastructure.idempotency.idempotent_response import IdempotentResponse
+
+
+class IdempotencyStore(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[IdempotentResponse]:
+        pass
+
+    @abstractmethod
+    def claim(self, key: str, fingerprint: str) -> bool:
+        # Atomically records the key as being processed. Returns False if it is
+        # already claimed or answered, so only one caller across every process
+        # sharing the store gets to handle it.
+        pass
+
+    @abstractmethod
+    def put(self, key: str, response: IdempotentResponse) -> None:
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        # Drops a claim that ended without a response worth keeping.
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -0,0 +1,9 @@
+from typing import NamedTuple
+
+
+class IdempotentResponse(NamedTuple):
+    # Hash of the request that produced the response, used to reject a key that
+    # is reused for a different payload.
+    fingerprint: str
+    status_code: int
+    body: bytes
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from src.shared.infrastructure.idempotency.idempotency_store import IdempotencyStore
+from src.shared.infrastructure.idempotency.idempotent_response import IdempotentResponse
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 24 * 60 * 60,
+        clock: Callable[[], float] = time.time,
+        backend: Optional[IdempotencyStore] = None,
+        claim_ttl: float = 60.0,
+    ):
+        self._max_size = max(1, max_size)
+        self._ttl = ttl
+        self._claim_ttl = claim_ttl
+        self._clock = clock
+        self._backend = backend
+        self._lock = threading.Lock()
+        # key -> (response, expiry time), least recently used first
+        self._entries: OrderedDict[str, Tuple[IdempotentResponse, float]] = OrderedDict()
+        # key -> claim expiry time, for keys being processed; only used without a
+        # backend, which otherwise holds the claims so other processes see them.
+        self._claims: Dict[str, float] = {}
+
+    def get(self, key: str) -> Optional[IdempotentResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                response, expires_at = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    return response
+                del self._entries[key]
+
+        if self._backend is None:
+            return None
+
+        response = self._backend.get(key)
+        if response is not None:
+            self._remember(key, response)
+        return response
+
+    def claim(self, key: str, fingerprint: str) -> bool:
+        if self._backend is not None:
+            return self._backend.claim(key, fingerprint)
+
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                return False
+            if self._claims.get(key, now) > now:
+                return False
+            self._claims[key] = now + self._claim_ttl
+            return True
+
+    def put(self, key: str, response: IdempotentResponse) -> None:
+        if self._backend is not None:
+            self._backend.put(key, response)
+        self._remember(key, response)
+
+    def release(self, key: str) -> None:
+        if self._backend is not None:
+            self._backend.release(key)
+        with self._lock:
+            self._claims.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._claims.clear()
+        if self._backend is not None:
+            self._backend.clear()
+
+    def close(self) -> None:
+        close = getattr(self._backend, "close", None)
+        if close is not None:
+            close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remember(self, key: str, response: IdempotentResponse) -> None:
+        with self._lock:
+            self._claims.pop(key, None)
+            self._entries[key] = (response, self._clock() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
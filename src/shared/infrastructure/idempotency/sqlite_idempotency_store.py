@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+from src.shared.infrastructure.idempotency.idempotency_store import IdempotencyStore
+from src.shared.infrastructure.idempotency.idempotent_response import IdempotentResponse
+
+
+class SqliteIdempotencyStore(IdempotencyStore):
+    CREATE_TABLE_SQL = (
+        "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+        "key TEXT PRIMARY KEY, "
+        "fingerprint TEXT NOT NULL, "
+        "status_code INTEGER, "
+        "body BLOB, "
+        "expires_at REAL NOT NULL)"
+    )
+    # A claimed key is a row without a response yet. The primary key makes the
+    # insert fail for every other claimant, whichever process it runs in, until
+    # the row is answered, released or expires.
+    CLAIM_SQL = (
+        "INSERT INTO idempotency_keys (key, fingerprint, expires_at) VALUES (?, ?, ?) "
+        "ON CONFLICT (key) DO UPDATE SET fingerprint = excluded.fingerprint, "
+        "status_code = NULL, body = NULL, expires_at = excluded.expires_at "
+        "WHERE idempotency_keys.expires_at <= ?"
+    )
+    RELEASE_SQL = "DELETE FROM idempotency_keys WHERE key = ? AND status_code IS NULL"
+    SELECT_SQL = (
+        "SELECT fingerprint, status_code, body FROM idempotency_keys "
+        "WHERE key = ? AND expires_at > ? AND status_code IS NOT NULL"
+    )
+    UPSERT_SQL = (
+        "INSERT OR REPLACE INTO idempotency_keys "
+        "(key, fingerprint, status_code, body, expires_at) VALUES (?, ?, ?, ?, ?)"
+    )
+    DELETE_EXPIRED_SQL = "DELETE FROM idempotency_keys WHERE expires_at <= ?"
+    DELETE_ALL_SQL = "DELETE FROM idempotency_keys"
+    COUNT_SQL = "SELECT COUNT(*) FROM idempotency_keys"
+    # Expired keys are deleted once every this many puts instead of on each one.
+    PRUNE_EVERY = 1024
+
+    def __init__(
+        self,
+        database: str = ":memory:",
+        ttl: float = 24 * 60 * 60,
+        clock: Callable[[], float] = time.time,
+        claim_ttl: float = 60.0,
+    ):
+        self._ttl = ttl
+        self._claim_ttl = claim_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._closed = False
+        self._connection = sqlite3.connect(database, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(self.CREATE_TABLE_SQL)
+
+    def get(self, key: str) -> Optional[IdempotentResponse]:
+        with self._lock:
+            row = self._connection.execute(self.SELECT_SQL, (key, self._clock())).fetchone()
+        if row is None:
+            return None
+        fingerprint, status_code, body = row
+        return IdempotentResponse(fingerprint, status_code, bytes(body))
+
+    def claim(self, key: str, fingerprint: str) -> bool:
+        with self._lock:
+            now = self._clock()
+            cursor = self._connection.execute(
+                self.CLAIM_SQL, (key, fingerprint, now + self._claim_ttl, now)
+            )
+            return cursor.rowcount == 1
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute(self.RELEASE_SQL, (key,))
+
+    def put(self, key: str, response: IdempotentResponse) -> None:
+        with self._lock:
+            now = self._clock()
+            self._connection.execute(self.UPSERT_SQL, (key, *response, now + self._ttl))
+            self._puts += 1
+            if self._puts % self.PRUNE_EVERY == 0:
+                self._connection.execute(self.DELETE_EXPIRED_SQL, (now,))
+
+    def prune(self) -> int:
+        with self._lock:
+            return self._connection.execute(self.DELETE_EXPIRED_SQL, (self._clock(),)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(self.DELETE_ALL_SQL)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._connection.close()
+            self._closed = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(self.COUNT_SQL).fetchone()[0]
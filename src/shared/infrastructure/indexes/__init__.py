@@ -0,0 +1,4 @@
+from src.shared.infrastructure.indexes.hash_index import HashIndex
+from src.shared.infrastructure.indexes.sorted_index import IndexEntry, SortedIndex
+
+__all__ = ["HashIndex", "IndexEntry", "SortedIndex"]
@@ -0,0 +1,59 @@
+from typing import AbstractSet, Dict, Generic, Hashable, Iterable, Optional, Set, Tuple, TypeVar
+
+TKey = TypeVar("TKey", bound=Hashable)
+TId = TypeVar("TId", bound=Hashable)
+
+
+class HashIndex(Generic[TKey, TId]):
+    def __init__(self):
+        self._ids_by_key: Dict[TKey, Set[TId]] = {}
+        self._keys: Dict[TId, TKey] = {}
+
+    def put(self, item_id: TId, key: Optional[TKey]) -> None:
+        previous_key = self._keys.get(item_id)
+        if previous_key == key:
+            return
+
+        if previous_key is not None:
+            self.remove(item_id)
+
+        if key is not None:
+            self._ids_by_key.setdefault(key, set()).add(item_id)
+            self._keys[item_id] = key
+
+    def put_many(self, items: Iterable[Tuple[TId, Optional[TKey]]]) -> None:
+        if self._keys:
+            for item_id, key in items:
+                self.put(item_id, key)
+            return
+
+        # Filling an empty index has nothing to replace, so the maps are built directly.
+        keys = {item_id: key for item_id, key in items if key is not None}
+        ids_by_key = self._ids_by_key
+        for item_id, key in keys.items():
+            item_ids = ids_by_key.get(key)
+            if item_ids is None:
+                ids_by_key[key] = {item_id}
+            else:
+                item_ids.add(item_id)
+        self._keys = keys
+
+    def remove(self, item_id: TId) -> None:
+        key = self._keys.pop(item_id, None)
+        if key is None:
+            return
+
+        item_ids = self._ids_by_key[key]
+        item_ids.discard(item_id)
+        if not item_ids:
+            del self._ids_by_key[key]
+
+    def get(self, key: TKey) -> AbstractSet[TId]:
+        return self._ids_by_key.get(key, frozenset())
+
+    def clear(self) -> None:
+        self._ids_by_key.clear()
+        self._keys.clear()
+
+    def __contains__(self, key: TKey) -> bool:
+        return key in self._ids_by_key
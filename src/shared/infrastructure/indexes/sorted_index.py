@@ -0,0 +1,98 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+TId = TypeVar("TId", bound=Hashable)
+
+IndexEntry = Tuple[Any, TId]
+
+
+class SortedIndex(Generic[TId]):
+    CHUNK_SIZE = 256
+
+    def __init__(self):
+        self._entries: List[IndexEntry] = []
+        self._values: Dict[TId, Any] = {}
+
+    def put(self, item_id: TId, value: Any) -> None:
+        if value is None:
+            self.remove(item_id)
+            return
+
+        if item_id in self._values:
+            if self._values[item_id] == value:
+                return
+            self.remove(item_id)
+
+        insort(self._entries, (value, item_id))
+        self._values[item_id] = value
+
+    def put_many(self, items: Iterable[Tuple[TId, Any]]) -> None:
+        if not self._values:
+            # Filling an empty index has nothing to replace: one sort builds it.
+            self._values = {item_id: value for item_id, value in items if value is not None}
+            self._entries = sorted(zip(self._values.values(), self._values.keys()))
+            return
+
+        pending = {item_id: value for item_id, value in items if self._values.get(item_id) != value}
+        if not pending:
+            return
+
+        for item_id in pending:
+            self.remove(item_id)
+
+        pending = {item_id: value for item_id, value in pending.items() if value is not None}
+        self._entries.extend((value, item_id) for item_id, value in pending.items())
+        self._entries.sort()
+        self._values.update(pending)
+
+    def remove(self, item_id: TId) -> None:
+        value = self._values.pop(item_id, None)
+        if value is None:
+            return
+
+        position = bisect_left(self._entries, (value, item_id))
+        del self._entries[position]
+
+    def entry_of(self, item_id: TId) -> Optional[IndexEntry]:
+        value = self._values.get(item_id)
+        return None if value is None else (value, item_id)
+
+    def iter_after(self, after: Optional[IndexEntry] = None) -> Iterator[IndexEntry]:
+        # Entries are copied in small chunks and the position is recomputed from the
+        # last yielded key, so concurrent inserts never invalidate the iteration and
+        # memory stays bounded by CHUNK_SIZE however large the index grows.
+        while True:
+            start = 0 if after is None else bisect_right(self._entries, after)
+            chunk = self._entries[start : start + self.CHUNK_SIZE]
+            if not chunk:
+                return
+            yield from chunk
+            after = chunk[-1]
+
+    def between(self, start: Any, end: Any) -> List[IndexEntry]:
+        # A one-element tuple sorts before every entry sharing its value, so these
+        # bisections find the first entry >= start and the first entry >= end.
+        return self._entries[
+            bisect_left(self._entries, (start,)) : bisect_left(self._entries, (end,))
+        ]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: TId) -> bool:
+        return item_id in self._values
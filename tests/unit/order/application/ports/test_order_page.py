@@ -0,0 +1,25 @@
+import uuid
+
+import pytest
+
+from src.order.application.ports import OrderCursor, OrderPage
+
+
+class TestOrderCursor:
+    def test_encode_and_decode_round_trip(self):
+        order_id = uuid.uuid4()
+
+        cursor = OrderCursor.encode(order_id)
+
+        assert str(order_id) not in cursor
+        assert OrderCursor.decode(cursor) == order_id
+
+    def test_decode_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            OrderCursor.decode("not a cursor")
+
+
+class TestOrderPage:
+    def test_has_next(self):
+        assert OrderPage([], "cursor").has_next is True
+        assert OrderPage([]).has_next is False
@@ -0,0 +1,62 @@
+import uuid
+
+import pytest
+
+from src.order.application.ports import OrderSaveError
+from src.order.application.unit_of_work import UnitOfWork
+from src.order.domain import Order
+from src.order.infrastructure.repositories import InMemoryOrderRepository
+
+
+class TestUnitOfWork:
+    @pytest.fixture
+    def repository(self) -> InMemoryOrderRepository:
+        return InMemoryOrderRepository()
+
+    def _order(self) -> Order:
+        return Order.create(customer_id=str(uuid.uuid4()), total=100.0).value
+
+    def test_commits_registered_orders_on_exit(self, repository: InMemoryOrderRepository):
+        orders = [self._order(), self._order()]
+
+        with UnitOfWork(repository) as uow:
+            for order in orders:
+                uow.register(order)
+            assert repository.count() == 0
+
+        assert uow.result.success is True
+        assert repository.count() == 2
+
+    def test_discards_registered_orders_when_block_raises(
+        self, repository: InMemoryOrderRepository
+    ):
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(repository) as uow:
+                uow.register(self._order())
+                raise RuntimeError("import aborted")
+
+        assert uow.result is None
+        assert repository.count() == 0
+
+    def test_returns_single_result_with_per_item_failures(
+        self, repository: InMemoryOrderRepository
+    ):
+        with UnitOfWork(repository) as uow:
+            uow.register(self._order()).register(object()).register(self._order())
+
+        assert uow.result.failure is True
+        assert len(uow.result.errors) == 1
+        assert isinstance(uow.result.errors[0], OrderSaveError)
+        assert uow.result.errors[0].position == 1
+        assert repository.count() == 0
+
+    def test_commit_can_be_called_explicitly(self, repository: InMemoryOrderRepository):
+        uow = UnitOfWork(repository)
+        uow.register(self._order())
+
+        result = uow.commit()
+
+        assert result.success is True
+        assert repository.count() == 1
+        assert uow.commit().success is True
+        assert repository.count() == 1
@@ -0,0 +1,103 @@
+import asyncio
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from src.order.application.dtos import CreateOrderInput, CreateOrderOutput
+from src.order.application.ports import AsyncOrderRepository
+from src.order.application.usecases import AsyncCreateOrderUseCase
+from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
+from src.shared.application import AsyncUseCase
+from src.shared.domain.core import Result
+from src.shared.domain.errors import UUIDFormatError
+from src.shared.domain.events import DomainEventPublisher
+
+
+class TestAsyncCreateOrderUseCase:
+    @pytest.fixture
+    def repository(self) -> AsyncOrderRepository:
+        mock_repo = Mock(spec=AsyncOrderRepository)
+        mock_repo.save.return_value = Result.ok()
+        return mock_repo
+
+    @pytest.fixture
+    def domain_event_publisher(self) -> DomainEventPublisher:
+        mock_publisher = Mock(spec=DomainEventPublisher)
+        mock_publisher.publish.return_value = None
+        return mock_publisher
+
+    @pytest.fixture
+    def use_case(
+        self, repository: AsyncOrderRepository, domain_event_publisher: DomainEventPublisher
+    ) -> AsyncCreateOrderUseCase:
+        return AsyncCreateOrderUseCase(
+            repository=repository, domain_event_publisher=domain_event_publisher
+        )
+
+    def test_is_async_use_case_instance(self, use_case: AsyncCreateOrderUseCase):
+        assert isinstance(use_case, AsyncUseCase)
+
+    def test_execute_with_valid_input(self, use_case: AsyncCreateOrderUseCase):
+        customer_id = str(uuid.uuid4())
+
+        result = asyncio.run(use_case.execute(CreateOrderInput(customer_id=customer_id, total=100)))
+
+        assert result.success is True
+        assert isinstance(result.value, CreateOrderOutput)
+        assert isinstance(result.value.order, Order)
+        assert result.value.order.customer_id == customer_id
+        use_case.repository.save.assert_awaited_once_with(result.value.order)
+
+    def test_execute_with_invalid_input(self, use_case: AsyncCreateOrderUseCase):
+        result = asyncio.run(use_case.execute(CreateOrderInput(customer_id="invalid", total=100)))
+
+        assert result.failure is True
+        assert result.errors[0] == UUIDFormatError(
+            field_name="customer_id", current_value="invalid"
+        )
+        use_case.repository.save.assert_not_awaited()
+
+    def test_returns_failure_when_repository_fails(self, use_case: AsyncCreateOrderUseCase):
+        use_case.repository.save.return_value = Result.fail([Exception("Repository failed")])
+
+        result = asyncio.run(
+            use_case.execute(CreateOrderInput(customer_id=str(uuid.uuid4()), total=100))
+        )
+
+        assert result.failure is True
+        assert str(result.errors[0]) == "Repository failed"
+        use_case.domain_event_publisher.publish.assert_not_called()
+
+    def test_publishes_order_created_event(self, use_case: AsyncCreateOrderUseCase):
+        asyncio.run(use_case.execute(CreateOrderInput(customer_id=str(uuid.uuid4()), total=100)))
+
+        use_case.domain_event_publisher.publish.assert_called_once()
+        args, _ = use_case.domain_event_publisher.publish.call_args
+        assert len(args[0]) == 1
+        assert isinstance(args[0][0], OrderCreatedEvent)
+
+    def test_publishes_recorded_event_once(self, use_case: AsyncCreateOrderUseCase):
+        result = asyncio.run(
+            use_case.execute(CreateOrderInput(customer_id=str(uuid.uuid4()), total=100))
+        )
+
+        order = result.value.order
+        args, _ = use_case.domain_event_publisher.publish.call_args
+        assert args[0][0].event_data is order
+        assert order.get_events() == []
+
+    def test_leaves_events_to_the_outbox(self, use_case: AsyncCreateOrderUseCase):
+        async def save(order: Order, expected_version=None) -> Result[None]:
+            order.pull_events()
+            return Result.ok()
+
+        use_case.repository.save.side_effect = save
+
+        result = asyncio.run(
+            use_case.execute(CreateOrderInput(customer_id=str(uuid.uuid4()), total=100))
+        )
+
+        assert result.success is True
+        use_case.domain_event_publisher.publish.assert_not_called()
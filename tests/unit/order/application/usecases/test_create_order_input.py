@@ -7,6 +7,14 @@ class TestCreateOrderInput:
         input_dto = CreateOrderInput.from_dict(data)
         assert input_dto.customer_id == "123"
         assert input_dto.total == 100.0
+        assert input_dto.currency is None
+
+    def test_from_dict_with_currency(self):
+        input_dto = CreateOrderInput.from_dict(
+            {"customer_id": "123", "total": 19.99, "currency": "USD"}
+        )
+        assert input_dto.total == 19.99
+        assert input_dto.currency == "USD"
 
     def test_from_dict_without_data(self):
         data = {}
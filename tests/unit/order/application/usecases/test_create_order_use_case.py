@@ -9,7 +9,7 @@ from src.order.application.usecases import CreateOrderUseCase
 from src.order.domain import Order
 from src.order.domain.events import OrderCreatedEvent
 from src.shared.application import UseCase
-from src.shared.domain.core import Result
+from src.shared.domain.core import Money, Result
 from src.shared.domain.errors import UUIDFormatError
 from src.shared.domain.events import DomainEventPublisher
 
@@ -53,7 +53,17 @@ class TestCreateOrderUseCase:
         assert isinstance(result.value, CreateOrderOutput)
         assert isinstance(result.value.order, Order)
         assert result.value.order.customer_id == customer_id
-        assert result.value.order.total == 100
+        assert result.value.order.total == Money.of(100)
+
+    def test_create_order_use_case_execute_with_currency(
+        self, create_order_use_case: CreateOrderUseCase
+    ):
+        input = CreateOrderInput(customer_id=str(uuid.uuid4()), total=19.99, currency="USD")
+
+        result = create_order_use_case.execute(input)
+
+        assert result.success is True
+        assert result.value.order.total == Money(1999, "USD")
 
     def test_create_order_use_case_execute_with_invalid_input(
         self, create_order_use_case: CreateOrderUseCase
@@ -84,7 +94,7 @@ class TestCreateOrderUseCase:
         assert isinstance(args[0], Order)
         assert args[0].id is not None
         assert args[0].customer_id == customer_id
-        assert args[0].total == 100
+        assert args[0].total == Money.of(100)
 
     def test_create_order_use_case_should_return_failure_when_repository_fails(
         self, create_order_use_case: CreateOrderUseCase
@@ -118,3 +128,32 @@ class TestCreateOrderUseCase:
         args, _ = create_order_use_case.domain_event_publisher.publish.call_args
         assert len(args[0]) == 1
         assert isinstance(args[0][0], OrderCreatedEvent)
+
+    def test_create_order_use_case_should_publish_recorded_event_once(
+        self, create_order_use_case: CreateOrderUseCase
+    ):
+        input = CreateOrderInput(customer_id=str(uuid.uuid4()), total=100)
+
+        result = create_order_use_case.execute(input)
+
+        order = result.value.order
+        args, _ = create_order_use_case.domain_event_publisher.publish.call_args
+        assert args[0][0].event_data is order
+        assert order.get_events() == []
+        assert order._domain_events is None
+
+    def test_create_order_use_case_should_leave_events_to_the_outbox(
+        self, create_order_use_case: CreateOrderUseCase
+    ):
+        def save(order: Order, expected_version=None) -> Result[None]:
+            order.pull_events()
+            return Result.ok()
+
+        create_order_use_case.repository.save.side_effect = save
+
+        input = CreateOrderInput(customer_id=str(uuid.uuid4()), total=100)
+
+        result = create_order_use_case.execute(input)
+
+        assert result.success is True
+        create_order_use_case.domain_event_publisher.publish.assert_not_called()
@@ -189,3 +189,8 @@ class TestCustomer:
         assert result.value.created_at == data["created_at"]
         assert result.value.updated_at == data["updated_at"]
         assert result.value.deleted_at == data["deleted_at"]
+
+    def test_customer_has_no_instance_dict(self):
+        customer = Customer.create(name="Any name", email="any_email@mail.com").value
+
+        assert not hasattr(customer, "__dict__")
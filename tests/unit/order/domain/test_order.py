@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from src.order.domain import Customer, Order
-from src.shared.domain.core import Aggregate
+from src.shared.domain.core import Aggregate, Money
 from src.shared.domain.errors import CurrencyError, RequiredError, UUIDFormatError
 
 
@@ -26,7 +26,7 @@ class TestOrder:
         assert isinstance(result.value, Order)
         assert isinstance(result.value.id, uuid.UUID)
         assert str(result.value.customer_id) == str(customer_id)
-        assert result.value.total == total
+        assert result.value.total == Money.of(total)
         assert isinstance(result.value.created_at, datetime)
         assert isinstance(result.value.updated_at, datetime)
         assert result.value.deleted_at is None
@@ -84,7 +84,7 @@ class TestOrder:
 
         order.update_total(200.0)
 
-        assert order.total == 200.0
+        assert order.total == Money.of(200.0)
         assert order.updated_at > original_updated_at
         assert str(order.customer_id) == str(valid_customer.id)
 
@@ -121,7 +121,7 @@ class TestOrder:
             assert result.failure is True
             assert len(result.errors) == 1
             assert result.errors[0] == CurrencyError("total", value)
-            assert order.total == 100.0
+            assert order.total == Money.of(100.0)
 
     def test_load_existing_order(self, valid_customer):
         order_id = uuid.uuid4()
@@ -138,15 +138,17 @@ class TestOrder:
             created_at=created_at,
             updated_at=updated_at,
             deleted_at=deleted_at,
+            version=3,
         ).value
 
         assert str(order.id) == str(order_id)
         assert str(order.customer_id) == str(customer_id)
-        assert order.total == total
+        assert order.total == Money.of(total)
         assert order.created_at == created_at
         assert order.updated_at == updated_at
         assert order.deleted_at == deleted_at
         assert order.is_deleted is True
+        assert order.version == 3
 
     def test_order_soft_delete(self, valid_customer):
         order = Order.create(customer_id=str(valid_customer.id), total=100.0).value
@@ -158,7 +160,7 @@ class TestOrder:
         assert order.is_deleted is True
         assert isinstance(order.deleted_at, datetime)
 
-        assert order.total == 100.0
+        assert order.total == Money.of(100.0)
         assert str(order.customer_id) == str(valid_customer.id)
 
     def test_order_to_dict(self, valid_customer):
@@ -182,6 +184,7 @@ class TestOrder:
         assert result["total"] == total
         assert "created_at" in result
         assert "updated_at" in result
+        assert result["version"] == 0
 
     def test_create_from_dict(self, valid_customer):
         data = {
@@ -197,7 +200,78 @@ class TestOrder:
 
         assert str(order.id) == str(data["id"])
         assert str(order.customer_id) == str(data["customer_id"])
-        assert order.total == data["total"]
+        assert order.total == Money.of(data["total"])
         assert order.created_at == data["created_at"]
         assert order.updated_at == data["updated_at"]
         assert order.deleted_at == data["deleted_at"]
+
+    def test_version_round_trips_through_dict(self, valid_customer):
+        order = Order.create(customer_id=str(valid_customer.id), total=100.0).value
+        order.version = 7
+
+        loaded = Order.from_dict(order.to_dict()).value
+
+        assert order.version == 7
+        assert loaded.version == 7
+
+    def test_order_has_no_instance_dict(self, valid_customer):
+        order = Order.create(customer_id=str(valid_customer.id), total=100.0).value
+
+        assert not hasattr(order, "__dict__")
+        with pytest.raises(AttributeError):
+            order.unknown = True
+
+    def test_create_order_with_money_total(self, valid_customer):
+        total = Money.of(49.9, "USD")
+
+        order = Order.create(customer_id=str(valid_customer.id), total=total).value
+        order.update_total(59.9)
+
+        assert order.total == Money(5990, "USD")
+
+    def test_create_order_in_currency(self, valid_customer):
+        order = Order.create(customer_id=str(valid_customer.id), total=19.99, currency="USD").value
+
+        assert order.total == Money(1999, "USD")
+
+    def test_create_order_with_invalid_currency(self, valid_customer):
+        customer_id = str(valid_customer.id)
+
+        invalid = Order.create(customer_id=customer_id, total=19.99, currency="usd")
+        mismatched = Order.create(customer_id=customer_id, total=Money(1999, "BRL"), currency="USD")
+
+        assert invalid.errors == [CurrencyError("currency", "usd")]
+        assert mismatched.errors == [CurrencyError("currency", "USD")]
+
+    def test_update_total_rejects_another_currency(self, valid_customer):
+        order = Order.create(customer_id=str(valid_customer.id), total=Money(1999, "USD")).value
+
+        result = order.update_total(Money(2999, "BRL"))
+
+        assert result.failure is True
+        assert result.errors[0] == CurrencyError("total", Money(2999, "BRL"))
+        assert order.total == Money(1999, "USD")
+
+    def test_create_order_with_total_too_large_to_store(self, valid_customer):
+        result = Order.create(customer_id=str(valid_customer.id), total=1e17)
+
+        assert result.failure is True
+        assert result.errors[0] == CurrencyError("total", 1e17)
+
+    def test_money_round_trips_through_dict(self, valid_customer):
+        order = Order.create(customer_id=str(valid_customer.id), total=Money(1999, "USD")).value
+
+        data = order.to_dict()
+        loaded = Order.from_dict(data).value
+
+        assert (data["total"], data["currency"]) == (19.99, "USD")
+        assert loaded.total == Money(1999, "USD")
+
+    def test_validate_columns(self, valid_customer):
+        customer_id = str(valid_customer.id)
+
+        result = Order.validate_columns([100.0, 0, 50.5], [customer_id, customer_id, "invalid"])
+
+        assert result.failed_rows == [1, 2]
+        assert result.errors[1] == [CurrencyError("total", 0)]
+        assert result.errors[2] == [UUIDFormatError("customer_id", "invalid")]
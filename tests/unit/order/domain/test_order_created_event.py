@@ -44,3 +44,12 @@ class TestOrderCreatedEvent:
 
         expected_repr = f"OrderCreatedEvent(id={sample_order.id})"
         assert repr_str == expected_repr
+
+    def test_restore_from_dict(self, sample_order):
+        event = OrderCreatedEvent(sample_order)
+
+        restored = OrderCreatedEvent.restore(event.to_dict(), sample_order)
+
+        assert isinstance(restored, OrderCreatedEvent)
+        assert restored.to_dict() == event.to_dict()
+        assert restored.event_data is sample_order
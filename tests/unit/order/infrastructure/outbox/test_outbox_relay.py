@@ -0,0 +1,158 @@
+import uuid
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from src.order.domain import Order
+from src.order.infrastructure.outbox import OutboxRelay
+from src.order.infrastructure.repositories import InMemoryOrderRepository, SqliteOrderRepository
+from src.shared.domain.core import Result
+from src.shared.domain.events import DomainEvent, DomainEventHandler, DomainEventPublisher
+from src.shared.infrastructure.events import QueuedDomainEventPublisher
+
+
+class RecordingHandler(DomainEventHandler):
+    def __init__(self):
+        self.events: List[DomainEvent] = []
+
+    def handle(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+
+class TestOutboxRelay:
+    @pytest.fixture
+    def repository(self) -> InMemoryOrderRepository:
+        return InMemoryOrderRepository(outbox=True)
+
+    @pytest.fixture
+    def handler(self) -> RecordingHandler:
+        return RecordingHandler()
+
+    @pytest.fixture
+    def publisher(self, handler: RecordingHandler) -> DomainEventPublisher:
+        publisher = DomainEventPublisher()
+        publisher.subscribe("OrderCreatedEvent", handler)
+        return publisher
+
+    def _save_orders(self, repository, count: int) -> List[Order]:
+        orders = [Order.create(str(uuid.uuid4()), 10.0).value for _ in range(count)]
+        for order in orders:
+            repository.save(order)
+        return orders
+
+    def test_relay_once_publishes_and_marks_a_batch(
+        self, repository, publisher, handler: RecordingHandler
+    ):
+        orders = self._save_orders(repository, 3)
+        relay = OutboxRelay(repository, publisher, batch_size=2)
+
+        result = relay.relay_once()
+
+        assert result.value == 2
+        assert [event.aggregate_id for event in handler.events] == [o.id for o in orders[:2]]
+        assert len(repository.pending_events().value) == 1
+
+    def test_relay_pending_publishes_everything(
+        self, repository, publisher, handler: RecordingHandler
+    ):
+        orders = self._save_orders(repository, 5)
+        relay = OutboxRelay(repository, publisher, batch_size=2)
+
+        result = relay.relay_pending()
+
+        assert result.value == 5
+        assert [event.aggregate_id for event in handler.events] == [o.id for o in orders]
+        assert repository.pending_events().value == []
+        assert relay.relay_once().value == 0
+
+    def test_failed_publish_keeps_events_pending(self, repository):
+        self._save_orders(repository, 2)
+        publisher = Mock(spec=DomainEventPublisher)
+        publisher.deliver.side_effect = RuntimeError("broker down")
+        relay = OutboxRelay(repository, publisher)
+
+        result = relay.relay_once()
+
+        assert result.failure is True
+        assert len(repository.pending_events().value) == 2
+
+    def test_event_a_handler_failed_on_stays_pending(self, repository, publisher, handler):
+        class FailingHandler(DomainEventHandler):
+            def handle(self, event: DomainEvent) -> None:
+                raise RuntimeError("mail server down")
+
+        self._save_orders(repository, 1)
+        publisher.subscribe("OrderCreatedEvent", FailingHandler())
+        relay = OutboxRelay(repository, publisher)
+
+        result = relay.relay_once()
+
+        assert result.value == 0
+        assert len(repository.pending_events().value) == 1
+        assert len(handler.events) == 1
+
+    def test_marks_only_delivered_events(self, repository):
+        orders = self._save_orders(repository, 3)
+        publisher = Mock(spec=DomainEventPublisher)
+        publisher.deliver.return_value = [True, False, True]
+
+        result = OutboxRelay(repository, publisher).relay_once()
+
+        assert result.value == 2
+        pending = repository.pending_events().value
+        assert [message.event.aggregate_id for message in pending] == [orders[1].id]
+
+    @pytest.mark.parametrize(
+        "policy", [QueuedDomainEventPublisher.DROP_OLDEST, QueuedDomainEventPublisher.REJECT]
+    )
+    def test_refuses_queue_that_can_lose_events(self, repository, policy):
+        publisher = QueuedDomainEventPublisher(workers=1, policy=policy)
+        try:
+            with pytest.raises(ValueError):
+                OutboxRelay(repository, publisher)
+        finally:
+            publisher.close(5)
+
+    def test_failed_read_is_returned(self, publisher):
+        repository = Mock(spec=InMemoryOrderRepository)
+        repository.pending_events.return_value = Result.fail([RuntimeError("disk")])
+
+        result = OutboxRelay(repository, publisher).relay_once()
+
+        assert result.failure is True
+        repository.mark_events_published.assert_not_called()
+
+    def test_waits_for_queued_publisher_before_marking(self, repository, handler):
+        self._save_orders(repository, 10)
+        publisher = QueuedDomainEventPublisher(workers=2)
+        publisher.subscribe("OrderCreatedEvent", handler)
+
+        OutboxRelay(repository, publisher).relay_pending()
+
+        assert len(handler.events) == 10
+        publisher.close(5)
+
+    def test_background_relay_and_close(self, repository, publisher, handler):
+        relay = OutboxRelay(repository, publisher, interval=0.01)
+        relay.start()
+        relay.start()
+        self._save_orders(repository, 3)
+
+        relay.close()
+
+        assert len(handler.events) == 3
+        assert repository.pending_events().value == []
+
+    def test_relays_sqlite_outbox(self, tmp_path, publisher, handler: RecordingHandler):
+        repository = SqliteOrderRepository(str(tmp_path / "orders.sqlite3"), outbox=True)
+        try:
+            orders = self._save_orders(repository, 3)
+
+            OutboxRelay(repository, publisher).relay_pending()
+
+            assert [event.aggregate_id for event in handler.events] == [o.id for o in orders]
+            assert [event.event_data.id for event in handler.events] == [o.id for o in orders]
+            assert repository.pending_events().value == []
+        finally:
+            repository.close()
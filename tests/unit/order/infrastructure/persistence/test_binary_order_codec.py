@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timezone
+
+from src.order.domain import Order
+from src.order.infrastructure.persistence import BinaryOrderCodec
+
+
+class TestBinaryOrderCodec:
+    def test_round_trip(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=123.45).value
+        order.version = 5
+
+        decoded = BinaryOrderCodec.decode(BinaryOrderCodec.encode(order))
+
+        assert decoded.id == order.id
+        assert decoded.customer_id == uuid.UUID(order.customer_id)
+        assert decoded.total == order.total
+        assert decoded.created_at == order.created_at
+        assert decoded.updated_at == order.updated_at
+        assert decoded.deleted_at is None
+        assert decoded.is_deleted is False
+        assert decoded.version == 5
+
+    def test_round_trip_deleted_order(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+        order.delete()
+
+        decoded = BinaryOrderCodec.decode(BinaryOrderCodec.encode(order))
+
+        assert decoded.deleted_at == order.deleted_at
+        assert decoded.is_deleted is True
+
+    def test_encoded_record_has_fixed_size(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+        assert len(BinaryOrderCodec.encode(order)) == BinaryOrderCodec.SIZE
+
+    def test_decode_all(self):
+        orders = [Order.create(customer_id=str(uuid.uuid4()), total=10.0).value for _ in range(3)]
+        buffer = b"".join(BinaryOrderCodec.encode(order) for order in orders)
+
+        decoded = list(BinaryOrderCodec.decode_all(buffer))
+
+        assert [order.id for order in decoded] == [order.id for order in orders]
+
+    def test_aware_datetimes_are_stored_as_utc(self):
+        value = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        micros = BinaryOrderCodec.to_micros(value)
+
+        assert BinaryOrderCodec.from_micros(micros) == datetime(2024, 1, 1, 12, 0)
@@ -0,0 +1,51 @@
+import json
+import uuid
+
+from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
+from src.order.infrastructure.persistence import JsonOrderCodec
+from src.shared.domain.core import Money
+
+
+class TestJsonOrderCodec:
+    def test_order_round_trip(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=Money(1999, "USD")).value
+        order.version = 3
+        order.delete()
+
+        decoded = JsonOrderCodec.decode_order(
+            json.loads(JsonOrderCodec.dumps(JsonOrderCodec.encode_order(order)))
+        )
+
+        assert decoded.id == order.id
+        assert decoded.customer_id == uuid.UUID(order.customer_id)
+        assert decoded.total == Money(1999, "USD")
+        assert decoded.created_at == order.created_at
+        assert decoded.deleted_at == order.deleted_at
+        assert decoded.version == 3
+
+    def test_event_round_trip(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+        [data] = JsonOrderCodec.encode_events(order)
+        event = JsonOrderCodec.decode_event(json.loads(JsonOrderCodec.dumps(data)))
+
+        assert isinstance(event, OrderCreatedEvent)
+        assert event.aggregate_id == order.id
+        assert event.event_data.total == order.total
+
+    def test_encoded_events_do_not_follow_later_changes(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+        [data] = JsonOrderCodec.encode_events(order)
+        order.update_total(20.0)
+
+        assert JsonOrderCodec.decode_event(data).event_data.total == Money.of(10.0)
+
+    def test_keeps_totals_beyond_float_precision(self):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=Money(Money.MAX_AMOUNT)).value
+
+        data = json.loads(JsonOrderCodec.dumps(JsonOrderCodec.encode_order(order)))
+
+        assert data["total_cents"] == Money.MAX_AMOUNT
+        assert JsonOrderCodec.decode_order(data).total == Money(Money.MAX_AMOUNT)
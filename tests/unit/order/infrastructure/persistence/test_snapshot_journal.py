@@ -0,0 +1,231 @@
+import os
+import threading
+import uuid
+
+import pytest
+
+from src.order.domain import Order
+from src.order.infrastructure.persistence import BinaryOrderCodec, SnapshotJournal
+from src.order.infrastructure.repositories import InMemoryOrderRepository
+from src.shared.domain.core import Money
+
+
+class TestSnapshotJournal:
+    @pytest.fixture
+    def directory(self, tmp_path) -> str:
+        return str(tmp_path / "store")
+
+    def _order(self) -> Order:
+        return Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+    def _reopen(self, directory: str, outbox: bool = False, **kwargs) -> InMemoryOrderRepository:
+        return InMemoryOrderRepository(
+            persistence=SnapshotJournal(directory, **kwargs), outbox=outbox
+        )
+
+    def _pending(self, repository: InMemoryOrderRepository) -> list:
+        return [
+            (message.sequence, message.event.aggregate_id)
+            for message in repository.pending_events().value
+        ]
+
+    def test_restores_orders_from_journal(self, directory):
+        repository = self._reopen(directory)
+        order = self._order()
+        repository.save(order)
+        order.update_total(20.0)
+        repository.save(order)
+        repository.save_many([self._order(), self._order()])
+        repository.close()
+
+        restored = self._reopen(directory)
+
+        assert restored.count() == 3
+        assert restored.get_by_id(order.id).value.total == Money.of(20.0)
+        assert restored.get_by_id(order.id).value.version == 2
+        assert len(restored.get_by_customer(order.customer_id).value) == 1
+        assert restored.save(order, expected_version=1).failure is True
+        restored.close()
+
+    def test_restores_orders_from_snapshot_and_journal_tail(self, directory):
+        repository = self._reopen(directory)
+        before = [self._order() for _ in range(3)]
+        repository.save_many(before)
+        assert repository.snapshot() is True
+        after = self._order()
+        repository.save(after)
+        repository.close()
+
+        journals = [name for name in os.listdir(directory) if "journal" in name]
+        restored = self._reopen(directory)
+
+        assert len(journals) == 1
+        assert restored.count() == 4
+        assert restored.get_by_id(after.id).value.id == after.id
+        assert {order.id for order in restored.iter_orders()} == {
+            order.id for order in before + [after]
+        }
+        restored.close()
+
+    def test_snapshot_runs_in_background_when_due(self, directory):
+        repository = self._reopen(directory, snapshot_interval=5)
+        orders = [self._order() for _ in range(7)]
+
+        for order in orders:
+            repository.save(order)
+        repository._persistence.wait()
+        repository.close()
+
+        assert os.path.exists(os.path.join(directory, SnapshotJournal.SNAPSHOT_FILE))
+        restored = self._reopen(directory)
+        assert restored.count() == 7
+        restored.close()
+
+    def test_background_snapshot_is_not_affected_by_later_changes(self, directory, monkeypatch):
+        release = threading.Event()
+        write_snapshot = SnapshotJournal._write_snapshot
+
+        def delayed_write(journal, *args):
+            release.wait(5)
+            write_snapshot(journal, *args)
+
+        monkeypatch.setattr(SnapshotJournal, "_write_snapshot", delayed_write)
+        repository = self._reopen(directory)
+        order = self._order()
+        repository.save(order)
+
+        assert repository.snapshot(wait=False) is True
+        order.update_total(99.0)
+        release.set()
+        repository.close()
+
+        restored = self._reopen(directory)
+        assert restored.get_by_id(order.id).value.total == Money.of(10.0)
+        restored.close()
+
+    def test_background_snapshot_encodes_on_the_writer_thread(self, directory, monkeypatch):
+        encode = BinaryOrderCodec.encode
+        threads = []
+
+        def recording_encode(order):
+            threads.append(threading.current_thread().name)
+            return encode(order)
+
+        repository = self._reopen(directory)
+        repository.save_many([self._order(), self._order()])
+        monkeypatch.setattr(BinaryOrderCodec, "encode", staticmethod(recording_encode))
+
+        assert repository.snapshot(wait=False) is True
+        repository._persistence.wait()
+        repository.close()
+
+        assert threads == ["order-snapshot", "order-snapshot"]
+        restored = self._reopen(directory)
+        assert restored.count() == 2
+        restored.close()
+
+    def test_ignores_torn_journal_tail(self, directory):
+        repository = self._reopen(directory)
+        committed = self._order()
+        repository.save(committed)
+        repository.save(self._order())
+        repository.close()
+
+        path = os.path.join(directory, f"{SnapshotJournal.JOURNAL_PREFIX}{0:08d}")
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 5)
+
+        restored = self._reopen(directory)
+        after = self._order()
+        restored.save(after)
+        restored.close()
+
+        reopened = self._reopen(directory)
+        assert {order.id for order in reopened.iter_orders()} == {committed.id, after.id}
+        reopened.close()
+
+    def test_rejects_corrupted_snapshot(self, directory):
+        repository = self._reopen(directory)
+        repository.save(self._order())
+        repository.snapshot()
+        repository.close()
+
+        path = os.path.join(directory, SnapshotJournal.SNAPSHOT_FILE)
+        with open(path, "r+b") as file:
+            file.seek(SnapshotJournal.SNAPSHOT_HEADER.size)
+            file.write(b"\xff")
+
+        with pytest.raises(ValueError):
+            self._reopen(directory)
+
+    def test_clear_removes_persisted_orders(self, directory):
+        repository = self._reopen(directory)
+        repository.save(self._order())
+        repository.snapshot()
+        repository.save(self._order())
+
+        repository.clear()
+        repository.close()
+
+        restored = self._reopen(directory)
+        assert restored.count() == 0
+        restored.close()
+
+    def test_restores_pending_events_until_published(self, directory):
+        repository = self._reopen(directory, outbox=True)
+        orders = [self._order() for _ in range(3)]
+        repository.save(orders[0])
+        repository.save_many(orders[1:])
+        repository.mark_events_published([1])
+        repository.close()
+
+        restored = self._reopen(directory, outbox=True)
+        assert self._pending(restored) == [(2, orders[1].id), (3, orders[2].id)]
+        restored.mark_events_published([2, 3])
+        later = self._order()
+        restored.save(later)
+        restored.close()
+
+        reopened = self._reopen(directory, outbox=True)
+        assert self._pending(reopened) == [(4, later.id)]
+        reopened.close()
+
+    def test_snapshot_keeps_pending_events(self, directory):
+        repository = self._reopen(directory, outbox=True)
+        orders = [self._order() for _ in range(5)]
+        for order in orders:
+            repository.save(order)
+        repository.mark_events_published([1, 2, 3, 4])
+
+        repository.snapshot()
+        repository.mark_events_published([5])
+        later = self._order()
+        repository.save(later)
+        repository.close()
+
+        assert sorted(os.listdir(directory)) == [
+            f"{SnapshotJournal.JOURNAL_PREFIX}{1:08d}",
+            SnapshotJournal.SNAPSHOT_FILE,
+        ]
+        restored = self._reopen(directory, outbox=True)
+        assert self._pending(restored) == [(6, later.id)]
+        restored.close()
+
+    def test_torn_batch_drops_order_and_its_events_together(self, directory):
+        repository = self._reopen(directory, outbox=True)
+        first = self._order()
+        repository.save(first)
+        repository.save(self._order())
+        repository.close()
+
+        path = os.path.join(directory, f"{SnapshotJournal.JOURNAL_PREFIX}{0:08d}")
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 5)
+
+        restored = self._reopen(directory, outbox=True)
+        assert restored.count() == 1
+        assert self._pending(restored) == [(1, first.id)]
+        restored.close()
+
+    def test_snapshot_without_persistence(self):
+        assert InMemoryOrderRepository().snapshot() is False
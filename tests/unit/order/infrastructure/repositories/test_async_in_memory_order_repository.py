@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.order.application.ports import OrderVersionConflictError
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    AsyncInMemoryOrderRepository,
+    StripedInMemoryOrderRepository,
+)
+
+
+class TestAsyncInMemoryOrderRepository:
+    @pytest.fixture
+    def repository(self) -> AsyncInMemoryOrderRepository:
+        return AsyncInMemoryOrderRepository()
+
+    def _order(self, customer_id: str | None = None) -> Order:
+        return Order.create(customer_id=customer_id or str(uuid.uuid4()), total=10.0).value
+
+    def test_save_and_get_by_id(self, repository: AsyncInMemoryOrderRepository):
+        order = self._order()
+
+        async def scenario():
+            saved = await repository.save(order)
+            return saved, await repository.get_by_id(order.id)
+
+        saved, loaded = asyncio.run(scenario())
+
+        assert saved.success is True
+        assert loaded.value == order
+
+    def test_save_many_get_by_customer_and_get_all(self, repository: AsyncInMemoryOrderRepository):
+        customer_id = str(uuid.uuid4())
+        orders = [self._order(customer_id), self._order(customer_id), self._order()]
+
+        async def scenario():
+            await repository.save_many(orders)
+            return await repository.get_by_customer(customer_id), await repository.get_all()
+
+        by_customer, everything = asyncio.run(scenario())
+
+        assert {order.id for order in by_customer.value} == {orders[0].id, orders[1].id}
+        assert {order.id for order in everything.value} == {order.id for order in orders}
+
+    def test_save_with_stale_expected_version(self, repository: AsyncInMemoryOrderRepository):
+        order = self._order()
+
+        async def scenario():
+            await repository.save(order)
+            return await repository.save(order, expected_version=0)
+
+        result = asyncio.run(scenario())
+
+        assert result.failure is True
+        assert isinstance(result.errors[0], OrderVersionConflictError)
+
+    def test_wraps_given_repository(self):
+        backend = StripedInMemoryOrderRepository(shards=2)
+        repository = AsyncInMemoryOrderRepository(backend)
+        order = self._order()
+
+        asyncio.run(repository.save(order))
+
+        assert repository.repository is backend
+        assert backend.get_by_id(order.id).value == order
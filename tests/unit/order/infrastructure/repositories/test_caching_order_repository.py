@@ -0,0 +1,181 @@
+import uuid
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.order.application.ports import OrderVersionConflictError
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    CachingOrderRepository,
+    InMemoryOrderRepository,
+)
+from src.shared.domain.core import Money, Result
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachingOrderRepository:
+    @pytest.fixture
+    def backend(self) -> InMemoryOrderRepository:
+        return InMemoryOrderRepository()
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def repository(self, backend, clock) -> CachingOrderRepository:
+        return CachingOrderRepository(backend, max_size=2, ttl=10.0, clock=clock)
+
+    def _order(self) -> Order:
+        return Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+    def test_get_by_id_is_served_from_cache(self, repository, backend):
+        order = self._order()
+        repository.save(order)
+        backend.get_by_id = Mock(wraps=backend.get_by_id)
+
+        first = repository.get_by_id(order.id)
+        second = repository.get_by_id(order.id)
+
+        assert first.value == order
+        assert second.value == order
+        assert backend.get_by_id.call_count == 1
+        assert repository.stats.hits == 1
+        assert repository.stats.misses == 1
+        assert repository.stats.hit_rate == 0.5
+
+    def test_cached_order_is_not_shared_between_callers(self, repository):
+        order = self._order()
+        repository.save(order)
+        repository.get_by_id(order.id)
+
+        first = repository.get_by_id(order.id).value
+        first.update_total(99.0)
+        second = repository.get_by_id(order.id).value
+
+        assert first is not second
+        assert second.total == Money.of(10.0)
+        assert repository.stats.hits == 2
+
+    def test_caches_negative_lookups(self, repository, backend):
+        backend.get_by_id = Mock(wraps=backend.get_by_id)
+        order_id = uuid.uuid4()
+
+        repository.get_by_id(order_id)
+        result = repository.get_by_id(order_id)
+
+        assert result.success is True
+        assert result.value is None
+        assert backend.get_by_id.call_count == 1
+
+    def test_save_invalidates_cached_entry(self, repository):
+        order = self._order()
+        repository.get_by_id(order.id)
+
+        repository.save(order)
+
+        assert repository.get_by_id(order.id).value == order
+        assert repository.stats.misses == 2
+
+    def test_save_many_invalidates_cached_entries(self, repository):
+        orders = [self._order(), self._order()]
+        for order in orders:
+            repository.get_by_id(order.id)
+
+        repository.save_many(order for order in orders)
+
+        assert [repository.get_by_id(order.id).value for order in orders] == orders
+
+    def test_entries_expire_after_ttl(self, repository, clock):
+        order = self._order()
+        repository.save(order)
+        repository.get_by_id(order.id)
+
+        clock.now = 11.0
+        repository.get_by_id(order.id)
+
+        assert repository.stats.hits == 0
+        assert repository.stats.misses == 2
+
+    def test_evicts_least_recently_used(self, repository):
+        orders = [self._order() for _ in range(3)]
+        repository.save_many(orders)
+
+        repository.get_by_id(orders[0].id)
+        repository.get_by_id(orders[1].id)
+        repository.get_by_id(orders[0].id)
+        repository.get_by_id(orders[2].id)
+        repository.get_by_id(orders[0].id)
+        repository.get_by_id(orders[1].id)
+
+        stats = repository.stats
+        assert stats.evictions == 2
+        assert stats.size == 2
+        assert stats.hits == 2
+
+    def test_does_not_cache_value_read_before_concurrent_save(self, repository, backend):
+        order = self._order()
+        get_by_id = backend.get_by_id
+
+        def save_while_reading(order_id):
+            result = get_by_id(order_id)
+            repository.save(order)
+            return result
+
+        backend.get_by_id = save_while_reading
+        assert repository.get_by_id(order.id).value is None
+
+        backend.get_by_id = get_by_id
+        assert repository.get_by_id(order.id).value == order
+
+    def test_failures_are_not_cached(self, repository, backend):
+        backend.get_by_id = Mock(return_value=Result.fail([Exception("boom")]))
+        order_id = uuid.uuid4()
+
+        repository.get_by_id(order_id)
+        repository.get_by_id(order_id)
+
+        assert backend.get_by_id.call_count == 2
+        assert repository.stats.size == 0
+
+    def test_delegates_queries(self, repository):
+        order = self._order()
+        repository.save(order)
+
+        assert repository.get_by_customer(order.customer_id).value == [order]
+        assert list(repository.iter_orders()) == [order]
+        assert repository.page().value.orders == [order]
+        assert repository.find_between(
+            order.created_at, order.created_at + timedelta(seconds=1)
+        ).value == [order]
+        assert repository.count() == 1
+
+    def test_clear_empties_backend_and_cache(self, repository):
+        order = self._order()
+        repository.save(order)
+        repository.get_by_id(order.id)
+
+        repository.clear()
+
+        assert repository.count() == 0
+        assert repository.stats.size == 0
+        assert repository.get_by_id(order.id).value is None
+
+    def test_save_passes_expected_version_and_invalidates_on_conflict(self, repository):
+        order = self._order()
+        repository.save(order)
+        repository.get_by_id(order.id)
+
+        result = repository.save(order, expected_version=0)
+
+        assert result.failure is True
+        assert isinstance(result.errors[0], OrderVersionConflictError)
+        assert repository.stats.size == 0
@@ -0,0 +1,141 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.order.domain import Order
+from src.order.infrastructure.repositories import ColumnarOrderRepository
+from src.shared.domain.core import Money
+
+
+class TestColumnarOrderRepository:
+    @pytest.fixture(params=[False, True], ids=["python", "numpy"])
+    def repository(self, request) -> ColumnarOrderRepository:
+        if request.param:
+            pytest.importorskip("numpy")
+        return ColumnarOrderRepository(use_numpy=request.param)
+
+    def _order(
+        self,
+        customer_id: str | None = None,
+        total: float = 10.0,
+        created_at: datetime | None = None,
+    ) -> Order:
+        created_at = created_at or datetime(2024, 1, 1)
+        return Order.load(
+            id=str(uuid.uuid4()),
+            customer_id=customer_id or str(uuid.uuid4()),
+            total=total,
+            created_at=created_at,
+            updated_at=created_at,
+        ).value
+
+    def test_save_and_get_by_id(self, repository: ColumnarOrderRepository):
+        order = self._order(total=19.99)
+
+        result = repository.save(order)
+        loaded = repository.get_by_id(order.id).value
+
+        assert result.success is True
+        assert repository.count() == 1
+        assert loaded is not order
+        assert loaded.id == order.id
+        assert loaded.customer_id == order.customer_id
+        assert loaded.total == Money.of(19.99)
+        assert loaded.created_at == order.created_at
+        assert loaded.deleted_at is None
+        assert repository.get_by_id(uuid.uuid4()).value is None
+
+    def test_save_updates_columns_in_place(self, repository: ColumnarOrderRepository):
+        order = self._order()
+        repository.save(order)
+
+        order.update_total(250.0)
+        order.delete()
+        repository.save(order)
+
+        loaded = repository.get_by_id(order.id).value
+        assert repository.count() == 1
+        assert loaded.total == Money.of(250.0)
+        assert loaded.deleted_at == order.deleted_at
+
+    def test_get_by_customer(self, repository: ColumnarOrderRepository):
+        customer_id = str(uuid.uuid4())
+        orders = [self._order(customer_id) for _ in range(3)]
+        orders[2].delete()
+        repository.save_many(orders + [self._order()])
+
+        result = repository.get_by_customer(customer_id)
+
+        assert [order.id for order in result.value] == [orders[0].id, orders[1].id]
+
+    def test_page_in_created_at_order(self, repository: ColumnarOrderRepository):
+        base = datetime(2024, 1, 1)
+        orders = [self._order(created_at=base + timedelta(minutes=minute)) for minute in (2, 0, 1)]
+        repository.save_many(orders)
+
+        first = repository.page(limit=2).value
+        last = repository.page(first.next_cursor, limit=2).value
+
+        assert [order.id for order in first.orders] == [orders[1].id, orders[2].id]
+        assert [order.id for order in last.orders] == [orders[0].id]
+
+    def test_sum_total_by_customer(self, repository: ColumnarOrderRepository):
+        first_customer = str(uuid.uuid4())
+        second_customer = str(uuid.uuid4())
+        deleted = self._order(first_customer, total=1000.0)
+        deleted.delete()
+        repository.save_many(
+            [
+                self._order(first_customer, total=10.10),
+                self._order(second_customer, total=5.0),
+                self._order(first_customer, total=0.2),
+                deleted,
+            ]
+        )
+
+        sums = repository.sum_total_by_customer()
+
+        assert sums == {
+            uuid.UUID(first_customer): Money.of(10.30),
+            uuid.UUID(second_customer): Money.of(5.0),
+        }
+
+    def test_save_rejects_other_currencies(self, repository: ColumnarOrderRepository):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=Money(1000, "USD")).value
+
+        result = repository.save(order)
+
+        assert result.failure is True
+        assert repository.count() == 0
+
+    def test_sum_total_by_customer_without_orders(self, repository: ColumnarOrderRepository):
+        assert repository.sum_total_by_customer() == {}
+
+    def test_count_between(self, repository: ColumnarOrderRepository):
+        base = datetime(2024, 1, 1, 12, 0)
+        orders = [self._order(created_at=base + timedelta(minutes=minute)) for minute in range(5)]
+        orders[1].delete()
+        repository.save_many(orders)
+
+        assert repository.count_between(base, base + timedelta(minutes=3)) == 2
+        assert (
+            repository.count_between(base + timedelta(minutes=10), base + timedelta(hours=1)) == 0
+        )
+
+    def test_save_many_reports_failed_items(self, repository: ColumnarOrderRepository):
+        result = repository.save_many([self._order(), object()])
+
+        assert result.failure is True
+        assert result.errors[0].position == 1
+        assert repository.count() == 0
+
+    def test_clear(self, repository: ColumnarOrderRepository):
+        order = self._order()
+        repository.save(order)
+
+        repository.clear()
+
+        assert repository.count() == 0
+        assert repository.get_by_id(order.id).value is None
+        assert repository.sum_total_by_customer() == {}
@@ -0,0 +1,364 @@
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
+from src.order.infrastructure.repositories import FileOrderRepository
+from src.shared.domain.core import Money
+
+
+def _segments(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith(".log"))
+
+
+class TestFileOrderRepository:
+    @pytest.fixture
+    def directory(self, tmp_path):
+        return str(tmp_path / "orders")
+
+    @pytest.fixture
+    def repository(self, directory) -> FileOrderRepository:
+        repository = FileOrderRepository(directory, segment_size=4096)
+        yield repository
+        repository.close()
+
+    @pytest.fixture
+    def valid_order(self) -> Order:
+        return Order.create(customer_id=str(uuid.uuid4()), total=100.0).value
+
+    def _order(self) -> Order:
+        return Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+    def test_save_and_get_by_id(self, repository: FileOrderRepository, valid_order: Order):
+        result = repository.save(valid_order)
+
+        loaded = repository.get_by_id(valid_order.id)
+
+        assert result.success is True
+        assert repository.count() == 1
+        assert loaded.success is True
+        assert loaded.value is not valid_order
+        assert loaded.value.id == valid_order.id
+        assert loaded.value.total == valid_order.total
+        assert str(loaded.value.customer_id) == str(valid_order.customer_id)
+        assert loaded.value.created_at == valid_order.created_at
+
+    def test_get_by_id_non_existing_order(self, repository: FileOrderRepository):
+        result = repository.get_by_id(uuid.uuid4())
+
+        assert result.success is True
+        assert result.value is None
+
+    def test_save_appends_new_version(self, repository: FileOrderRepository, valid_order: Order):
+        repository.save(valid_order)
+
+        valid_order.update_total(250.0)
+        repository.save(valid_order)
+
+        assert repository.count() == 1
+        assert repository.get_by_id(valid_order.id).value.total == Money.of(250.0)
+
+    def test_orders_survive_reopening(self, directory, valid_order: Order):
+        repository = FileOrderRepository(directory, segment_size=4096)
+        repository.save(valid_order)
+        valid_order.update_total(300.0)
+        repository.save(valid_order)
+        repository.close()
+
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        try:
+            assert reopened.count() == 1
+            assert reopened.get_by_id(valid_order.id).value.total == Money.of(300.0)
+            assert reopened.get_by_id(valid_order.id).value.version == 2
+            assert reopened.save(valid_order, expected_version=1).failure is True
+
+            other = self._order()
+            reopened.save(other)
+            assert reopened.get_by_id(other.id).value.id == other.id
+        finally:
+            reopened.close()
+
+    def test_totals_beyond_float_precision_survive_reopening(self, directory):
+        totals = [Money.of("100000000000001.01"), Money(Money.MAX_AMOUNT)]
+        orders = [Order.create(str(uuid.uuid4()), total).value for total in totals]
+        repository = FileOrderRepository(directory, segment_size=4096)
+        repository.save_many(orders)
+        repository.close()
+
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        try:
+            assert [reopened.get_by_id(order.id).value.total for order in orders] == totals
+        finally:
+            reopened.close()
+
+    def test_reopening_ignores_torn_batch(self, directory):
+        repository = FileOrderRepository(directory, segment_size=4096)
+        committed = self._order()
+        repository.save(committed)
+        repository.save_many([self._order(), self._order()])
+        repository.close()
+
+        path = os.path.join(directory, _segments(directory)[-1])
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 10)
+
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        try:
+            assert reopened.count() == 1
+            assert reopened.get_by_id(committed.id).value.id == committed.id
+        finally:
+            reopened.close()
+
+    def test_rotates_segments_when_full(self, repository: FileOrderRepository, directory):
+        for _ in range(40):
+            repository.save(self._order())
+
+        assert len(_segments(directory)) > 1
+        assert len(list(repository.iter_orders())) == 40
+
+    def test_compaction_drops_superseded_and_deleted_orders(
+        self, repository: FileOrderRepository, directory
+    ):
+        kept = self._order()
+        deleted = self._order()
+        repository.save(kept)
+        repository.save(deleted)
+        for total in range(1, 40):
+            kept.update_total(float(total))
+            repository.save(kept)
+        deleted.delete()
+        repository.save(deleted)
+        for _ in range(20):
+            repository.save(self._order())
+        segments_before = _segments(directory)
+
+        compacted = repository.compact()
+
+        assert compacted == len(segments_before) - 1
+        assert len(_segments(directory)) == 2
+        assert repository.get_by_id(kept.id).value.total == Money.of(39.0)
+        assert repository.get_by_id(deleted.id).value is None
+        assert repository.count() == 21
+
+        repository.close()
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        try:
+            assert reopened.count() == 21
+            assert reopened.get_by_id(kept.id).value.total == Money.of(39.0)
+            assert reopened.get_by_id(deleted.id).value is None
+        finally:
+            reopened.close()
+
+    def test_deleted_order_stays_deleted_across_compactions_and_restarts(self, directory):
+        repository = FileOrderRepository(directory, segment_size=4096)
+        order = self._order()
+        repository.save(order)
+        for _ in range(30):
+            repository.save(self._order())
+        assert repository.compact() > 0
+        order.delete()
+        repository.save(order)
+        repository.close()
+
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        reopened.compact()
+        reopened.close()
+
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        try:
+            loaded = reopened.get_by_id(order.id).value
+            assert loaded is None or loaded.is_deleted is True
+            assert reopened.get_by_customer(order.customer_id).value == []
+        finally:
+            reopened.close()
+
+    def test_compacted_segment_stays_below_active_segment(
+        self, repository: FileOrderRepository, directory
+    ):
+        for _ in range(40):
+            repository.save(self._order())
+        segments_before = _segments(directory)
+
+        repository.compact()
+
+        assert _segments(directory) == [segments_before[0], segments_before[-1]]
+        assert not os.path.exists(os.path.join(directory, FileOrderRepository.COMPACTION_FILE))
+
+    def test_compaction_keeps_records_of_partly_superseded_batch(self, directory):
+        repository = FileOrderRepository(directory, segment_size=4096)
+        kept, superseded = self._order(), self._order()
+        repository.save_many([kept, superseded])
+        for total in range(1, 40):
+            superseded.update_total(float(total))
+            repository.save(superseded)
+
+        repository.compact()
+        repository.close()
+
+        reopened = FileOrderRepository(directory, segment_size=4096)
+        try:
+            assert reopened.count() == 2
+            assert reopened.get_by_id(kept.id).value is not None
+            assert reopened.get_by_id(superseded.id).value.total == Money.of(39.0)
+        finally:
+            reopened.close()
+
+    def test_compact_without_sealed_segments(self, repository: FileOrderRepository):
+        repository.save(self._order())
+
+        assert repository.compact() == 0
+
+    def test_background_compactor(self, repository: FileOrderRepository, directory):
+        for _ in range(40):
+            repository.save(self._order())
+
+        repository.start_compactor(interval=0.01)
+        repository.start_compactor(interval=0.01)
+        for _ in range(100):
+            if len(_segments(directory)) == 2:
+                break
+            repository._compactor_stop.wait(0.01)
+        repository.stop_compactor()
+
+        assert len(_segments(directory)) == 2
+        assert repository.count() == 40
+
+    def test_background_compactor_logs_errors(self, repository: FileOrderRepository, caplog):
+        failed = threading.Event()
+
+        def compact():
+            failed.set()
+            raise OSError("disk full")
+
+        repository.compact = compact
+        with caplog.at_level(logging.ERROR):
+            repository.start_compactor(interval=0.01)
+            assert failed.wait(5)
+            repository.stop_compactor()
+
+        assert "Error compacting order segments" in caplog.text
+
+    def test_save_many_and_get_by_customer(self, repository: FileOrderRepository):
+        customer_id = str(uuid.uuid4())
+        orders = [Order.create(customer_id=customer_id, total=10.0).value for _ in range(3)]
+        orders[2].delete()
+
+        result = repository.save_many(orders + [self._order()])
+
+        assert result.success is True
+        assert repository.count() == 4
+        customer_orders = repository.get_by_customer(customer_id).value
+        assert {order.id for order in customer_orders} == {orders[0].id, orders[1].id}
+
+    def test_save_many_reports_failed_items(self, repository: FileOrderRepository):
+        result = repository.save_many([self._order(), object()])
+
+        assert result.failure is True
+        assert result.errors[0].position == 1
+        assert repository.count() == 0
+
+    def test_page_in_created_at_order(self, repository: FileOrderRepository):
+        base = datetime(2024, 1, 1)
+        orders = []
+        for minute in (2, 0, 1):
+            created_at = base + timedelta(minutes=minute)
+            order = Order.load(
+                id=str(uuid.uuid4()),
+                customer_id=str(uuid.uuid4()),
+                total=10.0,
+                created_at=created_at,
+                updated_at=created_at,
+            ).value
+            repository.save(order)
+            orders.append(order)
+
+        first = repository.page(limit=2).value
+        last = repository.page(first.next_cursor, limit=2).value
+
+        assert [order.id for order in first.orders] == [orders[1].id, orders[2].id]
+        assert [order.id for order in last.orders] == [orders[0].id]
+
+    def test_clear(self, repository: FileOrderRepository, valid_order: Order, directory):
+        repository.save(valid_order)
+
+        repository.clear()
+
+        assert repository.count() == 0
+        assert repository.get_by_id(valid_order.id).value is None
+        assert len(_segments(directory)) == 1
+
+    def test_save_handles_exception(self, repository: FileOrderRepository):
+        result = repository.save(object())
+
+        assert result.failure is True
+        assert len(result.errors) == 1
+
+    @pytest.fixture
+    def outbox_repository(self, directory) -> FileOrderRepository:
+        repository = FileOrderRepository(directory, segment_size=4096, outbox=True)
+        yield repository
+        repository.close()
+
+    def _pending_order_ids(self, repository: FileOrderRepository) -> list:
+        return [message.event.aggregate_id for message in repository.pending_events(1000).value]
+
+    def test_save_appends_events_to_outbox(
+        self, outbox_repository: FileOrderRepository, valid_order: Order
+    ):
+        second = self._order()
+        third = self._order()
+
+        outbox_repository.save(valid_order)
+        outbox_repository.save_many([second, third])
+
+        pending = outbox_repository.pending_events().value
+        assert [message.event.aggregate_id for message in pending] == [
+            valid_order.id,
+            second.id,
+            third.id,
+        ]
+        assert isinstance(pending[0].event, OrderCreatedEvent)
+        assert valid_order.get_events() == []
+        assert outbox_repository.count() == 3
+
+    def test_outbox_survives_reopening_until_published(self, directory):
+        repository = FileOrderRepository(directory, segment_size=4096, outbox=True)
+        published = self._order()
+        pending = self._order()
+        repository.save_many([published, pending])
+        repository.mark_events_published([repository.pending_events(1).value[0].sequence])
+        repository.close()
+
+        reopened = FileOrderRepository(directory, segment_size=4096, outbox=True)
+        try:
+            assert self._pending_order_ids(reopened) == [pending.id]
+            assert reopened.count() == 2
+        finally:
+            reopened.close()
+
+    def test_compaction_keeps_pending_events(self, directory):
+        repository = FileOrderRepository(directory, segment_size=4096, outbox=True)
+        orders = [self._order() for _ in range(30)]
+        for order in orders:
+            repository.save(order)
+        messages = repository.pending_events(1000).value
+        repository.mark_events_published([message.sequence for message in messages[:10]])
+        for order in orders:
+            order.update_total(20.0)
+            repository.save(order)
+
+        assert repository.compact() > 0
+        assert self._pending_order_ids(repository) == [order.id for order in orders[10:]]
+
+        repository.close()
+        reopened = FileOrderRepository(directory, segment_size=4096, outbox=True)
+        try:
+            assert self._pending_order_ids(reopened) == [order.id for order in orders[10:]]
+            assert reopened.get_by_id(orders[0].id).value.total == Money.of(20.0)
+        finally:
+            reopened.close()
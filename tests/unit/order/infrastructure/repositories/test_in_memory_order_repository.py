@@ -1,10 +1,13 @@
 import uuid
+from datetime import datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
 
 from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
 from src.order.infrastructure.repositories import InMemoryOrderRepository
+from src.shared.domain.core import Money
 
 
 class TestInMemoryOrderRepository:
@@ -28,6 +31,7 @@ class TestInMemoryOrderRepository:
         self, repository: InMemoryOrderRepository, valid_order: Order
     ):
         mock_dict = Mock()
+        mock_dict.get = Mock(return_value=None)
         mock_dict.__setitem__ = Mock(side_effect=Exception("Database connection failed"))
 
         original_orders = repository._orders
@@ -57,8 +61,8 @@ class TestInMemoryOrderRepository:
 
         assert result1.success is True
         assert result2.success is True
-        assert result1.value.total == 100.0
-        assert result2.value.total == 200.0
+        assert result1.value.total == Money.of(100.0)
+        assert result2.value.total == Money.of(200.0)
 
     def test_save_overwrites_existing_order(
         self, repository: InMemoryOrderRepository, valid_order: Order
@@ -72,7 +76,7 @@ class TestInMemoryOrderRepository:
 
         result = repository.get_by_id(valid_order.id)
         assert result.success is True
-        assert result.value.total == 250.0
+        assert result.value.total == Money.of(250.0)
 
     def test_get_by_id_existing_order(
         self, repository: InMemoryOrderRepository, valid_order: Order
@@ -154,3 +158,208 @@ class TestInMemoryOrderRepository:
             assert "Iterator error" in str(result.errors[0])
         finally:
             repository._orders = original_orders
+
+    def test_get_by_customer_returns_only_customer_orders(
+        self, repository: InMemoryOrderRepository
+    ):
+        customer_id = str(uuid.uuid4())
+        order1 = Order.create(customer_id=customer_id, total=100.0).value
+        order2 = Order.create(customer_id=customer_id, total=200.0).value
+        other = Order.create(customer_id=str(uuid.uuid4()), total=300.0).value
+
+        repository.save(order1)
+        repository.save(order2)
+        repository.save(other)
+
+        result = repository.get_by_customer(uuid.UUID(customer_id))
+
+        assert result.success is True
+        assert {order.id for order in result.value} == {order1.id, order2.id}
+        assert repository.get_by_customer(customer_id).value == result.value
+
+    def test_get_by_customer_unknown_customer(self, repository: InMemoryOrderRepository):
+        result = repository.get_by_customer(uuid.uuid4())
+
+        assert result.success is True
+        assert result.value == []
+
+    def test_get_by_customer_follows_customer_change(
+        self, repository: InMemoryOrderRepository, valid_order: Order
+    ):
+        old_customer_id = valid_order.customer_id
+        new_customer_id = uuid.uuid4()
+        repository.save(valid_order)
+
+        valid_order.customer_id = new_customer_id
+        repository.save(valid_order)
+
+        assert repository.get_by_customer(old_customer_id).value == []
+        assert repository.get_by_customer(new_customer_id).value == [valid_order]
+        assert uuid.UUID(str(old_customer_id)) not in repository._customer_index
+
+    def test_get_by_customer_excludes_soft_deleted_orders(
+        self, repository: InMemoryOrderRepository, valid_order: Order
+    ):
+        repository.save(valid_order)
+
+        valid_order.delete()
+        repository.save(valid_order)
+
+        assert repository.get_by_customer(valid_order.customer_id).value == []
+        assert uuid.UUID(str(valid_order.customer_id)) not in repository._customer_index
+        assert repository.get_by_id(valid_order.id).value.is_deleted is True
+
+    def test_get_by_customer_handles_exception(self, repository: InMemoryOrderRepository):
+        result = repository.get_by_customer("invalid")
+
+        assert result.success is False
+        assert len(result.errors) == 1
+
+    def test_clear_resets_customer_index(
+        self, repository: InMemoryOrderRepository, valid_order: Order
+    ):
+        repository.save(valid_order)
+
+        repository.clear()
+
+        assert repository.get_by_customer(valid_order.customer_id).value == []
+
+    def _save_orders_created_at(self, repository, minutes):
+        base = datetime(2024, 1, 1, 12, 0)
+        orders = []
+        for minute in minutes:
+            created_at = base + timedelta(minutes=minute)
+            order = Order.load(
+                id=str(uuid.uuid4()),
+                customer_id=str(uuid.uuid4()),
+                total=10.0,
+                created_at=created_at,
+                updated_at=created_at,
+            ).value
+            repository.save(order)
+            orders.append(order)
+        return orders
+
+    def test_iter_orders_yields_in_created_at_order(self, repository: InMemoryOrderRepository):
+        orders = self._save_orders_created_at(repository, [3, 1, 2])
+
+        result = list(repository.iter_orders())
+
+        assert result == [orders[1], orders[2], orders[0]]
+
+    def test_iter_orders_after_id_and_limit(self, repository: InMemoryOrderRepository):
+        orders = self._save_orders_created_at(repository, [0, 1, 2, 3])
+
+        result = list(repository.iter_orders(after_id=orders[0].id, limit=2))
+
+        assert result == [orders[1], orders[2]]
+
+    def test_iter_orders_unknown_after_id(self, repository: InMemoryOrderRepository):
+        with pytest.raises(ValueError):
+            list(repository.iter_orders(after_id=uuid.uuid4()))
+
+    def test_page_walks_all_orders_with_opaque_cursor(self, repository: InMemoryOrderRepository):
+        orders = self._save_orders_created_at(repository, range(5))
+
+        first = repository.page(limit=2).value
+        second = repository.page(first.next_cursor, limit=2).value
+        last = repository.page(second.next_cursor, limit=2).value
+
+        assert first.orders == orders[0:2]
+        assert second.orders == orders[2:4]
+        assert last.orders == orders[4:]
+        assert last.has_next is False
+
+    def test_page_with_invalid_cursor(self, repository: InMemoryOrderRepository):
+        result = repository.page("invalid-cursor")
+
+        assert result.failure is True
+        assert len(result.errors) == 1
+
+    def test_save_many_saves_all_orders(self, repository: InMemoryOrderRepository):
+        customer_id = str(uuid.uuid4())
+        orders = [Order.create(customer_id=customer_id, total=10.0).value for _ in range(3)]
+
+        result = repository.save_many(orders)
+
+        assert result.success is True
+        assert repository.count() == 3
+        assert len(repository.get_by_customer(customer_id).value) == 3
+        assert set(repository.iter_orders()) == set(orders)
+
+    def test_save_many_is_atomic_and_reports_failed_items(
+        self, repository: InMemoryOrderRepository, valid_order: Order
+    ):
+        broken = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+        broken.customer_id = "invalid"
+
+        result = repository.save_many([valid_order, broken, None])
+
+        assert result.failure is True
+        assert [error.position for error in result.errors] == [1, 2]
+        assert result.errors[0].order_id == broken.id
+        assert repository.count() == 0
+
+    def test_save_many_handles_exception(
+        self, repository: InMemoryOrderRepository, valid_order: Order
+    ):
+        repository._orders = Mock()
+        repository._orders.get = Mock(return_value=None)
+        repository._orders.update = Mock(side_effect=Exception("Out of memory"))
+
+        result = repository.save_many([valid_order])
+
+        assert result.failure is True
+        assert "Out of memory" in str(result.errors[0])
+
+    def test_save_without_outbox_keeps_events_on_order(
+        self, repository: InMemoryOrderRepository, valid_order: Order
+    ):
+        repository.save(valid_order)
+
+        assert len(valid_order.get_events()) == 1
+        assert repository.pending_events().value == []
+
+    def test_save_moves_events_to_outbox(self):
+        repository = InMemoryOrderRepository(outbox=True)
+        first = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+        second = Order.create(customer_id=str(uuid.uuid4()), total=20.0).value
+
+        repository.save(first)
+        repository.save_many([second])
+
+        pending = repository.pending_events().value
+        assert [message.sequence for message in pending] == [1, 2]
+        assert all(isinstance(message.event, OrderCreatedEvent) for message in pending)
+        assert [message.event.aggregate_id for message in pending] == [first.id, second.id]
+        assert first.get_events() == []
+        assert second.get_events() == []
+
+    def test_mark_events_published_removes_them_from_outbox(self):
+        repository = InMemoryOrderRepository(outbox=True)
+        for _ in range(3):
+            repository.save(Order.create(customer_id=str(uuid.uuid4()), total=10.0).value)
+
+        assert len(repository.pending_events(limit=2).value) == 2
+        repository.mark_events_published([1, 2])
+
+        assert [message.sequence for message in repository.pending_events().value] == [3]
+
+    def test_outbox_keeps_events_as_they_were_saved(self, valid_order: Order):
+        repository = InMemoryOrderRepository(outbox=True)
+        repository.save(valid_order)
+
+        valid_order.update_total(999.0)
+
+        [message] = repository.pending_events().value
+        assert message.event.event_data.total == Money.of(100.0)
+        assert message.event.event_data is not valid_order
+
+    def test_failed_save_keeps_events_on_order(self, valid_order: Order):
+        repository = InMemoryOrderRepository(outbox=True)
+
+        result = repository.save(valid_order, expected_version=3)
+
+        assert result.failure is True
+        assert repository.pending_events().value == []
+        assert len(valid_order.get_events()) == 1
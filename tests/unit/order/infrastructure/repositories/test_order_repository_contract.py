@@ -0,0 +1,179 @@
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.order.application.ports import OrderRepository, OrderVersionConflictError
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    ColumnarOrderRepository,
+    FileOrderRepository,
+    InMemoryOrderRepository,
+    SharedMemoryOrderRepository,
+    SqliteOrderRepository,
+    StripedInMemoryOrderRepository,
+)
+
+
+class TestOrderRepositoryContract:
+    @pytest.fixture(
+        params=["memory", "striped", "columnar", "columnar-numpy", "file", "shared", "sqlite"]
+    )
+    def repository(self, request, tmp_path) -> OrderRepository:
+        backend = request.param
+        if backend == "memory":
+            yield InMemoryOrderRepository()
+        elif backend == "striped":
+            yield StripedInMemoryOrderRepository(shards=4)
+        elif backend == "columnar":
+            yield ColumnarOrderRepository(use_numpy=False)
+        elif backend == "columnar-numpy":
+            pytest.importorskip("numpy")
+            yield ColumnarOrderRepository(use_numpy=True)
+        elif backend == "file":
+            repository = FileOrderRepository(str(tmp_path / "orders"), segment_size=4096)
+            yield repository
+            repository.close()
+        elif backend == "shared":
+            repository = SharedMemoryOrderRepository(
+                f"orders-test-{uuid.uuid4().hex[:12]}",
+                capacity=16,
+                lock_path=str(tmp_path / "orders.lock"),
+            )
+            yield repository
+            repository.unlink()
+        else:
+            repository = SqliteOrderRepository(
+                str(tmp_path / "orders.sqlite3"), batch_size=4, max_batch_delay=60
+            )
+            yield repository
+            repository.close()
+
+    def _order(self) -> Order:
+        return Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+    def test_find_between(self, repository: OrderRepository):
+        base = datetime(2024, 1, 1, 12, 0)
+        orders = []
+        for minute in range(3):
+            created_at = base + timedelta(minutes=minute)
+            orders.append(
+                Order.load(
+                    id=str(uuid.uuid4()),
+                    customer_id=str(uuid.uuid4()),
+                    total=10.0,
+                    created_at=created_at,
+                    updated_at=created_at,
+                ).value
+            )
+        repository.save_many(orders)
+        orders[0].update_total(20.0)
+        orders[2].delete()
+        repository.save_many([orders[0], orders[2]])
+        now = datetime.now()
+        recent = (now - timedelta(minutes=1), now + timedelta(minutes=1))
+
+        created = repository.find_between(base, base + timedelta(minutes=2))
+        updated = repository.find_between(base, base + timedelta(hours=1), field="updated_at")
+        recently_updated = repository.find_between(*recent, field="updated_at")
+        deleted = repository.find_between(*recent, field="deleted_at")
+
+        assert [order.id for order in created.value] == [orders[0].id, orders[1].id]
+        assert [order.id for order in updated.value] == [orders[1].id, orders[2].id]
+        assert [order.id for order in recently_updated.value] == [orders[0].id]
+        assert [order.id for order in deleted.value] == [orders[2].id]
+
+    def test_find_between_unknown_field(self, repository: OrderRepository):
+        result = repository.find_between(datetime.min, datetime.max, field="total")
+
+        assert result.failure is True
+
+    def test_save_assigns_increasing_versions(self, repository: OrderRepository):
+        order = self._order()
+
+        repository.save(order)
+        repository.save(order)
+
+        assert order.version == 2
+        assert repository.get_by_id(order.id).value.version == 2
+
+    def test_save_with_expected_version(self, repository: OrderRepository):
+        order = self._order()
+
+        created = repository.save(order, expected_version=0)
+        updated = repository.save(order, expected_version=1)
+        stale = repository.save(order, expected_version=1)
+
+        assert created.success is True
+        assert updated.success is True
+        assert stale.failure is True
+        assert isinstance(stale.errors[0], OrderVersionConflictError)
+        assert stale.errors[0].actual_version == 2
+        assert order.version == 2
+        assert repository.get_by_id(order.id).value.version == 2
+
+    def test_save_with_expected_version_of_unsaved_order(self, repository: OrderRepository):
+        order = self._order()
+
+        result = repository.save(order, expected_version=3)
+
+        assert result.failure is True
+        assert result.errors[0].actual_version == 0
+        assert repository.get_by_id(order.id).value is None
+
+    def test_save_many_bumps_versions(self, repository: OrderRepository):
+        first = self._order()
+        second = self._order()
+        repository.save(first)
+
+        repository.save_many([first, second])
+
+        assert (first.version, second.version) == (2, 1)
+
+    def test_concurrent_compare_and_set_loses_no_updates(self, repository: OrderRepository):
+        # A tiny switch interval makes threads interleave inside save, where a
+        # check-then-write that is not atomic lets two of them pass the same version.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        order = self._order()
+        repository.save(order)
+        saved = []
+
+        def increment():
+            count = 0
+            for _ in range(300):
+                while True:
+                    current = repository.get_by_id(order.id).value
+                    version = current.version
+                    if repository.save(current, expected_version=version).success:
+                        count += 1
+                        break
+            saved.append(count)
+
+        try:
+            threads = [threading.Thread(target=increment) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert sum(saved) == 2400
+        assert repository.get_by_id(order.id).value.version == 1 + sum(saved)
+
+    def test_rejected_writer_leaves_stored_order_unchanged(self, repository: OrderRepository):
+        order = self._order()
+        repository.save(order)
+        winner = repository.get_by_id(order.id).value
+        loser = repository.get_by_id(order.id).value
+
+        winner.update_total(20.0)
+        repository.save(winner, expected_version=1)
+        loser.update_total(30.0)
+        rejected = repository.save(loser, expected_version=1)
+
+        assert rejected.failure is True
+        assert float(repository.get_by_id(order.id).value.total) == 20.0
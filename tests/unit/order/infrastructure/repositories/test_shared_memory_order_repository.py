@@ -0,0 +1,208 @@
+import multiprocessing
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.order.domain import Order
+from src.order.infrastructure.repositories import SharedMemoryOrderRepository
+from src.shared.domain.core import Money
+
+
+def _save_from_other_process(name: str, lock_path: str, customer_id: str, queue) -> None:
+    repository = SharedMemoryOrderRepository(name, capacity=16, lock_path=lock_path)
+    order = Order.create(customer_id=customer_id, total=42.5).value
+    repository.save(order)
+    repository.close()
+    queue.put(str(order.id))
+
+
+class TestSharedMemoryOrderRepository:
+    @pytest.fixture
+    def name(self) -> str:
+        return f"orders-test-{uuid.uuid4().hex[:12]}"
+
+    @pytest.fixture
+    def lock_path(self, tmp_path) -> str:
+        return str(tmp_path / "orders.lock")
+
+    @pytest.fixture
+    def repository(self, name, lock_path) -> SharedMemoryOrderRepository:
+        repository = SharedMemoryOrderRepository(name, capacity=16, lock_path=lock_path)
+        yield repository
+        repository.unlink()
+
+    def _order(self, customer_id: str | None = None, total: float = 10.0) -> Order:
+        return Order.create(customer_id=customer_id or str(uuid.uuid4()), total=total).value
+
+    def test_save_and_get_by_id(self, repository: SharedMemoryOrderRepository):
+        order = self._order(total=19.99)
+
+        result = repository.save(order)
+        loaded = repository.get_by_id(order.id).value
+
+        assert result.success is True
+        assert repository.count() == 1
+        assert loaded is not order
+        assert loaded.id == order.id
+        assert str(loaded.customer_id) == str(order.customer_id)
+        assert loaded.total == Money.of(19.99)
+        assert loaded.created_at == order.created_at
+        assert loaded.deleted_at is None
+        assert repository.get_by_id(uuid.uuid4()).value is None
+
+    def test_save_overwrites_existing_order(self, repository: SharedMemoryOrderRepository):
+        order = self._order()
+        repository.save(order)
+
+        order.update_total(250.0)
+        order.delete()
+        repository.save(order)
+
+        loaded = repository.get_by_id(order.id).value
+        assert repository.count() == 1
+        assert loaded.total == Money.of(250.0)
+        assert loaded.deleted_at == order.deleted_at
+
+    def test_orders_are_visible_to_other_instances(self, repository, name, lock_path):
+        other = SharedMemoryOrderRepository(name, capacity=16, lock_path=lock_path)
+        order = self._order()
+        try:
+            other.save(order)
+
+            assert repository.get_by_id(order.id).value.id == order.id
+            assert [loaded.id for loaded in repository.iter_orders()] == [order.id]
+        finally:
+            other.close()
+
+    def test_orders_are_visible_to_other_processes(self, repository, name, lock_path):
+        customer_id = str(uuid.uuid4())
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(
+            target=_save_from_other_process, args=(name, lock_path, customer_id, queue)
+        )
+        process.start()
+        order_id = uuid.UUID(queue.get(timeout=10))
+        process.join(timeout=10)
+
+        assert process.exitcode == 0
+        assert repository.get_by_id(order_id).value.total == Money.of(42.5)
+        assert [order.id for order in repository.get_by_customer(customer_id).value] == [order_id]
+
+    def test_rejects_segment_with_different_layout(self, repository, name, lock_path):
+        with pytest.raises(ValueError):
+            SharedMemoryOrderRepository(name, capacity=1000, lock_path=lock_path)
+
+    def test_get_by_customer_follows_customer_change(self, repository: SharedMemoryOrderRepository):
+        customer_id = str(uuid.uuid4())
+        moved = self._order(customer_id)
+        kept = self._order(customer_id)
+        deleted = self._order(customer_id)
+        deleted.delete()
+        repository.save_many([moved, kept, deleted])
+
+        moved.customer_id = uuid.uuid4()
+        repository.save(moved)
+
+        assert [order.id for order in repository.get_by_customer(customer_id).value] == [kept.id]
+        assert [order.id for order in repository.get_by_customer(moved.customer_id).value] == [
+            moved.id
+        ]
+
+    def test_page_in_created_at_order(self, repository: SharedMemoryOrderRepository):
+        base = datetime(2024, 1, 1)
+        orders = []
+        for minute in (2, 0, 3, 1):
+            created_at = base + timedelta(minutes=minute)
+            orders.append(
+                Order.load(
+                    id=str(uuid.uuid4()),
+                    customer_id=str(uuid.uuid4()),
+                    total=10.0,
+                    created_at=created_at,
+                    updated_at=created_at,
+                ).value
+            )
+        repository.save_many(orders)
+        expected = [order.id for order in sorted(orders, key=lambda order: order.created_at)]
+
+        first = repository.page(limit=3).value
+        last = repository.page(first.next_cursor, limit=3).value
+
+        assert [order.id for order in first.orders] == expected[:3]
+        assert [order.id for order in last.orders] == expected[3:]
+
+    def test_save_many_rejects_batch_that_does_not_fit(
+        self, repository: SharedMemoryOrderRepository
+    ):
+        result = repository.save_many([self._order() for _ in range(17)])
+
+        assert result.failure is True
+        assert repository.count() == 0
+
+    def test_save_many_reports_failed_items(self, repository: SharedMemoryOrderRepository):
+        result = repository.save_many([self._order(), object()])
+
+        assert result.failure is True
+        assert result.errors[0].position == 1
+        assert repository.count() == 0
+
+    def test_clear_is_seen_by_other_instances(self, repository, name, lock_path):
+        other = SharedMemoryOrderRepository(name, capacity=16, lock_path=lock_path)
+        try:
+            first = self._order()
+            repository.save(first)
+            assert len(list(other.iter_orders())) == 1
+
+            repository.clear()
+            second = self._order()
+            repository.save(second)
+
+            assert other.count() == 1
+            assert [order.id for order in other.iter_orders()] == [second.id]
+            assert other.get_by_id(first.id).value is None
+        finally:
+            other.close()
+
+    def test_find_between_sees_updates_from_other_instances(self, repository, name, lock_path):
+        other = SharedMemoryOrderRepository(name, capacity=16, lock_path=lock_path)
+        try:
+            order = self._order()
+            repository.save(order)
+            old_updated_at = order.updated_at
+            assert repository.find_between(
+                old_updated_at, old_updated_at + timedelta(seconds=1), field="updated_at"
+            ).value == [order]
+
+            order.updated_at = old_updated_at + timedelta(hours=1)
+            for _ in range(20):
+                other.save(order)
+
+            moved = repository.find_between(
+                old_updated_at, old_updated_at + timedelta(seconds=1), field="updated_at"
+            )
+            assert moved.value == []
+            assert [
+                loaded.id
+                for loaded in repository.find_between(
+                    order.updated_at, order.updated_at + timedelta(seconds=1), field="updated_at"
+                ).value
+            ] == [order.id]
+        finally:
+            other.close()
+
+    def test_expected_version_is_checked_across_instances(self, repository, name, lock_path):
+        other = SharedMemoryOrderRepository(name, capacity=16, lock_path=lock_path)
+        try:
+            order = self._order()
+            repository.save(order)
+            stale = other.get_by_id(order.id).value
+
+            assert other.save(stale, expected_version=1).success is True
+            result = repository.save(order, expected_version=1)
+
+            assert result.failure is True
+            assert result.errors[0].actual_version == 2
+        finally:
+            other.close()
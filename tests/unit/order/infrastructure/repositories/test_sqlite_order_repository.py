@@ -0,0 +1,441 @@
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.order.domain import Order
+from src.order.domain.events import OrderCreatedEvent
+from src.order.infrastructure.repositories import SqliteOrderRepository
+from src.shared.domain.core import Money
+
+
+class FailingCommitConnection:
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def execute(self, sql, *args):
+        if sql == "COMMIT":
+            raise sqlite3.OperationalError("disk I/O error")
+        return self._connection.execute(sql, *args)
+
+
+class TestSqliteOrderRepository:
+    @pytest.fixture
+    def repository(self, tmp_path) -> SqliteOrderRepository:
+        repository = SqliteOrderRepository(
+            str(tmp_path / "orders.sqlite3"), batch_size=4, max_batch_delay=60
+        )
+        yield repository
+        repository.close()
+
+    @pytest.fixture
+    def buffered_repository(self, tmp_path) -> SqliteOrderRepository:
+        repository = SqliteOrderRepository(
+            str(tmp_path / "buffered.sqlite3"),
+            batch_size=4,
+            max_batch_delay=60,
+            wait_for_commit=False,
+        )
+        yield repository
+        repository.close()
+
+    @pytest.fixture
+    def valid_order(self) -> Order:
+        result = Order.create(customer_id=str(uuid.uuid4()), total=100.0)
+        return result.value
+
+    def test_uses_wal_journal_mode(self, repository: SqliteOrderRepository):
+        mode = repository._connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_save_order_successfully(self, repository: SqliteOrderRepository, valid_order: Order):
+        result = repository.save(valid_order)
+
+        assert result.success is True
+        assert repository.count() == 1
+
+    def test_get_by_id_existing_order(self, repository: SqliteOrderRepository, valid_order: Order):
+        repository.save(valid_order)
+
+        result = repository.get_by_id(valid_order.id)
+
+        assert result.success is True
+        assert result.value is not None
+        assert result.value.id == valid_order.id
+        assert result.value.total == valid_order.total
+        assert str(result.value.customer_id) == str(valid_order.customer_id)
+        assert result.value.created_at == valid_order.created_at
+        assert result.value.updated_at == valid_order.updated_at
+        assert result.value.deleted_at is None
+
+    def test_get_by_id_non_existing_order(self, repository: SqliteOrderRepository):
+        result = repository.get_by_id(uuid.uuid4())
+
+        assert result.success is True
+        assert result.value is None
+
+    def test_save_overwrites_existing_order(
+        self, repository: SqliteOrderRepository, valid_order: Order
+    ):
+        repository.save(valid_order)
+
+        valid_order.update_total(250.0)
+        valid_order.delete()
+        repository.save(valid_order)
+
+        assert repository.count() == 1
+
+        result = repository.get_by_id(valid_order.id)
+        assert result.value.total == Money.of(250.0)
+        assert result.value.is_deleted is True
+        assert result.value.deleted_at == valid_order.deleted_at
+
+    def test_save_commits_before_returning(self, tmp_path, valid_order: Order):
+        path = str(tmp_path / "shared.sqlite3")
+        writer = SqliteOrderRepository(path, batch_size=100, max_batch_delay=60)
+        reader = sqlite3.connect(path)
+
+        try:
+            assert writer.save(valid_order).success is True
+            assert reader.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == 1
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_concurrent_saves_share_a_group_commit(self, tmp_path):
+        repository = SqliteOrderRepository(
+            str(tmp_path / "orders.sqlite3"), batch_size=100, max_batch_delay=60
+        )
+        orders = [Order.create(customer_id=str(uuid.uuid4()), total=10.0).value for _ in range(8)]
+        results = []
+
+        try:
+            with repository._lock:
+                threads = [
+                    threading.Thread(target=lambda o=o: results.append(repository.save(o)))
+                    for o in orders
+                ]
+                for thread in threads:
+                    thread.start()
+                while repository._arriving < len(orders):
+                    time.sleep(0.001)
+            for thread in threads:
+                thread.join()
+
+            assert all(result.success for result in results)
+            assert repository.count() == len(orders)
+        finally:
+            repository.close()
+
+    def test_failed_group_commit_fails_the_waiting_save(
+        self, repository: SqliteOrderRepository, valid_order: Order
+    ):
+        repository._connection = FailingCommitConnection(repository._connection)
+
+        result = repository.save(valid_order)
+
+        assert result.failure is True
+        assert str(result.errors[0]) == "disk I/O error"
+        assert valid_order.version == 0
+        assert len(valid_order.get_events()) == 1
+        assert repository._connection.in_transaction is False
+        assert repository.get_by_id(valid_order.id).value is None
+
+    def test_save_commits_in_batches(self, buffered_repository: SqliteOrderRepository):
+        for _ in range(3):
+            buffered_repository.save(Order.create(customer_id=str(uuid.uuid4()), total=10.0).value)
+
+        assert buffered_repository._connection.in_transaction is True
+
+        buffered_repository.save(Order.create(customer_id=str(uuid.uuid4()), total=10.0).value)
+
+        assert buffered_repository._connection.in_transaction is False
+
+    def test_flusher_commits_after_max_batch_delay(self, tmp_path, valid_order: Order):
+        path = str(tmp_path / "shared.sqlite3")
+        writer = SqliteOrderRepository(
+            path, batch_size=100, max_batch_delay=0.05, wait_for_commit=False
+        )
+        reader = sqlite3.connect(path)
+
+        try:
+            writer.save(valid_order)
+            deadline = time.monotonic() + 5
+            while writer._connection.in_transaction and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert reader.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == 1
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_failed_group_commit_restores_buffered_orders(
+        self, buffered_repository: SqliteOrderRepository, valid_order: Order, caplog
+    ):
+        buffered_repository._connection = FailingCommitConnection(buffered_repository._connection)
+
+        assert buffered_repository.save(valid_order).success is True
+        assert valid_order.version == 1
+        with caplog.at_level(logging.ERROR):
+            buffered_repository.flush()
+
+        assert valid_order.version == 0
+        assert len(valid_order.get_events()) == 1
+        assert "Group commit of 1 orders failed" in caplog.text
+
+    def test_flush_makes_pending_writes_visible_to_other_connections(self, tmp_path):
+        path = str(tmp_path / "shared.sqlite3")
+        writer = SqliteOrderRepository(
+            path, batch_size=100, max_batch_delay=60, wait_for_commit=False
+        )
+        reader = SqliteOrderRepository(path)
+        order = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+
+        try:
+            writer.save(order)
+            assert reader.get_by_id(order.id).value is None
+
+            writer.flush()
+            assert reader.get_by_id(order.id).value.id == order.id
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_orders_survive_reopening_the_database(self, tmp_path, valid_order: Order):
+        path = str(tmp_path / "durable.sqlite3")
+        repository = SqliteOrderRepository(path)
+        repository.save(valid_order)
+        repository.close()
+
+        reopened = SqliteOrderRepository(path)
+        try:
+            assert reopened.count() == 1
+            assert reopened.get_by_id(valid_order.id).value.id == valid_order.id
+        finally:
+            reopened.close()
+
+    def test_get_all_orders(self, repository: SqliteOrderRepository):
+        order1 = Order.create(customer_id=str(uuid.uuid4()), total=100.0).value
+        order2 = Order.create(customer_id=str(uuid.uuid4()), total=200.0).value
+
+        repository.save(order1)
+        repository.save(order2)
+
+        result = repository.get_all()
+
+        assert result.success is True
+        assert {order.id for order in result.value} == {order1.id, order2.id}
+
+    def test_get_by_customer(self, repository: SqliteOrderRepository):
+        customer_id = str(uuid.uuid4())
+        order1 = Order.create(customer_id=customer_id, total=100.0).value
+        order2 = Order.create(customer_id=customer_id.upper(), total=200.0).value
+        deleted = Order.create(customer_id=customer_id, total=300.0).value
+        other = Order.create(customer_id=str(uuid.uuid4()), total=400.0).value
+        deleted.delete()
+
+        for order in (order1, order2, deleted, other):
+            repository.save(order)
+
+        result = repository.get_by_customer(uuid.UUID(customer_id))
+
+        assert result.success is True
+        assert {order.id for order in result.value} == {order1.id, order2.id}
+
+    def test_get_by_customer_follows_customer_change(
+        self, repository: SqliteOrderRepository, valid_order: Order
+    ):
+        old_customer_id = valid_order.customer_id
+        repository.save(valid_order)
+
+        valid_order.customer_id = uuid.uuid4()
+        repository.save(valid_order)
+
+        assert repository.get_by_customer(old_customer_id).value == []
+        assert repository.get_by_customer(valid_order.customer_id).value == [valid_order]
+
+    def test_page_walks_all_orders_in_created_at_order(self, repository: SqliteOrderRepository):
+        base = datetime(2024, 1, 1, 12, 0)
+        orders = []
+        for minute in (4, 0, 3, 1, 2):
+            created_at = base + timedelta(minutes=minute)
+            order = Order.load(
+                id=str(uuid.uuid4()),
+                customer_id=str(uuid.uuid4()),
+                total=10.0,
+                created_at=created_at,
+                updated_at=created_at,
+            ).value
+            repository.save(order)
+            orders.append(order)
+        expected = [order.id for order in sorted(orders, key=lambda order: order.created_at)]
+        repository.CHUNK_SIZE = 2
+
+        first = repository.page(limit=3).value
+        last = repository.page(first.next_cursor, limit=3).value
+
+        assert [order.id for order in first.orders] == expected[:3]
+        assert [order.id for order in last.orders] == expected[3:]
+        assert last.has_next is False
+        assert [order.id for order in repository.iter_orders()] == expected
+
+    def test_iter_orders_unknown_after_id(self, repository: SqliteOrderRepository):
+        with pytest.raises(ValueError):
+            list(repository.iter_orders(after_id=uuid.uuid4()))
+
+    def test_save_many_commits_in_one_transaction(self, repository: SqliteOrderRepository):
+        pending = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+        orders = [Order.create(customer_id=str(uuid.uuid4()), total=10.0).value for _ in range(5)]
+        repository.save(pending)
+
+        result = repository.save_many(orders)
+
+        assert result.success is True
+        assert repository._connection.in_transaction is False
+        assert repository.count() == 6
+
+    def test_save_many_is_atomic_and_reports_failed_items(
+        self, repository: SqliteOrderRepository, valid_order: Order
+    ):
+        result = repository.save_many([valid_order, object()])
+
+        assert result.failure is True
+        assert len(result.errors) == 1
+        assert result.errors[0].position == 1
+        assert repository.count() == 0
+
+    def test_save_many_rolls_back_when_the_database_fails(
+        self, repository: SqliteOrderRepository, valid_order: Order
+    ):
+        repository._connection.execute("DROP TABLE orders")
+
+        result = repository.save_many([valid_order])
+
+        assert result.failure is True
+        assert repository._connection.in_transaction is False
+
+    def test_clear_repository(self, repository: SqliteOrderRepository, valid_order: Order):
+        repository.save(valid_order)
+
+        repository.clear()
+
+        assert repository.count() == 0
+        assert repository.get_by_id(valid_order.id).value is None
+
+    def test_save_handles_exception(self, repository: SqliteOrderRepository):
+        result = repository.save(object())
+
+        assert result.failure is True
+        assert len(result.errors) == 1
+
+    def test_get_by_id_handles_exception(self, repository: SqliteOrderRepository):
+        repository.close()
+
+        result = repository.get_by_id(uuid.uuid4())
+
+        assert result.failure is True
+        assert len(result.errors) == 1
+
+    def test_version_conflict_keeps_pending_batch(self, buffered_repository: SqliteOrderRepository):
+        saved = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+        conflicting = Order.create(customer_id=str(uuid.uuid4()), total=10.0).value
+        buffered_repository.save(saved)
+
+        result = buffered_repository.save(conflicting, expected_version=1)
+        buffered_repository.flush()
+
+        assert result.failure is True
+        assert buffered_repository.get_by_id(saved.id).value.version == 1
+        assert buffered_repository.get_by_id(conflicting.id).value is None
+
+    def test_stores_total_as_integer_cents_with_currency(self, repository: SqliteOrderRepository):
+        order = Order.create(customer_id=str(uuid.uuid4()), total=Money(1999, "USD")).value
+
+        assert repository.save(order).success is True
+
+        stored = repository._connection.execute(
+            "SELECT total_cents, typeof(total_cents), currency FROM orders"
+        ).fetchone()
+        assert stored == (1999, "integer", "USD")
+        assert repository.get_by_id(order.id).value.total == Money(1999, "USD")
+
+    def test_keeps_totals_that_a_double_cannot_hold(self, repository: SqliteOrderRepository):
+        total = Money(Money.MAX_AMOUNT)
+        order = Order.create(customer_id=str(uuid.uuid4()), total=total).value
+
+        repository.save(order)
+
+        assert repository.get_by_id(order.id).value.total == total
+
+    @pytest.fixture
+    def outbox_repository(self, tmp_path) -> SqliteOrderRepository:
+        repository = SqliteOrderRepository(
+            str(tmp_path / "outbox.sqlite3"),
+            batch_size=4,
+            max_batch_delay=60,
+            outbox=True,
+            wait_for_commit=False,
+        )
+        yield repository
+        repository.close()
+
+    def test_save_writes_events_to_outbox(
+        self, outbox_repository: SqliteOrderRepository, valid_order: Order
+    ):
+        second = Order.create(customer_id=str(uuid.uuid4()), total=20.0).value
+
+        outbox_repository.save(valid_order)
+        outbox_repository.save_many([second])
+
+        pending = outbox_repository.pending_events().value
+        assert [message.event.aggregate_id for message in pending] == [valid_order.id, second.id]
+        assert isinstance(pending[0].event, OrderCreatedEvent)
+        assert pending[0].event.event_data.total == valid_order.total
+        assert valid_order.get_events() == []
+
+    def test_pending_events_commits_pending_batch(
+        self, outbox_repository: SqliteOrderRepository, valid_order: Order
+    ):
+        outbox_repository.save(valid_order)
+
+        outbox_repository.pending_events()
+
+        assert outbox_repository._connection.in_transaction is False
+
+    def test_version_conflict_writes_no_events(
+        self, outbox_repository: SqliteOrderRepository, valid_order: Order
+    ):
+        saved = Order.create(customer_id=str(uuid.uuid4()), total=20.0).value
+        outbox_repository.save(saved)
+
+        result = outbox_repository.save(valid_order, expected_version=3)
+
+        assert result.failure is True
+        assert len(valid_order.get_events()) == 1
+        pending = outbox_repository.pending_events().value
+        assert [message.event.aggregate_id for message in pending] == [saved.id]
+
+    def test_outbox_survives_reopening_until_published(self, tmp_path, valid_order: Order):
+        path = str(tmp_path / "outbox.sqlite3")
+        repository = SqliteOrderRepository(path, outbox=True)
+        repository.save(valid_order)
+        repository.close()
+
+        reopened = SqliteOrderRepository(path, outbox=True)
+        try:
+            pending = reopened.pending_events().value
+            assert [message.event.aggregate_id for message in pending] == [valid_order.id]
+
+            reopened.mark_events_published([message.sequence for message in pending])
+
+            assert reopened.pending_events().value == []
+        finally:
+            reopened.close()
@@ -0,0 +1,148 @@
+import copy
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.order.domain import Order
+from src.order.infrastructure.repositories import StripedInMemoryOrderRepository
+from src.shared.domain.core import Money
+
+
+class TestStripedInMemoryOrderRepository:
+    @pytest.fixture
+    def repository(self) -> StripedInMemoryOrderRepository:
+        return StripedInMemoryOrderRepository(shards=4)
+
+    def _order(self, customer_id: str | None = None) -> Order:
+        return Order.create(customer_id=customer_id or str(uuid.uuid4()), total=10.0).value
+
+    def test_save_and_get_by_id(self, repository: StripedInMemoryOrderRepository):
+        order = self._order()
+
+        result = repository.save(order)
+
+        assert result.success is True
+        assert repository.get_by_id(order.id).value == order
+        assert repository.get_by_id(uuid.uuid4()).value is None
+        assert repository.count() == 1
+
+    def test_get_by_customer_across_shards(self, repository: StripedInMemoryOrderRepository):
+        customer_id = str(uuid.uuid4())
+        orders = [self._order(customer_id) for _ in range(10)]
+        orders[0].delete()
+        repository.save_many(orders + [self._order()])
+
+        result = repository.get_by_customer(customer_id)
+
+        assert result.success is True
+        assert {order.id for order in result.value} == {order.id for order in orders[1:]}
+
+    def test_save_many_reports_failed_items(self, repository: StripedInMemoryOrderRepository):
+        result = repository.save_many([self._order(), object()])
+
+        assert result.failure is True
+        assert result.errors[0].position == 1
+        assert repository.count() == 0
+
+    def test_iter_orders_merges_shards_in_created_at_order(
+        self, repository: StripedInMemoryOrderRepository
+    ):
+        base = datetime(2024, 1, 1)
+        orders = []
+        for minute in (5, 3, 0, 4, 1, 2):
+            created_at = base + timedelta(minutes=minute)
+            orders.append(
+                Order.load(
+                    id=str(uuid.uuid4()),
+                    customer_id=str(uuid.uuid4()),
+                    total=10.0,
+                    created_at=created_at,
+                    updated_at=created_at,
+                ).value
+            )
+        repository.save_many(orders)
+        repository.CHUNK_SIZE = 1
+        expected = [order.id for order in sorted(orders, key=lambda order: order.created_at)]
+
+        first = repository.page(limit=4).value
+        last = repository.page(first.next_cursor, limit=4).value
+
+        assert [order.id for order in repository.iter_orders()] == expected
+        assert [order.id for order in first.orders] == expected[:4]
+        assert [order.id for order in last.orders] == expected[4:]
+
+    def test_iter_orders_unknown_after_id(self, repository: StripedInMemoryOrderRepository):
+        with pytest.raises(ValueError):
+            list(repository.iter_orders(after_id=uuid.uuid4()))
+
+    def test_concurrent_saves_and_get_all(self, repository: StripedInMemoryOrderRepository):
+        errors = []
+
+        def writer():
+            try:
+                for _ in range(500):
+                    repository.save(self._order())
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                for _ in range(50):
+                    assert repository.get_all().success is True
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        threads += [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert repository.count() == 2000
+        assert len(repository.get_all().value) == 2000
+
+    def test_clear(self, repository: StripedInMemoryOrderRepository):
+        order = self._order()
+        repository.save(order)
+
+        repository.clear()
+
+        assert repository.count() == 0
+        assert repository.get_by_id(order.id).value is None
+        assert list(repository.iter_orders()) == []
+
+    def test_concurrent_compare_and_swap_loses_no_updates(
+        self, repository: StripedInMemoryOrderRepository
+    ):
+        order = self._order()
+        repository.save(order)
+        errors = []
+
+        def increment():
+            try:
+                for _ in range(200):
+                    while True:
+                        # Each writer works on its own copy, as it would after loading
+                        # the order from a store outside the process.
+                        current = copy.copy(repository.get_by_id(order.id).value)
+                        version = current.version
+                        current.update_total(current.total + Money.of(1))
+                        if repository.save(current, expected_version=version).success:
+                            break
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        saved = repository.get_by_id(order.id).value
+        assert errors == []
+        assert saved.version == 801
+        assert saved.total == Money.of(810.0)
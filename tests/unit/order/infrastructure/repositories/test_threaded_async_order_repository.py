@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from src.order.domain import Order
+from src.order.infrastructure.repositories import (
+    SqliteOrderRepository,
+    ThreadedAsyncOrderRepository,
+)
+from src.shared.domain.core import Result
+
+
+class TestThreadedAsyncOrderRepository:
+    @pytest.fixture
+    def repository(self, tmp_path) -> ThreadedAsyncOrderRepository:
+        repository = ThreadedAsyncOrderRepository(
+            SqliteOrderRepository(str(tmp_path / "orders.sqlite3"))
+        )
+        yield repository
+        repository.close()
+
+    def _order(self, customer_id: str | None = None) -> Order:
+        return Order.create(customer_id=customer_id or str(uuid.uuid4()), total=10.0).value
+
+    def test_save_and_get_by_id(self, repository: ThreadedAsyncOrderRepository):
+        order = self._order()
+
+        async def scenario():
+            saved = await repository.save(order)
+            return saved, await repository.get_by_id(order.id)
+
+        saved, loaded = asyncio.run(scenario())
+
+        assert saved.success is True
+        assert loaded.value.id == order.id
+        assert loaded.value.version == 1
+
+    def test_concurrent_saves(self, repository: ThreadedAsyncOrderRepository):
+        customer_id = str(uuid.uuid4())
+        orders = [self._order(customer_id) for _ in range(50)]
+
+        async def scenario():
+            results = await asyncio.gather(*(repository.save(order) for order in orders))
+            return results, await repository.get_by_customer(customer_id)
+
+        results, by_customer = asyncio.run(scenario())
+
+        assert all(result.success for result in results)
+        assert len(by_customer.value) == 50
+
+    def test_save_many_and_get_all(self, repository: ThreadedAsyncOrderRepository):
+        orders = [self._order() for _ in range(3)]
+
+        async def scenario():
+            await repository.save_many(order for order in orders)
+            return await repository.get_all()
+
+        result = asyncio.run(scenario())
+
+        assert {order.id for order in result.value} == {order.id for order in orders}
+
+    def test_calls_run_off_the_event_loop_thread(self):
+        backend = Mock(spec=SqliteOrderRepository)
+        callers = []
+        backend.get_by_id.side_effect = lambda order_id: (
+            callers.append(threading.current_thread()) or Result.ok(None)
+        )
+        repository = ThreadedAsyncOrderRepository(backend)
+
+        try:
+            asyncio.run(repository.get_by_id(uuid.uuid4()))
+        finally:
+            repository.close()
+
+        assert callers[0] is not threading.current_thread()
+        backend.close.assert_called_once()
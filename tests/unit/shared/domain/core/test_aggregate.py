@@ -58,6 +58,7 @@ class TestAggregate:
         assert isinstance(aggregate.created_at, datetime)
         assert isinstance(aggregate.updated_at, datetime)
         assert aggregate.deleted_at is None
+        assert aggregate.version == 0
 
     def test_aggregate_creation_with_parameters(self):
         id = uuid.uuid4()
@@ -82,6 +83,7 @@ class TestAggregate:
 
         assert isinstance(events, list)
         assert len(events) == 0
+        assert concrete_aggregate._domain_events is None
 
     def test_add_domain_event_single_event(self, concrete_aggregate, concrete_event):
         concrete_aggregate.add_domain_event(concrete_event)
@@ -139,3 +141,13 @@ class TestAggregate:
         concrete_aggregate.clear_events()
 
         assert len(concrete_aggregate.get_events()) == 0
+
+    def test_pull_events_returns_and_releases_events(self, concrete_aggregate, concrete_event):
+        concrete_aggregate.add_domain_event(concrete_event)
+
+        events = concrete_aggregate.pull_events()
+
+        assert events == [concrete_event]
+        assert concrete_aggregate.get_events() == []
+        assert concrete_aggregate._domain_events is None
+        assert concrete_aggregate.pull_events() == []
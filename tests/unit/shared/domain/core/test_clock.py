@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta
+
+from src.shared.domain.core import FixedClock, SystemClock
+
+
+class TestClock:
+    def test_system_clock_returns_current_time(self):
+        before = datetime.now()
+
+        now = SystemClock().now()
+
+        assert before <= now <= datetime.now()
+
+    def test_fixed_clock_advances_by_step(self):
+        start = datetime(2024, 1, 1)
+        clock = FixedClock(start, step=timedelta(seconds=1))
+
+        assert [clock.now(), clock.now()] == [start, start + timedelta(seconds=1)]
+
+    def test_fixed_clock_without_step_stands_still(self):
+        start = datetime(2024, 1, 1)
+        clock = FixedClock(start)
+
+        assert clock.now() == clock.now() == start
@@ -1,10 +1,10 @@
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
-from src.shared.domain.core import Entity
+from src.shared.domain.core import Entity, FixedClock, UUIDv4IdentityProvider
 
 
 class ConcreteEntity(Entity):
@@ -29,6 +29,13 @@ def concrete_entity():
     return ConcreteEntity()
 
 
+@pytest.fixture
+def restore_entity_providers():
+    identity_provider, clock = Entity.identity_provider, Entity.clock
+    yield
+    Entity.configure(identity_provider=identity_provider, clock=clock)
+
+
 class TestEntity:
     def test_entity_cannot_be_instantiated_directly(self):
         with pytest.raises(TypeError):
@@ -74,6 +81,13 @@ class TestEntity:
         assert concrete_entity.is_deleted is True
         assert isinstance(concrete_entity.deleted_at, datetime)
 
+    def test_is_deleted_follows_deleted_at(self, concrete_entity):
+        concrete_entity.deleted_at = datetime.now()
+        assert concrete_entity.is_deleted is True
+
+        concrete_entity.deleted_at = None
+        assert concrete_entity.is_deleted is False
+
     def test_equality_and_hash(self):
         id1 = uuid.uuid4()
         entity1 = ConcreteEntity(id=id1)
@@ -137,3 +151,28 @@ class TestEntity:
             Entity.from_dict(entity_dict)
         except Exception as e:
             pytest.fail(f"validate() raised an exception: {e}")
+
+    def test_new_entities_get_time_ordered_uuid7_ids(self):
+        ids = [ConcreteEntity().id for _ in range(1000)]
+
+        assert all(id.version == 7 for id in ids)
+        assert ids == sorted(ids)
+
+    def test_created_and_updated_at_come_from_one_clock_read(self, concrete_entity):
+        assert concrete_entity.created_at == concrete_entity.updated_at
+
+    @pytest.mark.usefixtures("restore_entity_providers")
+    def test_configure_identity_provider_and_clock(self):
+        start = datetime(2024, 1, 1)
+        Entity.configure(
+            identity_provider=UUIDv4IdentityProvider(),
+            clock=FixedClock(start, step=timedelta(seconds=1)),
+        )
+
+        entity = ConcreteEntity()
+        entity.update()
+        entity.delete()
+
+        assert entity.id.version == 4
+        assert entity.created_at == entity.updated_at - timedelta(seconds=1) == start
+        assert entity.deleted_at == start + timedelta(seconds=2)
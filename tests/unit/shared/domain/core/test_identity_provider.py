@@ -0,0 +1,67 @@
+import random
+import uuid
+
+from src.shared.domain.core import UUIDv4IdentityProvider, UUIDv7IdentityProvider
+
+
+class FakeTime:
+    def __init__(self, ms: int):
+        self.ms = ms
+
+    def __call__(self) -> int:
+        return self.ms * 1_000_000
+
+
+class TestUUIDv7IdentityProvider:
+    def test_generates_version_7_ids_with_timestamp(self):
+        provider = UUIDv7IdentityProvider(time_ns=FakeTime(1_700_000_000_123))
+
+        id = provider.new_id()
+
+        assert id.version == 7
+        assert id.variant == uuid.RFC_4122
+        assert id.int >> 80 == 1_700_000_000_123
+
+    def test_ids_are_monotonic_within_the_same_millisecond(self):
+        provider = UUIDv7IdentityProvider(time_ns=FakeTime(1_700_000_000_000))
+
+        ids = [provider.new_id() for _ in range(10_000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_ids_stay_monotonic_when_the_clock_goes_back(self):
+        clock = FakeTime(1_700_000_000_500)
+        provider = UUIDv7IdentityProvider(time_ns=clock)
+        first = provider.new_id()
+
+        clock.ms -= 400
+        second = provider.new_id()
+
+        assert second > first
+
+    def test_counter_overflow_moves_to_next_millisecond(self):
+        provider = UUIDv7IdentityProvider(
+            time_ns=FakeTime(1_700_000_000_000), random_bytes=lambda size: b"\xff" * size
+        )
+        provider.new_id()
+        provider._counter = (1 << UUIDv7IdentityProvider.COUNTER_BITS) - 1
+
+        id = provider.new_id()
+
+        assert id.int >> 80 == 1_700_000_000_001
+
+    def test_is_deterministic_with_injected_time_and_randomness(self):
+        def provider():
+            return UUIDv7IdentityProvider(
+                time_ns=FakeTime(1_700_000_000_000), random_bytes=random.Random(42).randbytes
+            )
+
+        first, second = provider(), provider()
+
+        assert [first.new_id() for _ in range(5)] == [second.new_id() for _ in range(5)]
+
+
+class TestUUIDv4IdentityProvider:
+    def test_generates_version_4_ids(self):
+        assert UUIDv4IdentityProvider().new_id().version == 4
@@ -0,0 +1,88 @@
+import copy
+from decimal import Decimal
+
+import pytest
+
+from src.shared.domain.core import Money
+
+
+class TestMoney:
+    def test_of_converts_to_minor_units(self):
+        assert Money.of(12).amount == 1200
+        assert Money.of(0.29).amount == 29
+        assert Money.of(19.99).amount == 1999
+        assert Money.of(Decimal("10.5")).amount == 1050
+        assert Money.of(" 7.25 ").amount == 725
+        assert Money.of(1, "USD") == Money(100, "USD")
+
+    def test_of_returns_money_unchanged(self):
+        money = Money(100)
+
+        assert Money.of(money) is money
+
+    def test_of_rejects_amounts_with_more_than_two_decimals(self):
+        for value in [12.123, Decimal("0.001"), "1.005", "abc", float("nan"), float("inf"), None]:
+            with pytest.raises(ValueError):
+                Money.of(value)
+
+    def test_of_rejects_amounts_that_do_not_fit_in_64_bit_cents(self):
+        largest = Money.MAX_AMOUNT // Money.SCALE
+
+        assert Money.of(largest).amount == largest * Money.SCALE
+        assert Money.of(-largest).amount == -largest * Money.SCALE
+        for value in [largest + 1, -largest - 1, 1e17, Decimal("1e17"), "92233720368547758.08"]:
+            with pytest.raises(ValueError):
+                Money.of(value)
+
+    def test_of_rejects_money_in_another_currency(self):
+        money = Money(100, "USD")
+
+        assert Money.of(money, "USD") is money
+        with pytest.raises(ValueError):
+            Money.of(money, "BRL")
+
+    def test_of_rejects_invalid_currency_codes(self):
+        for currency in ["", "BR", "brl", "R$1"]:
+            with pytest.raises(ValueError):
+                Money.of(1, currency)
+
+    def test_conversions(self):
+        money = Money(10050)
+
+        assert float(money) == 100.5
+        assert money.to_decimal() == Decimal("100.50")
+        assert str(money) == "100.50 BRL"
+        assert repr(money) == "Money(10050, 'BRL')"
+
+    def test_arithmetic_is_exact(self):
+        total = Money(0)
+        for _ in range(10):
+            total += Money.of(0.1)
+
+        assert total == Money.of(1)
+        assert Money.of(0.3) - Money.of(0.1) == Money.of(0.2)
+
+    def test_comparison_and_hashing(self):
+        assert Money(100) < Money(200)
+        assert Money(200) >= Money(200)
+        assert Money(100) != Money(100, "USD")
+        assert Money(100) != 1.0
+        assert len({Money(100), Money.of(1.0), Money(100, "USD")}) == 2
+
+    def test_mixing_currencies_fails(self):
+        with pytest.raises(ValueError):
+            Money(100) + Money(100, "USD")
+        with pytest.raises(ValueError):
+            Money(100) < Money(100, "USD")
+
+    def test_is_immutable(self):
+        money = Money(100)
+
+        with pytest.raises(AttributeError):
+            money.amount = 200
+        assert not hasattr(money, "__dict__")
+
+    def test_copy(self):
+        money = Money(100, "USD")
+
+        assert copy.deepcopy(money) == money
@@ -0,0 +1,51 @@
+import sys
+
+import pytest
+
+from src.shared.domain.errors import (
+    CurrencyError,
+    ErrorRecord,
+    MinLengthError,
+    RequiredError,
+    UUIDFormatError,
+)
+
+
+class TestErrorRecord:
+    def test_record_keeps_code_field_and_params(self):
+        record = MinLengthError.record("name", 3, "Jo")
+
+        assert isinstance(record, ErrorRecord)
+        assert record.code == "MIN_LENGTH_ERROR"
+        assert record.field == "name"
+        assert record.params == (3, "Jo")
+
+    def test_message_matches_exception(self):
+        record = CurrencyError.record("total", 12.345)
+        error = CurrencyError("total", 12.345)
+
+        assert record.message == error.message
+        assert str(record) == str(error)
+
+    def test_to_exception(self):
+        error = UUIDFormatError.record("customer_id", "invalid").to_exception()
+
+        assert isinstance(error, UUIDFormatError)
+        assert error == UUIDFormatError("customer_id", "invalid")
+        with pytest.raises(UUIDFormatError):
+            raise error
+
+    def test_equality_with_records_and_exceptions(self):
+        record = RequiredError.record("total")
+
+        assert record == RequiredError.record("total")
+        assert record == RequiredError("total")
+        assert RequiredError("total") == record
+        assert record != RequiredError.record("customer_id")
+        assert record != "REQUIRED_ERROR"
+
+    def test_record_is_slotted(self):
+        record = RequiredError.record("total")
+
+        assert not hasattr(record, "__dict__")
+        assert sys.getsizeof(record) < sys.getsizeof(RequiredError("total"))
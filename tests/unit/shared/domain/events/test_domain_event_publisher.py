@@ -115,3 +115,15 @@ class TestDomainEventPublisher:
 
         with does_not_raise():
             publisher.publish([event])
+
+    def test_deliver_reports_whether_every_handler_succeeded(self):
+        publisher = DomainEventPublisher()
+        failing_handler = Mock(spec=DomainEventHandler)
+        failing_handler.handle.side_effect = [None, Exception("boom")]
+        publisher.subscribe("UserCreatedEvent", failing_handler)
+
+        delivered = publisher.deliver(
+            [UserCreatedEvent({"id": 1}), UserCreatedEvent({"id": 2}), UserUpdatedEvent({})]
+        )
+
+        assert delivered == [True, False, True]
@@ -1,3 +1,7 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.shared.domain.core import Money
 from src.shared.domain.errors import (
     CurrencyError,
     EmailError,
@@ -6,6 +10,7 @@ from src.shared.domain.errors import (
     UUIDFormatError,
 )
 from src.shared.domain.validation import FieldValidator, ValidationContext
+from src.shared.domain.validation.rules import EmailRule
 
 
 class TestFieldValidator:
@@ -94,7 +99,17 @@ class TestFieldValidator:
             assert context.get_errors()[0] == EmailError("email", value)
 
     def test_currency_valid(self):
-        valid_currency = [12, 12.0, 12.00]
+        valid_currency = [
+            12,
+            12.0,
+            12.00,
+            0.29,
+            19.99,
+            Decimal("12.50"),
+            Money(1),
+            Money.MAX_AMOUNT // Money.SCALE,
+            Money(Money.MAX_AMOUNT),
+        ]
 
         for value in valid_currency:
             validator = FieldValidator(value, "currency")
@@ -106,7 +121,20 @@ class TestFieldValidator:
             assert not context.has_errors()
 
     def test_currency_invalid(self):
-        invalid_currency = ["invalid-currency", 0, -1, 12.123]
+        invalid_currency = [
+            "invalid-currency",
+            0,
+            -1,
+            12.123,
+            -0.01,
+            float("nan"),
+            float("inf"),
+            Decimal("1.001"),
+            Money(0),
+            1e17,
+            Money.MAX_AMOUNT // Money.SCALE + 1,
+            Money(Money.MAX_AMOUNT + 1),
+        ]
 
         for value in invalid_currency:
             validator = FieldValidator(value, "currency")
@@ -162,3 +190,20 @@ class TestFieldValidator:
         assert len(context.get_errors()) == 2
         assert context.get_errors()[0] == MinLengthError("email", 3, "a@")
         assert context.get_errors()[1] == EmailError("email", "a@")
+
+    def test_bail_stops_at_first_error(self):
+        validator = FieldValidator("a@", "email")
+        context = ValidationContext()
+        email = Mock(wraps=EmailRule())
+
+        validator.required().min_length(3).add_rule(email)
+        valid = validator.validate(context, bail=True)
+
+        assert valid is False
+        assert context.get_errors() == [MinLengthError("email", 3, "a@")]
+        email.validate.assert_not_called()
+
+    def test_validate_returns_true_without_errors(self):
+        validator = FieldValidator("abc@mail.com", "email")
+
+        assert validator.required().email().validate(ValidationContext(), bail=True) is True
@@ -0,0 +1,83 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from src.shared.domain.errors import CurrencyError, UUIDFormatError
+from src.shared.domain.validation import FieldSchema, MemoizedRule, ValidationRule
+from src.shared.domain.validation.rules import CurrencyRule, UUIDRule
+
+
+class ImpureRule(ValidationRule):
+    def validate(self, value, field_name):
+        return None
+
+
+class TestMemoizedRule:
+    @pytest.fixture
+    def rule(self) -> Mock:
+        return Mock(wraps=UUIDRule(), pure=True)
+
+    def test_repeated_values_are_validated_once(self, rule: Mock):
+        memoized = MemoizedRule(rule, max_size=2)
+        value = str(uuid.uuid4())
+
+        assert memoized.validate(value, "customer_id") is None
+        assert memoized.validate(value, "customer_id") is None
+
+        assert rule.validate.call_count == 1
+        assert memoized.stats.hits == 1
+        assert memoized.stats.misses == 1
+        assert memoized.stats.hit_rate == 0.5
+
+    def test_invalid_values_get_fresh_errors(self, rule: Mock):
+        memoized = MemoizedRule(rule)
+
+        first = memoized.validate("invalid", "customer_id")
+        second = memoized.validate("invalid", "other")
+
+        assert first == UUIDFormatError("customer_id", "invalid")
+        assert second == UUIDFormatError("other", "invalid")
+        assert first is not second
+
+    def test_evicts_least_recently_used(self, rule: Mock):
+        memoized = MemoizedRule(rule, max_size=2)
+        values = [str(uuid.uuid4()) for _ in range(3)]
+
+        for value in values + values[:1]:
+            memoized.validate(value, "customer_id")
+
+        assert memoized.stats.evictions == 2
+        assert memoized.stats.size == 2
+
+    def test_keeps_equal_values_of_different_types_apart(self):
+        memoized = MemoizedRule(CurrencyRule())
+
+        assert memoized.validate(1, "total") is None
+        assert memoized.validate(True, "total") is None
+        assert memoized.validate(1.0, "total") is None
+        assert memoized.stats.misses == 3
+
+    def test_unhashable_values_bypass_the_cache(self):
+        memoized = MemoizedRule(CurrencyRule())
+
+        assert memoized.validate([], "total") == CurrencyError("total", [])
+        assert memoized.stats.size == 0
+
+    def test_clear(self, rule: Mock):
+        memoized = MemoizedRule(rule)
+        memoized.validate(str(uuid.uuid4()), "customer_id")
+
+        memoized.clear()
+
+        assert memoized.stats.size == 0
+
+    def test_impure_rules_cannot_be_memoized(self):
+        with pytest.raises(ValueError):
+            ImpureRule().memoized()
+
+    def test_field_schema_memoizes_last_rule(self):
+        field = FieldSchema("customer_id").required().uuid().memoize(max_size=10)
+
+        assert isinstance(field.rules[-1], MemoizedRule)
+        assert isinstance(field.rules[-1].rule, UUIDRule)
@@ -0,0 +1,186 @@
+import uuid
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.shared.domain.core import Money
+from src.shared.domain.errors import (
+    CurrencyError,
+    EmailError,
+    MinLengthError,
+    RequiredError,
+    UUIDFormatError,
+)
+from src.shared.domain.validation import FieldSchema, ValidationSchema, Validator
+from src.shared.domain.validation.rules import (
+    CurrencyRule,
+    EmailRule,
+    RequiredRule,
+    UUIDRule,
+)
+
+
+class TestValidationSchema:
+    @pytest.fixture
+    def schema(self) -> ValidationSchema:
+        return ValidationSchema(
+            FieldSchema("name").required().min_length(3),
+            FieldSchema("email").required().email(),
+        )
+
+    def test_validate_all_fields_valid(self, schema: ValidationSchema):
+        result = schema.validate("John", "john@example.com")
+
+        assert result.success is True
+        assert result.value is None
+
+    def test_errors_keep_field_and_rule_order(self, schema: ValidationSchema):
+        result = schema.validate("Jo", None)
+
+        assert result.failure is True
+        assert result.errors == [MinLengthError("name", 3, "Jo"), RequiredError("email")]
+
+    @pytest.mark.parametrize(
+        "name, email",
+        [("", ""), ("Jo", "invalid"), (None, "john@example.com"), ("John", "   ")],
+    )
+    def test_matches_validator(self, schema: ValidationSchema, name, email):
+        validator = Validator()
+        validator.field(name, "name").required().min_length(3)
+        validator.field(email, "email").required().email()
+
+        expected = validator.validate()
+        result = schema.validate(name, email)
+
+        assert result.success is expected.success
+        assert result.errors == expected.errors
+
+    def test_does_not_share_errors_between_calls(self, schema: ValidationSchema):
+        first = schema.validate(None, "invalid")
+        second = schema.validate("John", "invalid")
+
+        assert first.errors == [RequiredError("name"), EmailError("email", "invalid")]
+        assert second.errors == [EmailError("email", "invalid")]
+
+    def test_validate_builds_no_rules(self, schema: ValidationSchema):
+        with patch.object(RequiredRule, "__init__", side_effect=AssertionError):
+            assert schema.validate("John", "john@example.com").success is True
+
+    def test_validate_requires_one_value_per_field(self, schema: ValidationSchema):
+        with pytest.raises(TypeError):
+            schema.validate("John")
+
+    def test_field_names(self, schema: ValidationSchema):
+        assert schema.field_names == ("name", "email")
+
+    def test_bail_per_field_skips_the_rest_of_a_failed_field(self, schema: ValidationSchema):
+        email = Mock(wraps=EmailRule())
+        bailing = ValidationSchema(
+            FieldSchema("email").required().min_length(3).add_rule(email),
+            FieldSchema("name").min_length(3),
+            bail_per_field=True,
+        )
+
+        result = bailing.validate("a@", "Jo")
+
+        assert result.errors == [MinLengthError("email", 3, "a@"), MinLengthError("name", 3, "Jo")]
+        email.validate.assert_not_called()
+
+    def test_fail_fast_returns_first_error(self, schema: ValidationSchema):
+        failing_fast = ValidationSchema(*schema.fields, fail_fast=True)
+
+        assert failing_fast.validate(None, "invalid").errors == [RequiredError("name")]
+        assert failing_fast.validate("John", "john@example.com").success is True
+
+
+class TestValidationSchemaColumns:
+    @pytest.fixture(params=[False, True], ids=["python", "numpy"])
+    def use_numpy(self, request) -> bool:
+        if request.param:
+            pytest.importorskip("numpy")
+        return request.param
+
+    @pytest.fixture
+    def schema(self) -> ValidationSchema:
+        return ValidationSchema(
+            FieldSchema("total").required().currency(),
+            FieldSchema("customer_id").required().uuid(),
+        )
+
+    def test_reports_only_failed_rows(self, schema: ValidationSchema, use_numpy: bool):
+        customer_id = str(uuid.uuid4())
+        totals = [10.0, -1, None, 19.99, 12.345]
+        customer_ids = [customer_id, customer_id, customer_id, "invalid", customer_id]
+
+        result = schema.validate_columns(totals, customer_ids, use_numpy=use_numpy)
+
+        assert result.failure is True
+        assert result.rows == 5
+        assert result.failed_rows == [1, 2, 3, 4]
+        assert result.bitmap == bytes([0b11110])
+        assert [result.is_failed(row) for row in range(5)] == [False, True, True, True, True]
+        assert result.errors == {
+            1: [CurrencyError("total", -1)],
+            2: [RequiredError("total")],
+            3: [UUIDFormatError("customer_id", "invalid")],
+            4: [CurrencyError("total", 12.345)],
+        }
+
+    def test_all_rows_valid(self, schema: ValidationSchema, use_numpy: bool):
+        customer_ids = [str(uuid.uuid4()) for _ in range(9)]
+
+        result = schema.validate_columns([1.5] * 9, customer_ids, use_numpy=use_numpy)
+
+        assert result.success is True
+        assert result.errors == {}
+        assert result.bitmap == bytes(2)
+
+    def test_numpy_columns(self, schema: ValidationSchema):
+        numpy = pytest.importorskip("numpy")
+        customer_ids = [str(uuid.uuid4()) for _ in range(5)]
+        too_large = Money.MAX_AMOUNT // Money.SCALE + 1
+
+        floats = schema.validate_columns(numpy.array([1.0, 0.29, 0.0, 1.005, 1e17]), customer_ids)
+        ints = schema.validate_columns(numpy.array([3, 0, -2, 7, too_large]), customer_ids)
+
+        assert floats.errors == {
+            2: [CurrencyError("total", 0.0)],
+            3: [CurrencyError("total", 1.005)],
+            4: [CurrencyError("total", 1e17)],
+        }
+        assert ints.errors == {
+            1: [CurrencyError("total", 0)],
+            2: [CurrencyError("total", -2)],
+            4: [CurrencyError("total", too_large)],
+        }
+
+    def test_columns_must_have_the_same_length(self, schema: ValidationSchema):
+        with pytest.raises(ValueError):
+            schema.validate_columns([1.0, 2.0], [str(uuid.uuid4())])
+
+    def test_is_failed_out_of_range(self, schema: ValidationSchema):
+        result = schema.validate_columns([], [])
+
+        with pytest.raises(IndexError):
+            result.is_failed(0)
+
+    @pytest.mark.parametrize(
+        "rule, values",
+        [
+            (RequiredRule(), [None, "", "  ", "x", 0, []]),
+            (
+                CurrencyRule(),
+                [None, "", "1", 1, 0, -1, 1.5, 1.234, float("nan"), Decimal("2.50"), Money(0)],
+            ),
+            (
+                UUIDRule(),
+                [None, "", str(uuid.uuid4()), uuid.uuid4().hex, uuid.uuid4(), "invalid", 12],
+            ),
+            (EmailRule(), [None, "", " ", "john@example.com", "invalid", 12]),
+        ],
+    )
+    def test_invalid_rows_agree_with_validate(self, rule, values):
+        expected = [rule.validate(value, "field") is not None for value in values]
+
+        assert list(rule.invalid_rows(values)) == expected
@@ -1,3 +1,6 @@
+from unittest.mock import Mock
+
+from src.shared.domain.errors import MinLengthError
 from src.shared.domain.validation import FieldValidator, Validator
 
 
@@ -60,3 +63,23 @@ class TestValidator:
 
         assert result3.success is False
         assert len(result3.errors) == 2
+
+    def test_bail_per_field_keeps_one_error_per_field(self):
+        validator = Validator(bail_per_field=True)
+
+        validator.field("a@", "email").required().min_length(3).email()
+        validator.field("Jo", "name").min_length(3)
+        result = validator.validate()
+
+        assert result.errors == [MinLengthError("email", 3, "a@"), MinLengthError("name", 3, "Jo")]
+
+    def test_fail_fast_stops_at_first_error(self):
+        validator = Validator(fail_fast=True)
+
+        validator.field("a@", "email").required().min_length(3).email()
+        name = validator.field("Jo", "name").min_length(3)
+        name.validate = Mock(wraps=name.validate)
+        result = validator.validate()
+
+        assert result.errors == [MinLengthError("email", 3, "a@")]
+        name.validate.assert_not_called()
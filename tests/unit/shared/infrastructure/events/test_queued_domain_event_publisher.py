@@ -0,0 +1,211 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from src.shared.domain.events import DomainEvent, DomainEventHandler
+from src.shared.infrastructure.events import EventQueueFullError, QueuedDomainEventPublisher
+
+
+class UserCreatedEvent(DomainEvent):
+    def __init__(self, user: int):
+        self.user = user
+
+    def __repr__(self) -> str:
+        return f"UserCreatedEvent(user={self.user})"
+
+
+class RecordingHandler(DomainEventHandler):
+    def __init__(self):
+        self.users: List[int] = []
+        self.threads = set()
+
+    def handle(self, event: DomainEvent) -> None:
+        self.users.append(event.user)
+        self.threads.add(threading.get_ident())
+
+
+class BlockingHandler(DomainEventHandler):
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.users: List[int] = []
+
+    def handle(self, event: DomainEvent) -> None:
+        self.started.set()
+        self.release.wait(5)
+        self.users.append(event.user)
+
+
+class FailingHandler(DomainEventHandler):
+    def handle(self, event: DomainEvent) -> None:
+        raise RuntimeError("boom")
+
+
+class TestQueuedDomainEventPublisher:
+    @pytest.fixture
+    def blocked(self):
+        handler = BlockingHandler()
+        publishers = []
+
+        def create(**kwargs) -> QueuedDomainEventPublisher:
+            publisher = QueuedDomainEventPublisher(workers=1, **kwargs)
+            publisher.subscribe("UserCreatedEvent", handler)
+            publisher.publish([UserCreatedEvent(0)])
+            assert handler.started.wait(5)
+            publishers.append(publisher)
+            return publisher
+
+        yield create, handler
+        handler.release.set()
+        for publisher in publishers:
+            publisher.close(5)
+
+    def test_publish_runs_handlers_on_worker_threads(self):
+        publisher = QueuedDomainEventPublisher(workers=2)
+        handler = RecordingHandler()
+        publisher.subscribe("UserCreatedEvent", handler)
+
+        publisher.publish([UserCreatedEvent(user) for user in range(100)])
+
+        assert publisher.drain(5)
+        assert sorted(handler.users) == list(range(100))
+        assert threading.get_ident() not in handler.threads
+        stats = publisher.stats
+        assert stats.published == 100
+        assert stats.processed == 100
+        assert stats.handler_calls == 100
+        assert stats.queue_depth == 0
+        publisher.close(5)
+
+    def test_publish_does_not_wait_for_handlers(self, blocked):
+        create, handler = blocked
+        publisher = create()
+
+        publisher.publish([UserCreatedEvent(1), UserCreatedEvent(2)])
+
+        assert publisher.stats.queue_depth == 2
+        assert handler.users == []
+
+    def test_failing_handler_is_counted_and_does_not_stop_other_handlers(self):
+        publisher = QueuedDomainEventPublisher(workers=1)
+        handler = RecordingHandler()
+        publisher.subscribe("UserCreatedEvent", FailingHandler())
+        publisher.subscribe("UserCreatedEvent", handler)
+
+        publisher.publish([UserCreatedEvent(1)])
+
+        assert publisher.drain(5)
+        assert handler.users == [1]
+        assert publisher.stats.failed == 1
+        assert publisher.stats.handler_calls == 2
+        publisher.close(5)
+
+    def test_drop_oldest_discards_oldest_queued_event(self, blocked):
+        create, handler = blocked
+        publisher = create(max_queue_size=2, policy=QueuedDomainEventPublisher.DROP_OLDEST)
+
+        publisher.publish([UserCreatedEvent(user) for user in (1, 2, 3)])
+        handler.release.set()
+
+        assert publisher.drain(5)
+        assert handler.users == [0, 2, 3]
+        assert publisher.stats.dropped == 1
+        assert publisher.stats.max_queue_depth == 2
+
+    def test_reject_raises_when_queue_is_full(self, blocked):
+        create, handler = blocked
+        publisher = create(max_queue_size=1, policy=QueuedDomainEventPublisher.REJECT)
+        publisher.publish([UserCreatedEvent(1)])
+
+        with pytest.raises(EventQueueFullError):
+            publisher.publish([UserCreatedEvent(2)])
+
+        handler.release.set()
+        assert publisher.drain(5)
+        assert handler.users == [0, 1]
+        assert publisher.stats.rejected == 1
+
+    def test_block_raises_after_timeout_when_queue_stays_full(self, blocked):
+        create, _ = blocked
+        publisher = create(max_queue_size=1, block_timeout=0.05)
+        publisher.publish([UserCreatedEvent(1)])
+
+        with pytest.raises(EventQueueFullError):
+            publisher.publish([UserCreatedEvent(2)])
+
+    def test_block_waits_for_room_in_queue(self, blocked):
+        create, handler = blocked
+        publisher = create(max_queue_size=1)
+        publisher.publish([UserCreatedEvent(1)])
+        published = threading.Event()
+
+        def publish():
+            publisher.publish([UserCreatedEvent(2)])
+            published.set()
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        assert not published.wait(0.05)
+
+        handler.release.set()
+        thread.join(5)
+        assert published.is_set()
+        assert publisher.drain(5)
+        assert handler.users == [0, 1, 2]
+
+    def test_close_drains_queued_events_and_refuses_new_ones(self, blocked):
+        create, handler = blocked
+        publisher = create()
+        publisher.publish([UserCreatedEvent(1), UserCreatedEvent(2)])
+        handler.release.set()
+
+        assert publisher.close(5)
+        assert handler.users == [0, 1, 2]
+        with pytest.raises(RuntimeError):
+            publisher.publish([UserCreatedEvent(3)])
+
+    def test_drain_times_out_while_handlers_are_busy(self, blocked):
+        create, _ = blocked
+        publisher = create()
+
+        assert publisher.drain(0.05) is False
+
+    def test_deliver_waits_and_reports_each_event(self):
+        publisher = QueuedDomainEventPublisher(workers=2)
+        handler = RecordingHandler()
+        publisher.subscribe("UserCreatedEvent", handler)
+
+        class FailOnOdd(DomainEventHandler):
+            def handle(self, event: DomainEvent) -> None:
+                if event.user % 2:
+                    raise RuntimeError("odd")
+
+        publisher.subscribe("UserCreatedEvent", FailOnOdd())
+
+        delivered = publisher.deliver([UserCreatedEvent(user) for user in range(4)])
+
+        assert delivered == [True, False, True, False]
+        assert sorted(handler.users) == [0, 1, 2, 3]
+        publisher.close(5)
+
+    def test_deliver_reports_dropped_events(self, blocked):
+        create, handler = blocked
+        publisher = create(max_queue_size=1, policy=QueuedDomainEventPublisher.DROP_OLDEST)
+        outcome = []
+        thread = threading.Thread(
+            target=lambda: outcome.extend(publisher.deliver([UserCreatedEvent(1)]))
+        )
+        thread.start()
+        while publisher.stats.queue_depth == 0:
+            time.sleep(0.001)
+
+        publisher.publish([UserCreatedEvent(2)])
+        thread.join(5)
+
+        assert outcome == [False]
+
+    def test_unknown_policy_raises(self):
+        with pytest.raises(ValueError):
+            QueuedDomainEventPublisher(policy="spill")
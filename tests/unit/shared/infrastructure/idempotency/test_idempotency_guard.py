@@ -0,0 +1,176 @@
+import logging
+import threading
+
+import pytest
+
+from src.shared.infrastructure.idempotency import (
+    IdempotencyGuard,
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+    IdempotentResponse,
+    InMemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
+
+
+class FailingIdempotencyStore(InMemoryIdempotencyStore):
+    def put(self, key: str, response: IdempotentResponse) -> None:
+        raise OSError("store unavailable")
+
+
+class TestIdempotencyGuard:
+    @pytest.fixture
+    def guard(self) -> IdempotencyGuard:
+        return IdempotencyGuard(InMemoryIdempotencyStore(), wait_timeout=5.0)
+
+    def test_replays_stored_response(self, guard: IdempotencyGuard):
+        calls = []
+
+        def handler():
+            calls.append(1)
+            return 201, b'{"id":1}'
+
+        first, first_replayed = guard.execute("key", "fingerprint", handler)
+        second, second_replayed = guard.execute("key", "fingerprint", handler)
+
+        assert len(calls) == 1
+        assert first == second
+        assert second.body == b'{"id":1}'
+        assert (first_replayed, second_replayed) == (False, True)
+
+    def test_rejects_key_reused_for_different_request(self, guard: IdempotencyGuard):
+        guard.execute("key", "fingerprint", lambda: (201, b"{}"))
+
+        with pytest.raises(IdempotencyKeyMismatchError):
+            guard.execute("key", "other", lambda: (201, b"{}"))
+
+    def test_does_not_remember_server_errors(self, guard: IdempotencyGuard):
+        guard.execute("key", "fingerprint", lambda: (500, b"{}"))
+
+        response, replayed = guard.execute("key", "fingerprint", lambda: (201, b"{}"))
+
+        assert response.status_code == 201
+        assert replayed is False
+
+    def test_handler_exception_is_not_remembered(self, guard: IdempotencyGuard):
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            guard.execute("key", "fingerprint", failing)
+
+        assert guard.execute("key", "fingerprint", lambda: (201, b"{}"))[1] is False
+
+    def test_store_failure_still_returns_the_response(self, caplog):
+        guard = IdempotencyGuard(FailingIdempotencyStore(), wait_timeout=5.0)
+
+        with caplog.at_level(logging.ERROR):
+            response, replayed = guard.execute("key", "fingerprint", lambda: (201, b'{"id":1}'))
+
+        assert (response.status_code, response.body, replayed) == (201, b'{"id":1}', False)
+        assert "Error storing idempotent response for key key" in caplog.text
+        assert guard._in_flight == {}
+
+    def test_concurrent_duplicates_wait_for_in_flight_request(self, guard: IdempotencyGuard):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def slow_handler():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 201, b"{}"
+
+        def duplicate():
+            results.append(guard.execute("key", "fingerprint", slow_handler))
+
+        first = threading.Thread(target=duplicate)
+        first.start()
+        started.wait(5)
+        others = [threading.Thread(target=duplicate) for _ in range(3)]
+        for thread in others:
+            thread.start()
+        release.set()
+        for thread in [first, *others]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(replayed for _, replayed in results) == [False, True, True, True]
+
+    def test_duplicate_gives_up_waiting_after_timeout(self):
+        guard = IdempotencyGuard(InMemoryIdempotencyStore(), wait_timeout=0.01)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_handler():
+            started.set()
+            release.wait(5)
+            return 201, b"{}"
+
+        first = threading.Thread(target=guard.execute, args=("key", "fingerprint", slow_handler))
+        first.start()
+        started.wait(5)
+        try:
+            with pytest.raises(IdempotencyKeyInProgressError):
+                guard.execute("key", "fingerprint", slow_handler)
+        finally:
+            release.set()
+            first.join()
+
+    def test_guards_sharing_a_store_handle_a_key_once(self, tmp_path):
+        path = str(tmp_path / "keys.sqlite3")
+        stores = [SqliteIdempotencyStore(path), SqliteIdempotencyStore(path)]
+        guards = [IdempotencyGuard(store, wait_timeout=5.0, poll_interval=0.01) for store in stores]
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def slow_handler():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 201, b"{}"
+
+        first = threading.Thread(
+            target=lambda: results.append(guards[0].execute("key", "fingerprint", slow_handler))
+        )
+        first.start()
+        started.wait(5)
+        second = threading.Thread(
+            target=lambda: results.append(guards[1].execute("key", "fingerprint", slow_handler))
+        )
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+        for store in stores:
+            store.close()
+
+        assert len(calls) == 1
+        assert sorted(replayed for _, replayed in results) == [False, True]
+
+    def test_store_lookups_do_not_block_other_keys(self):
+        release = threading.Event()
+        looking_up = threading.Event()
+
+        class SlowStore(InMemoryIdempotencyStore):
+            def get(self, key):
+                if key == "slow":
+                    looking_up.set()
+                    release.wait(5)
+                return super().get(key)
+
+        guard = IdempotencyGuard(SlowStore(), wait_timeout=5.0)
+        slow = threading.Thread(target=guard.execute, args=("slow", "f", lambda: (201, b"{}")))
+        slow.start()
+        looking_up.wait(5)
+        try:
+            response, _ = guard.execute("fast", "f", lambda: (201, b"{}"))
+            assert not release.is_set()
+            assert response.status_code == 201
+        finally:
+            release.set()
+            slow.join()
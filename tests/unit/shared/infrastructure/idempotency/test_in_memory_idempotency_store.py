@@ -0,0 +1,102 @@
+import pytest
+
+from src.shared.infrastructure.idempotency import (
+    IdempotentResponse,
+    InMemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryIdempotencyStore:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def store(self, clock) -> InMemoryIdempotencyStore:
+        return InMemoryIdempotencyStore(max_size=2, ttl=10.0, clock=clock)
+
+    def _response(self, body: bytes = b"{}") -> IdempotentResponse:
+        return IdempotentResponse("fingerprint", 201, body)
+
+    def test_put_and_get(self, store: InMemoryIdempotencyStore):
+        response = self._response()
+
+        store.put("key", response)
+
+        assert store.get("key") == response
+        assert store.get("other") is None
+
+    def test_entries_expire_after_ttl(self, store: InMemoryIdempotencyStore, clock):
+        store.put("key", self._response())
+
+        clock.now += 11.0
+
+        assert store.get("key") is None
+        assert len(store) == 0
+
+    def test_evicts_least_recently_used(self, store: InMemoryIdempotencyStore):
+        store.put("first", self._response(b"1"))
+        store.put("second", self._response(b"2"))
+        store.get("first")
+
+        store.put("third", self._response(b"3"))
+
+        assert store.get("second") is None
+        assert store.get("first").body == b"1"
+        assert store.get("third").body == b"3"
+
+    def test_reads_through_and_writes_through_backend(self, clock):
+        backend = SqliteIdempotencyStore(ttl=10.0, clock=clock)
+        store = InMemoryIdempotencyStore(max_size=2, ttl=10.0, clock=clock, backend=backend)
+        response = self._response()
+
+        store.put("key", response)
+        restarted = InMemoryIdempotencyStore(max_size=2, ttl=10.0, clock=clock, backend=backend)
+
+        assert backend.get("key") == response
+        assert restarted.get("key") == response
+        assert len(restarted) == 1
+        store.close()
+
+    def test_clear(self, store: InMemoryIdempotencyStore):
+        store.put("key", self._response())
+
+        store.clear()
+
+        assert store.get("key") is None
+
+    def test_claim_is_held_until_answered_released_or_expired(
+        self, store: InMemoryIdempotencyStore, clock
+    ):
+        assert store.claim("key", "fingerprint") is True
+        assert store.claim("key", "fingerprint") is False
+        assert store.get("key") is None
+
+        store.release("key")
+        assert store.claim("key", "fingerprint") is True
+        clock.now += 61.0
+        assert store.claim("key", "fingerprint") is True
+
+        store.put("key", self._response())
+        assert store.claim("key", "fingerprint") is False
+
+    def test_claims_go_to_backend(self, tmp_path, clock):
+        path = str(tmp_path / "keys.sqlite3")
+        first = InMemoryIdempotencyStore(clock=clock, backend=SqliteIdempotencyStore(path))
+        second = InMemoryIdempotencyStore(clock=clock, backend=SqliteIdempotencyStore(path))
+
+        assert first.claim("key", "fingerprint") is True
+        assert second.claim("key", "fingerprint") is False
+        first.release("key")
+        assert second.claim("key", "fingerprint") is True
+        first.close()
+        second.close()
@@ -0,0 +1,79 @@
+import pytest
+
+from src.shared.infrastructure.idempotency import IdempotentResponse, SqliteIdempotencyStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSqliteIdempotencyStore:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def store(self, tmp_path, clock) -> SqliteIdempotencyStore:
+        store = SqliteIdempotencyStore(str(tmp_path / "keys.sqlite3"), ttl=10.0, clock=clock)
+        yield store
+        store.close()
+
+    def test_put_and_get(self, store: SqliteIdempotencyStore):
+        response = IdempotentResponse("fingerprint", 201, b'{"success":true}')
+
+        store.put("key", response)
+
+        assert store.get("key") == response
+        assert store.get("other") is None
+
+    def test_responses_survive_reopening(self, tmp_path, clock):
+        path = str(tmp_path / "durable.sqlite3")
+        store = SqliteIdempotencyStore(path, clock=clock)
+        store.put("key", IdempotentResponse("fingerprint", 201, b"{}"))
+        store.close()
+
+        reopened = SqliteIdempotencyStore(path, clock=clock)
+        try:
+            assert reopened.get("key").status_code == 201
+        finally:
+            reopened.close()
+
+    def test_expired_entries_are_hidden_and_pruned(self, store: SqliteIdempotencyStore, clock):
+        store.put("key", IdempotentResponse("fingerprint", 201, b"{}"))
+
+        clock.now += 11.0
+
+        assert store.get("key") is None
+        assert store.prune() == 1
+        assert len(store) == 0
+
+    def test_clear(self, store: SqliteIdempotencyStore):
+        store.put("key", IdempotentResponse("fingerprint", 201, b"{}"))
+
+        store.clear()
+
+        assert len(store) == 0
+
+    def test_claim_is_exclusive_until_answered_or_released(self, store: SqliteIdempotencyStore):
+        assert store.claim("key", "fingerprint") is True
+        assert store.claim("key", "fingerprint") is False
+        assert store.get("key") is None
+
+        store.release("key")
+        assert store.claim("key", "other") is True
+        store.put("key", IdempotentResponse("other", 201, b"{}"))
+        store.release("key")
+
+        assert store.claim("key", "other") is False
+        assert store.get("key").status_code == 201
+
+    def test_expired_claim_can_be_taken_over(self, store: SqliteIdempotencyStore, clock):
+        store.claim("key", "fingerprint")
+
+        clock.now += 61.0
+
+        assert store.claim("key", "fingerprint") is True
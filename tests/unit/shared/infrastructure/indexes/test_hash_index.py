@@ -0,0 +1,65 @@
+from src.shared.infrastructure.indexes import HashIndex
+
+
+class TestHashIndex:
+    def test_put_and_get(self):
+        index = HashIndex()
+
+        index.put(1, "a")
+        index.put(2, "a")
+        index.put(3, "b")
+
+        assert index.get("a") == {1, 2}
+        assert index.get("b") == {3}
+        assert index.get("missing") == set()
+
+    def test_put_moves_item_to_new_key(self):
+        index = HashIndex()
+        index.put(1, "a")
+
+        index.put(1, "b")
+
+        assert index.get("a") == set()
+        assert "a" not in index
+        assert index.get("b") == {1}
+
+    def test_put_none_key_removes_item(self):
+        index = HashIndex()
+        index.put(1, "a")
+
+        index.put(1, None)
+
+        assert "a" not in index
+
+    def test_put_many_into_empty_index(self):
+        index = HashIndex()
+
+        index.put_many([(1, "a"), (2, "a"), (3, None), (4, "b"), (4, "c")])
+
+        assert index.get("a") == {1, 2}
+        assert "b" not in index
+        assert index.get("c") == {4}
+
+    def test_put_many_moves_existing_items(self):
+        index = HashIndex()
+        index.put(1, "a")
+
+        index.put_many([(1, "b"), (2, "a")])
+
+        assert index.get("a") == {2}
+        assert index.get("b") == {1}
+
+    def test_remove_and_clear(self):
+        index = HashIndex()
+        index.put(1, "a")
+        index.put(2, "b")
+
+        index.remove(1)
+        index.remove(99)
+
+        assert "a" not in index
+        assert index.get("b") == {2}
+
+        index.clear()
+
+        assert "b" not in index
@@ -0,0 +1,105 @@
+from src.shared.infrastructure.indexes import SortedIndex
+
+
+class TestSortedIndex:
+    def test_put_keeps_entries_sorted_by_value_then_id(self):
+        index = SortedIndex()
+
+        index.put("b", 2)
+        index.put("c", 1)
+        index.put("a", 2)
+
+        assert list(index.iter_after()) == [(1, "c"), (2, "a"), (2, "b")]
+        assert len(index) == 3
+
+    def test_put_moves_entry_when_value_changes(self):
+        index = SortedIndex()
+        index.put("a", 1)
+        index.put("b", 2)
+
+        index.put("a", 3)
+
+        assert list(index.iter_after()) == [(2, "b"), (3, "a")]
+        assert index.entry_of("a") == (3, "a")
+
+    def test_remove(self):
+        index = SortedIndex()
+        index.put("a", 1)
+        index.put("b", 2)
+
+        index.remove("a")
+        index.remove("missing")
+
+        assert list(index.iter_after()) == [(2, "b")]
+        assert "a" not in index
+        assert index.entry_of("a") is None
+
+    def test_iter_after_starts_after_the_given_entry(self):
+        index = SortedIndex()
+        for value in range(5):
+            index.put(str(value), value)
+
+        assert list(index.iter_after((2, "2"))) == [(3, "3"), (4, "4")]
+
+    def test_iter_after_crosses_chunks_and_tolerates_inserts(self):
+        index = SortedIndex()
+        index.CHUNK_SIZE = 2
+        for value in range(5):
+            index.put(value, value)
+
+        seen = []
+        for value, item_id in index.iter_after():
+            seen.append(item_id)
+            if item_id == 1:
+                index.put(-1, -1)
+                index.put(10, 10)
+
+        assert seen == [0, 1, 2, 3, 4, 10]
+
+    def test_clear(self):
+        index = SortedIndex()
+        index.put("a", 1)
+
+        index.clear()
+
+        assert len(index) == 0
+        assert list(index.iter_after()) == []
+
+    def test_put_many_merges_new_and_changed_entries(self):
+        index = SortedIndex()
+        index.put("a", 5)
+        index.put("b", 1)
+
+        index.put_many([("c", 3), ("a", 0), ("b", 1), ("c", 4)])
+
+        assert list(index.iter_after()) == [(0, "a"), (1, "b"), (4, "c")]
+        assert index.entry_of("c") == (4, "c")
+
+    def test_put_many_into_empty_index(self):
+        index = SortedIndex()
+
+        index.put_many([("c", 3), ("a", 2), ("b", None), ("a", 1), ("d", 1)])
+
+        assert list(index.iter_after()) == [(1, "a"), (1, "d"), (3, "c")]
+        assert "b" not in index
+        index.remove("a")
+        assert index.entry_of("a") is None
+        assert list(index.iter_after()) == [(1, "d"), (3, "c")]
+
+    def test_between_returns_half_open_range(self):
+        index = SortedIndex()
+        index.put_many([("a", 1), ("b", 2), ("c", 2), ("d", 3), ("e", 4)])
+
+        assert index.between(2, 4) == [(2, "b"), (2, "c"), (3, "d")]
+        assert index.between(5, 9) == []
+
+    def test_put_none_removes_entry(self):
+        index = SortedIndex()
+        index.put("a", 1)
+        index.put_many([("b", 2), ("c", None)])
+
+        index.put("a", None)
+
+        assert list(index.iter_after()) == [(2, "b")]
+        assert "a" not in index
+        assert "c" not in index
@@ -1,23 +1,36 @@
 from rest_framework import serializers
 
 from src.order.application.dtos import CreateOrderInput, CreateOrderOutput
+from src.shared.domain.core import Money
+
+# Money.MAX_AMOUNT cents, 92233720368547758.07, has 19 digits.
+TOTAL_MAX_DIGITS = 19
 
 
 class CreateOrderRequestSerializer(serializers.Serializer):
     customer_id = serializers.CharField()
-    total = serializers.FloatField()
+    total = serializers.DecimalField(
+        max_digits=TOTAL_MAX_DIGITS, decimal_places=Money.DECIMAL_PLACES
+    )
+    # Checked by Order.create, which reports an unknown code as a CURRENCY_ERROR.
+    currency = serializers.CharField(default=Money.DEFAULT_CURRENCY)
 
     def to_dto(self) -> CreateOrderInput:
         return CreateOrderInput(
             customer_id=self.validated_data["customer_id"],
             total=self.validated_data["total"],
+            currency=self.validated_data["currency"],
         )
 
 
 class OrderResponseSerializer(serializers.Serializer):
     id = serializers.CharField()
     customer_id = serializers.CharField()
-    total = serializers.FloatField()
+    # Rendered as a decimal string, so no total loses cents on its way out.
+    total = serializers.DecimalField(
+        max_digits=TOTAL_MAX_DIGITS, decimal_places=Money.DECIMAL_PLACES
+    )
+    currency = serializers.CharField()
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
 
@@ -27,7 +40,8 @@ class OrderResponseSerializer(serializers.Serializer):
         self.instance = {
             "id": str(order.id),
             "customer_id": str(order.customer_id),
-            "total": order.total,
+            "total": order.total.to_decimal(),
+            "currency": order.total.currency,
             "created_at": order.created_at,
             "updated_at": order.updated_at,
         }
@@ -1,24 +1,88 @@
+import hashlib
+import json
+
+from django.http import HttpResponse
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.views import APIView
 
-from src.order.application.dtos import CreateOrderInput
 from src.order.application.usecases import CreateOrderUseCase
+from src.shared.infrastructure.idempotency import (
+    IdempotencyGuard,
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+)
+from web.apps.orders.serializers import CreateOrderRequestSerializer, OrderResponseSerializer
 from web.core.container import container
 from web.core.response_utils import ResponseHelper
 
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
 
 class OrderAPIView(APIView):
     def post(self, request):
+        key = request.headers.get("Idempotency-Key")
+        if not key:
+            return self._create_order(request)
+
+        if len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            return ResponseHelper.error(
+                message="Invalid Idempotency-Key header",
+                errors=[
+                    f"Idempotency-Key must have at most {MAX_IDEMPOTENCY_KEY_LENGTH} characters"
+                ],
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fingerprint = hashlib.sha256(
+            json.dumps(request.data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        guard = container.resolve(IdempotencyGuard)
+
+        try:
+            stored, replayed = guard.execute(
+                key, fingerprint, lambda: self._render(self._create_order(request))
+            )
+        except IdempotencyKeyMismatchError as e:
+            return ResponseHelper.error(
+                message="Idempotency-Key was already used for a different request",
+                errors=[str(e)],
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        except IdempotencyKeyInProgressError as e:
+            return ResponseHelper.error(
+                message="A request with this Idempotency-Key is still being processed",
+                errors=[str(e)],
+                status_code=status.HTTP_409_CONFLICT,
+            )
+
+        response = HttpResponse(
+            stored.body, status=stored.status_code, content_type="application/json"
+        )
+        if replayed:
+            response["Idempotent-Replayed"] = "true"
+        return response
+
+    def _create_order(self, request):
         if not request.data:
             return ResponseHelper.error(
                 message="Request body is required",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        input_dto = CreateOrderInput.from_dict(request.data)
+        serializer = CreateOrderRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return ResponseHelper.error(
+                message="Invalid order",
+                errors=[
+                    f"{field}: {message}"
+                    for field, messages in serializer.errors.items()
+                    for message in messages
+                ],
+            )
 
         use_case = container.resolve(CreateOrderUseCase)
-        result = use_case.execute(input_dto)
+        result = use_case.execute(serializer.to_dto())
 
         if result.failure:
             return ResponseHelper.error(
@@ -26,10 +90,14 @@ class OrderAPIView(APIView):
                 errors=[str(error) for error in result.errors],
             )
 
-        order_data = result.value.order.to_dict()
+        order_data = OrderResponseSerializer(result.value).data
 
         return ResponseHelper.success(
             data={"order": order_data},
             message="Order created successfully",
             status_code=status.HTTP_201_CREATED,
         )
+
+    @staticmethod
+    def _render(response):
+        return response.status_code, JSONRenderer().render(response.data)
@@ -28,7 +28,7 @@ REST_FRAMEWORK = {
         "rest_framework.renderers.JSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "web.core.parsers.DecimalJSONParser",
     ],
     "EXCEPTION_HANDLER": "web.core.exception_handler.custom_exception_handler",
 } 
\ No newline at end of file
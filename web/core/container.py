@@ -1,7 +1,8 @@
 from typing import Any, Dict, Type, TypeVar
 
 from src.order.application.usecases import CreateOrderUseCase
-from src.order.main import UseCaseFactory
+from src.order.main import IdempotencyFactory, UseCaseFactory
+from src.shared.infrastructure.idempotency import IdempotencyGuard
 
 T = TypeVar("T")
 
@@ -13,6 +14,7 @@ class DIContainer:
 
     def _setup_dependencies(self):
         self.register(CreateOrderUseCase, UseCaseFactory.create_order_use_case())
+        self.register(IdempotencyGuard, IdempotencyFactory.idempotency_guard())
 
     def register(self, interface: Type[T], implementation: T) -> None:
         self._services[interface] = implementation